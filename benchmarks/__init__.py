@@ -0,0 +1,3 @@
+"""
+standalone performance benchmarks for the translation library python package
+"""
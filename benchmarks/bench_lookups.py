@@ -0,0 +1,310 @@
+"""
+Measure the throughput, latency percentiles and peak memory of the main entry
+points (`serialize_toml_dict`, `get_value_from_key`, `get_i18n_obj`,
+`into_toml_str` and the `translate` CLI command end-to-end) on synthetic
+language files, and compare the results against a stored baseline to catch
+regressions.
+
+Each operation runs until it has `--max-runs` samples or has used its
+`--budget-s` time budget, whichever comes first, and always at least
+`--min-runs` times. Peak memory is the peak traced by `tracemalloc` during a
+separate call, or the peak RSS of the child processes for the CLI.
+
+Usage:
+    python -m benchmarks.bench_lookups [--keys 1000 10000 100000] [--save-baseline FILE]
+    python -m benchmarks.bench_lookups --compare FILE [--tolerance 0.25]
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import resource
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable
+
+from benchmarks.synthetic_catalogs import synthetic_key_paths, write_synthetic_project
+from translation_library.utils.catalog_utils import clear_catalogs
+from translation_library.utils.config_utils import (
+    PROJECT_ROOT_ENV_VAR,
+    get_language_file_path,
+    set_project_root,
+)
+from translation_library.utils.language_utils import into_toml_str
+from translation_library.utils.toml_utils import (
+    get_value_from_key,
+    serialize_toml_dict,
+)
+from translation_library.utils.translation_utils import get_i18n_obj
+
+OPERATIONS = (
+    "serialize_toml_dict",
+    "serialize_toml_dict(read_only)",
+    "get_value_from_key",
+    "get_i18n_obj",
+    "into_toml_str",
+    "cli translate",
+)
+
+# The metrics compared against a baseline, and whether a higher value is worse
+COMPARED_METRICS = {
+    "ops_per_s": False,
+    "p50_ms": True,
+    "p95_ms": True,
+    "peak_kib": True,
+}
+
+
+def summarize(timings_ms: list[float], total_s: float) -> dict[str, float]:
+    """
+    Args:
+        timings_ms (list[float]): the latency of every call in ms
+        total_s (float): the wall time of all calls together in s
+
+    Returns:
+        dict[str, float]: the throughput in ops/s and the p50, p95 and p99
+        latencies in ms
+    """
+    if len(timings_ms) > 1:
+        percentiles = statistics.quantiles(timings_ms, n=100, method="inclusive")
+    else:
+        percentiles = timings_ms * 99
+    return {
+        "runs": len(timings_ms),
+        "ops_per_s": len(timings_ms) / total_s,
+        "p50_ms": percentiles[49],
+        "p95_ms": percentiles[94],
+        "p99_ms": percentiles[98],
+    }
+
+
+def measure(
+    call: Callable[[int], object], min_runs: int, max_runs: int, budget_s: float
+) -> dict[str, float]:
+    """
+    Time `call(run_idx)` repeatedly, then trace the peak memory of one more call.
+
+    Args:
+        call (Callable[[int], object]): the operation, given the index of the run
+        min_runs (int): the least number of timed calls
+        max_runs (int): the most number of timed calls
+        budget_s (float): stop after this many seconds once `min_runs` are done
+
+    Returns:
+        dict[str, float]: the summary of `summarize()` and the peak KiB allocated
+    """
+    call(0)  # warm up caches and lazy imports
+    timings_ms: list[float] = []
+    start = time.perf_counter()
+    while len(timings_ms) < max_runs:
+        call_start = time.perf_counter()
+        call(len(timings_ms))
+        timings_ms.append((time.perf_counter() - call_start) * 1000)
+        if len(timings_ms) >= min_runs and call_start - start > budget_s:
+            break
+    result = summarize(timings_ms, time.perf_counter() - start)
+
+    tracemalloc.start()
+    call(0)
+    _, peak_bytes = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    result["peak_kib"] = peak_bytes / 1024
+    return result
+
+
+def measure_cli(
+    root: Path, code: str, key_paths: list[str], min_runs: int, budget_s: float
+) -> dict[str, float]:
+    """
+    Time `python -m translation_library translate` in fresh interpreters.
+
+    Args:
+        root (Path): the project root the CLI is pointed at
+        code (str): the language code to translate to
+        key_paths (list[str]): the keys to translate, one per run
+        min_runs (int): the least number of runs
+        budget_s (float): stop after this many seconds once `min_runs` are done
+
+    Raises:
+        CalledProcessError: if the `translate` command failed
+
+    Returns:
+        dict[str, float]: the summary of `summarize()` and the peak RSS in KiB
+        of the runs
+    """
+    env = {**os.environ, PROJECT_ROOT_ENV_VAR: str(root)}
+
+    def run(run_idx: int) -> None:
+        command = [sys.executable, "-m", "translation_library", "translate"]
+        command += ["-l", code, "-k", key_paths[run_idx % len(key_paths)]]
+        subprocess.run(command, env=env, capture_output=True, check=True)
+
+    run(0)  # warm the OS file cache
+    timings_ms: list[float] = []
+    start = time.perf_counter()
+    while len(timings_ms) < min_runs or time.perf_counter() - start < budget_s:
+        call_start = time.perf_counter()
+        run(len(timings_ms))
+        timings_ms.append((time.perf_counter() - call_start) * 1000)
+    result = summarize(timings_ms, time.perf_counter() - start)
+    # ru_maxrss is in KiB on Linux and is the largest of any child so far
+    result["peak_kib"] = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+    return result
+
+
+def run_benchmarks(args: argparse.Namespace) -> dict[str, dict[str, float]]:
+    """
+    Run every operation on a synthetic project for each key count.
+
+    Args:
+        args (argparse.Namespace): the parsed command-line arguments
+
+    Returns:
+        dict[str, dict[str, float]]: the results keyed by `<operation>@<keys>`
+    """
+    results: dict[str, dict[str, float]] = {}
+    for key_count in args.keys:
+        key_paths = random.Random(0).sample(
+            synthetic_key_paths(key_count), min(args.lookups, key_count)
+        )
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            root = Path(tmp_dir)
+            (code,) = write_synthetic_project(root, 1, key_count)
+            clear_catalogs()
+            set_project_root(root)
+            file_path = get_language_file_path(code)
+
+            def key(run_idx: int) -> str:
+                return key_paths[run_idx % len(key_paths)]
+
+            calls: dict[str, Callable[[int], object]] = {
+                "serialize_toml_dict": lambda _: serialize_toml_dict(file_path),
+                "serialize_toml_dict(read_only)": lambda _: serialize_toml_dict(
+                    file_path, read_only=True
+                ),
+                "get_value_from_key": lambda i: get_value_from_key(file_path, key(i)),
+                "get_i18n_obj": lambda i: get_i18n_obj(code, key(i)),
+                "into_toml_str": lambda _: into_toml_str(code),
+            }
+            for operation in args.operations:
+                if operation == "cli translate":
+                    result = measure_cli(
+                        root, code, key_paths, args.min_runs, args.budget_s
+                    )
+                else:
+                    result = measure(
+                        calls[operation], args.min_runs, args.max_runs, args.budget_s
+                    )
+                results[f"{operation}@{key_count}"] = result
+                print_result(operation, key_count, result)
+
+            set_project_root(None)
+            clear_catalogs()
+    return results
+
+
+def print_result(operation: str, key_count: int, result: dict[str, float]) -> None:
+    print(
+        f"{operation:>30} | {key_count:>7} | {result['runs']:>6} | "
+        f"{result['ops_per_s']:>11.1f} | {result['p50_ms']:>9.3f} | "
+        f"{result['p95_ms']:>9.3f} | {result['p99_ms']:>9.3f} | "
+        f"{result['peak_kib'] / 1024:>8.2f}"
+    )
+
+
+def compare_to_baseline(
+    results: dict[str, dict[str, float]],
+    baseline: dict[str, dict[str, float]],
+    tolerance: float,
+) -> list[str]:
+    """
+    Find the metrics that got worse than the baseline by more than `tolerance`.
+
+    Args:
+        results (dict[str, dict[str, float]]): the results of this run
+        baseline (dict[str, dict[str, float]]): the results of the baseline run
+        tolerance (float): the allowed relative slowdown, e.g. 0.25 for 25%
+
+    Returns:
+        list[str]: a description of every regression
+    """
+    regressions: list[str] = []
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+        for metric, higher_is_worse in COMPARED_METRICS.items():
+            old, new = baseline[name][metric], result[metric]
+            change = (new - old) / old if old else 0.0
+            if (change if higher_is_worse else -change) > tolerance:
+                regressions.append(
+                    f"{name} {metric}: {old:.3f} -> {new:.3f} ({change:+.0%})"
+                )
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=(__doc__ or "").strip().partition("\n")[0]
+    )
+    parser.add_argument("--keys", type=int, nargs="+", default=[1_000, 10_000])
+    parser.add_argument(
+        "--operations", nargs="+", choices=OPERATIONS, default=list(OPERATIONS)
+    )
+    parser.add_argument(
+        "--lookups", type=int, default=1000, help="distinct keys looked up"
+    )
+    parser.add_argument("--min-runs", type=int, default=5)
+    parser.add_argument("--max-runs", type=int, default=10_000)
+    parser.add_argument(
+        "--budget-s", type=float, default=1.0, help="time budget per operation"
+    )
+    parser.add_argument("--save-baseline", type=Path, metavar="FILE")
+    parser.add_argument("--compare", type=Path, metavar="FILE")
+    parser.add_argument(
+        "--tolerance", type=float, default=0.25, help="allowed relative regression"
+    )
+    args = parser.parse_args()
+    # fail before spending minutes on the benchmarks
+    if args.compare is not None and not args.compare.is_file():
+        parser.error(
+            f"no baseline at {args.compare}, save one first with "
+            f"--save-baseline {args.compare}"
+        )
+
+    print(
+        f"{'operation':>30} | {'keys':>7} | {'runs':>6} | {'ops/s':>11} | "
+        f"{'p50 ms':>9} | {'p95 ms':>9} | {'p99 ms':>9} | {'peak MiB':>8}"
+    )
+    results = run_benchmarks(args)
+
+    if args.save_baseline is not None:
+        args.save_baseline.parent.mkdir(parents=True, exist_ok=True)
+        args.save_baseline.write_text(
+            json.dumps(
+                {"python": platform.python_version(), "results": results}, indent=2
+            )
+            + "\n",
+            encoding="utf-8",
+        )
+        print(f"saved baseline to {args.save_baseline}")
+
+    if args.compare is not None:
+        baseline = json.loads(args.compare.read_text(encoding="utf-8"))
+        regressions = compare_to_baseline(results, baseline["results"], args.tolerance)
+        if regressions:
+            print(f"FAIL: {len(regressions)} regressions over {args.tolerance:.0%}:")
+            for regression in regressions:
+                print(f"  {regression}")
+            sys.exit(1)
+        print(f"OK: no regressions over {args.tolerance:.0%} against {args.compare}")
+
+
+if __name__ == "__main__":
+    main()
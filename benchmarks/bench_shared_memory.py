@@ -0,0 +1,141 @@
+"""
+Compare the memory each forked worker pays for its language catalogs when it
+parses every language file itself (with `tomlkit` documents, or with the
+`tomllib` catalogs used by lookups) against workers that inherit catalogs
+from a `multiprocessing.shared_memory` segment created by the parent.
+
+RSS counts shared pages in full in every worker, so the unique set size (USS,
+the private pages of a worker) and the proportional set size (PSS) are
+reported too. They are read from /proc/self/smaps_rollup, so this is
+Linux-only.
+
+Usage:
+    python -m benchmarks.bench_shared_memory [--languages 8] [--keys 10000] [--workers 4]
+"""
+
+import argparse
+import multiprocessing
+import random
+import statistics
+import tempfile
+from pathlib import Path
+
+from benchmarks.synthetic_catalogs import (
+    synthetic_key_paths,
+    write_synthetic_project,
+)
+from translation_library.utils.catalog_utils import clear_catalogs, get_catalog
+from translation_library.utils.config_utils import (
+    get_all_language_codes,
+    get_language_file_path,
+    set_project_root,
+)
+from translation_library.utils.shared_catalog_utils import share_catalogs
+from translation_library.utils.toml_utils import serialize_toml_dict
+
+MODES = ("tomlkit", "catalog", "shared")
+
+
+def read_memory_kib() -> dict[str, int]:
+    """
+    Returns:
+        dict[str, int]: the RSS, PSS and USS of this process in KiB
+    """
+    fields: dict[str, int] = {}
+    with open("/proc/self/smaps_rollup", encoding="utf-8") as file:
+        for line in file:
+            parts = line.split()
+            if len(parts) == 3 and parts[2] == "kB":
+                fields[parts[0].rstrip(":")] = int(parts[1])
+    return {
+        "rss": fields["Rss"],
+        "pss": fields["Pss"],
+        "uss": fields["Private_Clean"] + fields["Private_Dirty"],
+    }
+
+
+def _worker(
+    mode: str,
+    key_paths: list[str],
+    results: "multiprocessing.Queue[dict[str, int]]",
+) -> None:
+    before = read_memory_kib()
+    # keep the loaded languages alive until memory is measured
+    loaded: list[object] = []
+    for code in get_all_language_codes():
+        if mode == "tomlkit":
+            loaded.append(serialize_toml_dict(get_language_file_path(code)))
+        else:
+            catalog = get_catalog(code)
+            loaded.extend(catalog.get(key_path) for key_path in key_paths)
+    after = read_memory_kib()
+    results.put({name: after[name] - before[name] for name in after})
+
+
+def run_workers(mode: str, worker_count: int, key_paths: list[str]) -> dict[str, float]:
+    """
+    Fork `worker_count` workers that each load every language in `mode`.
+
+    Args:
+        mode (str): one of `tomlkit`, `catalog` or `shared`
+        worker_count (int): how many workers to fork
+        key_paths (list[str]): the keys each worker looks up in every language
+
+    Returns:
+        dict[str, float]: the median RSS, PSS and USS growth per worker in MiB
+    """
+    context = multiprocessing.get_context("fork")
+    results: "multiprocessing.Queue[dict[str, int]]" = context.Queue()
+    workers = [
+        context.Process(target=_worker, args=(mode, key_paths, results))
+        for _ in range(worker_count)
+    ]
+    for worker in workers:
+        worker.start()
+    # wait until every worker is done loading so the shared pages are shared
+    growths = [results.get() for _ in workers]
+    for worker in workers:
+        worker.join()
+    return {
+        name: statistics.median(growth[name] for growth in growths) / 1024
+        for name in ("rss", "pss", "uss")
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=(__doc__ or "").strip().partition("\n")[0]
+    )
+    parser.add_argument("--languages", type=int, default=8)
+    parser.add_argument("--keys", type=int, default=10_000)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument(
+        "--lookups", type=int, default=100, help="hot keys looked up per language"
+    )
+    args = parser.parse_args()
+
+    key_paths = random.Random(0).sample(
+        synthetic_key_paths(args.keys), min(args.lookups, args.keys)
+    )
+    print(
+        f"{args.languages} languages x {args.keys} keys, {args.workers} workers, "
+        "median growth per worker"
+    )
+    print(f"{'mode':>8} | {'RSS MiB':>8} | {'PSS MiB':>8} | {'USS MiB':>8}")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        write_synthetic_project(Path(tmp_dir), args.languages, args.keys)
+        set_project_root(tmp_dir)
+        for mode in MODES:
+            clear_catalogs()
+            shared_catalogs = share_catalogs() if mode == "shared" else None
+            growth = run_workers(mode, args.workers, key_paths)
+            if shared_catalogs is not None:
+                shared_catalogs.close()
+            print(
+                f"{mode:>8} | {growth['rss']:>8.2f} | "
+                f"{growth['pss']:>8.2f} | {growth['uss']:>8.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""
+Measure the cold-start time of `python -m translation_library translate` and
+check it against a regression budget. Each run is a fresh interpreter started
+with `-X importtime`, so the report also shows which imports dominate.
+
+Usage:
+    python -m benchmarks.bench_startup [-l en] [-k setting] [--runs 10] [--budget-ms 400]
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+
+from translation_library.utils.path_utils import get_project_root
+
+# Cold-start budget for `translate`, measured as the median wall time of a run
+# on the reference dev machine. `translate` never imports glom or tomlkit and
+# only imports pydantic once a validated function is first called, so going
+# over this usually means a heavy dependency is imported eagerly again.
+STARTUP_BUDGET_MS = 400.0
+
+
+def parse_importtime(stderr: str) -> dict[str, int]:
+    """
+    Collect the cumulative import time of every top-level import from the
+    `-X importtime` output of a run.
+
+    Args:
+        stderr (str): the stderr of a run started with `-X importtime`
+
+    Returns:
+        dict[str, int]: each top-level module mapped to its cumulative time in us
+    """
+    import_times: dict[str, int] = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.removeprefix("import time:").split("|")
+        if not name.startswith("  "):  # nested imports are indented
+            import_times[name.strip()] = int(cumulative)
+    return import_times
+
+
+def run_once(language: str, key_path: str) -> tuple[float, dict[str, int]]:
+    """
+    Run `translate` once in a fresh interpreter.
+
+    Args:
+        language (str): the language code to translate to
+        key_path (str): the key path to translate
+
+    Raises:
+        CalledProcessError: if the `translate` command failed
+
+    Returns:
+        tuple[float, dict[str, int]]: the wall time in ms and the top-level
+        import times of the run
+    """
+    command = [sys.executable, "-X", "importtime", "-m", "translation_library"]
+    command += ["translate", "-l", language, "-k", key_path]
+    start = time.perf_counter()
+    result = subprocess.run(
+        command, cwd=get_project_root(), capture_output=True, text=True, check=True
+    )
+    return (time.perf_counter() - start) * 1000, parse_importtime(result.stderr)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=(__doc__ or "").strip().partition("\n")[0]
+    )
+    parser.add_argument("-l", "--language", default="en")
+    parser.add_argument("-k", "--key-path", default="setting")
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--budget-ms", type=float, default=STARTUP_BUDGET_MS)
+    args = parser.parse_args()
+
+    run_once(args.language, args.key_path)  # warm the OS file cache
+    wall_times: list[float] = []
+    import_totals: list[float] = []
+    import_times: dict[str, int] = {}
+    for _ in range(args.runs):
+        wall_ms, import_times = run_once(args.language, args.key_path)
+        wall_times.append(wall_ms)
+        import_totals.append(sum(import_times.values()) / 1000)
+
+    print("slowest top-level imports of the last run:")
+    for name, cumulative in sorted(import_times.items(), key=lambda i: -i[1])[:10]:
+        print(f"  {cumulative / 1000:>8.2f} ms  {name}")
+
+    median_wall_ms = statistics.median(wall_times)
+    print(f"median import time: {statistics.median(import_totals):.2f} ms")
+    print(f"median wall time:   {median_wall_ms:.2f} ms (budget {args.budget_ms} ms)")
+    if median_wall_ms > args.budget_ms:
+        print("FAIL: cold start is over budget")
+        sys.exit(1)
+    print("OK: cold start is within budget")
+
+
+if __name__ == "__main__":
+    main()
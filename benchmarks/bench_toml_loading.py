@@ -0,0 +1,76 @@
+"""
+Compare the parse time and peak memory of loading a language TOML file with
+`tomlkit` (the default, editable mode of `serialize_toml_dict()`) against the
+read-only `tomllib` mode used by lookups.
+
+Usage:
+    python -m benchmarks.bench_toml_loading [--keys 1000 10000] [--repeat 5]
+"""
+
+import argparse
+import statistics
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+from benchmarks.synthetic_catalogs import write_synthetic_language_file
+from translation_library.utils.toml_utils import serialize_toml_dict
+
+
+def measure_load(file_path: Path, read_only: bool, repeat: int) -> tuple[float, int]:
+    """
+    Load a TOML file `repeat` times and measure it.
+
+    Args:
+        file_path (Path): the TOML file to load
+        read_only (bool): whether to use the `tomllib` read-only mode
+        repeat (int): how many timed loads to run
+
+    Returns:
+        tuple[float, int]: the median load time in ms and the peak bytes
+        allocated while building the dict
+    """
+    timings: list[float] = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        serialize_toml_dict(file_path, read_only=read_only)
+        timings.append((time.perf_counter() - start) * 1000)
+
+    tracemalloc.start()
+    toml_dict = serialize_toml_dict(file_path, read_only=read_only)
+    _, peak_bytes = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del toml_dict
+
+    return statistics.median(timings), peak_bytes
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=(__doc__ or "").strip().partition("\n")[0]
+    )
+    parser.add_argument("--keys", type=int, nargs="+", default=[1_000, 10_000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'keys':>8} | {'mode':>8} | {'median ms':>10} | {'peak MiB':>9} | speedup")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for key_count in args.keys:
+            file_path = write_synthetic_language_file(
+                Path(tmp_dir) / f"synthetic_{key_count}.toml", key_count
+            )
+            tomlkit_ms, tomlkit_peak = measure_load(file_path, False, args.repeat)
+            tomllib_ms, tomllib_peak = measure_load(file_path, True, args.repeat)
+            for mode, ms, peak in (
+                ("tomlkit", tomlkit_ms, tomlkit_peak),
+                ("tomllib", tomllib_ms, tomllib_peak),
+            ):
+                print(
+                    f"{key_count:>8} | {mode:>8} | {ms:>10.2f} | "
+                    f"{peak / 2**20:>9.2f} | {tomlkit_ms / ms:.1f}x"
+                )
+
+
+if __name__ == "__main__":
+    main()
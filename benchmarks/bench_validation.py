@@ -0,0 +1,70 @@
+"""
+Measure the per-call overhead of argument validation on the hot lookup
+functions by timing each one validated, through its unvalidated
+`raw_function`, and with validation switched off globally.
+
+Usage:
+    python -m benchmarks.bench_validation [-l en] [-k setting] [--number 20000]
+"""
+
+import argparse
+import timeit
+from typing import Callable
+
+from translation_library.utils.path_utils import get_project_root
+from translation_library.utils.translation_utils import get_i18n_obj, is_supported
+from translation_library.utils.validation_utils import set_validation_enabled
+
+
+def time_per_call(func: Callable[[], object], number: int) -> float:
+    """
+    Time a function over `number` calls, after one warm-up call.
+
+    Args:
+        func (Callable): the function to call without args
+        number (int): how many calls to time
+
+    Returns:
+        float: the best average time of a call in us, over 5 repeats
+    """
+    func()
+    return min(timeit.repeat(func, number=number, repeat=5)) / number * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=(__doc__ or "").strip().partition("\n")[0]
+    )
+    parser.add_argument("-l", "--language", default="en")
+    parser.add_argument("-k", "--key-path", default="setting")
+    parser.add_argument("--number", type=int, default=20_000)
+    args = parser.parse_args()
+
+    language, key_path = args.language, args.key_path
+    cases: dict[str, tuple[Callable[..., object], tuple[object, ...]]] = {
+        "get_i18n_obj": (get_i18n_obj, (language, key_path)),
+        "is_supported": (is_supported, (language,)),
+        "get_project_root": (get_project_root, ()),
+    }
+
+    print(
+        f"{'function':>18} | {'validated':>10} | {'raw':>10} | {'disabled':>10} | "
+        "overhead removed"
+    )
+    for name, (func, func_args) in cases.items():
+        validated_us = time_per_call(lambda: func(*func_args), args.number)
+        raw_func = func.raw_function  # type: ignore
+        raw_us = time_per_call(lambda: raw_func(*func_args), args.number)
+        set_validation_enabled(False)
+        try:
+            disabled_us = time_per_call(lambda: func(*func_args), args.number)
+        finally:
+            set_validation_enabled(True)
+        print(
+            f"{name:>18} | {validated_us:>8.2f}us | {raw_us:>8.2f}us | "
+            f"{disabled_us:>8.2f}us | {validated_us - disabled_us:.2f}us/call"
+        )
+
+
+if __name__ == "__main__":
+    main()
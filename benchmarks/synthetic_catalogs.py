@@ -0,0 +1,109 @@
+"""
+helpers for generating synthetic language TOML files used by the benchmarks
+"""
+
+from pathlib import Path
+
+
+def build_synthetic_toml_str(
+    key_count: int, keys_per_table: int = 100, placeholder_every: int = 4
+) -> str:
+    """
+    Build the contents of a synthetic language TOML file. Keys are split into
+    nested `[section_N.group_M]` tables and every `placeholder_every`-th value
+    contains `{name}`/`{count}` placeholders.
+
+    Args:
+        key_count (int): the total number of string keys to generate
+        keys_per_table (int, optional): keys per innermost table. Defaults to 100.
+        placeholder_every (int, optional): placeholder frequency. Defaults to 4.
+
+    Returns:
+        str: the synthetic language file as a TOML str
+    """
+    lines: list[str] = ['setting = "This is a synthetic language file"', ""]
+    for key_idx in range(key_count):
+        if key_idx % keys_per_table == 0:
+            table_idx = key_idx // keys_per_table
+            lines.append(f"[section_{table_idx // 10}.group_{table_idx % 10}]")
+        if key_idx % placeholder_every == 0:
+            lines.append(
+                f'key_{key_idx} = "Hello {{name}}, you have {{count}} new items"'
+            )
+        else:
+            lines.append(f'key_{key_idx} = "Synthetic message number {key_idx}"')
+    return "\n".join(lines) + "\n"
+
+
+def synthetic_key_paths(key_count: int, keys_per_table: int = 100) -> list[str]:
+    """
+    Return the dotted key paths of the string keys in a synthetic file built
+    by `build_synthetic_toml_str()` with the same arguments.
+
+    Args:
+        key_count (int): the total number of string keys generated
+        keys_per_table (int, optional): keys per innermost table. Defaults to 100.
+
+    Returns:
+        list[str]: every dotted key path, such as `section_0.group_0.key_0`
+    """
+    key_paths: list[str] = []
+    for key_idx in range(key_count):
+        table_idx = key_idx // keys_per_table
+        key_paths.append(
+            f"section_{table_idx // 10}.group_{table_idx % 10}.key_{key_idx}"
+        )
+    return key_paths
+
+
+def write_synthetic_language_file(
+    file_path: Path, key_count: int, keys_per_table: int = 100
+) -> Path:
+    """
+    Write a synthetic language TOML file to disk.
+
+    Args:
+        file_path (Path): where to write the file
+        key_count (int): the total number of string keys to generate
+        keys_per_table (int, optional): keys per innermost table. Defaults to 100.
+
+    Returns:
+        Path: the path that was written to
+    """
+    file_path.write_text(
+        build_synthetic_toml_str(key_count, keys_per_table), encoding="utf-8"
+    )
+    return file_path
+
+
+def write_synthetic_project(
+    root: Path, language_count: int, key_count: int, keys_per_table: int = 100
+) -> list[str]:
+    """
+    Write a project with `language_count` synthetic languages, coded `l0`,
+    `l1`, ..., and a config.toml listing them to `root`.
+
+    Args:
+        root (Path): the project root to write to
+        language_count (int): how many languages to generate
+        key_count (int): how many keys each language file has
+        keys_per_table (int, optional): keys per innermost table. Defaults to 100.
+
+    Returns:
+        list[str]: the generated language codes
+    """
+    (root / "i18n").mkdir()
+    codes: list[str] = []
+    config = '[paths]\ni18n_dir = "i18n"\n'
+    for language_idx in range(language_count):
+        code = f"l{language_idx}"
+        write_synthetic_language_file(
+            root / "i18n" / f"{code}.toml", key_count, keys_per_table
+        )
+        config += (
+            f'\n[languages.{code}]\nenglish_name = "Language {language_idx}"\n'
+            f'native_name = "Language {language_idx}"\nfile = "{code}.toml"\n'
+        )
+        codes.append(code)
+    (root / "config.toml").write_text(config, encoding="utf-8")
+    return codes
@@ -27,3 +27,7 @@ EXAMPLE_ENGLISH_TOML_DICT: dict[str, object] = {
         "welcome": "Welcome {name}!",
     },
 }
+
+EXAMPLE_SUPPORTED_LANGUAGE_CODE = "en"
+
+EXAMPLE_UNSUPPORTED_LANGUAGE_CODE = "wbp"
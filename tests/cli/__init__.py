@@ -0,0 +1,3 @@
+"""
+tests for cli module
+"""
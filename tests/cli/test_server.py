@@ -0,0 +1,98 @@
+import io
+import json
+import socket
+import threading
+from pathlib import Path
+
+import pytest
+
+from resources.constants.values import (
+    EXAMPLE_SUPPORTED_LANGUAGE_CODE,
+    EXAMPLE_UNSUPPORTED_LANGUAGE_CODE,
+)
+from translation_library.cli.server import (
+    TranslationServer,
+    handle_line,
+    handle_request,
+    serve_stdio,
+)
+
+
+def test_handle_request_ping() -> None:
+    assert handle_request({"command": "ping"}) == {"ok": True, "result": "pong"}
+
+
+def test_handle_request_supported() -> None:
+    response = handle_request(
+        {"command": "supported", "language": EXAMPLE_SUPPORTED_LANGUAGE_CODE}
+    )
+    assert response == {"ok": True, "result": True}
+
+
+def test_handle_request_unknown_command_fail() -> None:
+    response = handle_request({"command": "explode"})
+    assert not response["ok"]
+
+
+def test_handle_request_missing_key_fail() -> None:
+    response = handle_request(
+        {
+            "command": "translate",
+            "language": EXAMPLE_SUPPORTED_LANGUAGE_CODE,
+            "key_path": EXAMPLE_UNSUPPORTED_LANGUAGE_CODE,
+        }
+    )
+    assert response["type"] == "PathAccessError"
+
+
+def test_handle_line_invalid_json_fail() -> None:
+    assert not json.loads(handle_line("not json"))["ok"]
+
+
+def test_handle_line_invalid_utf8_fail() -> None:
+    response = json.loads(handle_line(b'{"command": "\xff"}\n'))
+    assert not response["ok"] and response["type"] == "UnicodeDecodeError"
+
+
+def test_serve_stdio() -> None:
+    in_stream = io.StringIO('{"command": "ping"}\n\nnot json\n{"command": "ping"}\n')
+    out_stream = io.StringIO()
+    serve_stdio(in_stream, out_stream)
+    responses = [json.loads(line) for line in out_stream.getvalue().splitlines()]
+    assert [response["ok"] for response in responses] == [True, False, True]
+
+
+def test_handle_request_stats() -> None:
+    response = handle_request({"command": "stats"})
+    assert set(response["result"]["cache"]) >= {"hits", "misses", "evictions"}  # type: ignore
+
+
+def test_translation_server(tmp_path: Path) -> None:
+    socket_path = str(tmp_path / "tl.sock")
+    # a socket left behind by a previous server is replaced
+    with socket.socket(socket.AF_UNIX) as stale_socket:
+        stale_socket.bind(socket_path)
+
+    with TranslationServer(socket_path) as server:
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            with socket.socket(socket.AF_UNIX) as client:
+                client.connect(socket_path)
+                file = client.makefile("rwb")
+                file.write(b'\xff\n{"command": "ping"}\n')
+                file.flush()
+                # the invalid line fails without closing the connection
+                assert not json.loads(file.readline())["ok"]
+                assert json.loads(file.readline())["result"] == "pong"
+        finally:
+            server.shutdown()
+            thread.join()
+
+
+def test_translation_server_keeps_other_files_fail(tmp_path: Path) -> None:
+    file_path = tmp_path / "config.toml"
+    file_path.write_text("[paths]\n")
+    with pytest.raises(FileExistsError):
+        TranslationServer(str(file_path))
+    assert file_path.read_text() == "[paths]\n"
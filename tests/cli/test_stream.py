@@ -0,0 +1,98 @@
+"""
+tests for the translate-stream records of the cli module
+"""
+
+import io
+import json
+import multiprocessing
+
+import pytest
+
+from resources.constants.values import (
+    EXAMPLE_SUPPORTED_LANGUAGE_CODE,
+    EXAMPLE_UNSUPPORTED_LANGUAGE_CODE,
+)
+from translation_library.cli import stream
+from translation_library.cli.stream import DEFAULT_BATCH_SIZE, translate_stream
+
+EXAMPLE_JSONL_RECORDS = (
+    json.dumps(
+        {
+            "language": EXAMPLE_SUPPORTED_LANGUAGE_CODE,
+            "key_path": "start.welcome",
+            "args": {"name": "Blake"},
+        }
+    )
+    + "\n\nnot json\n"
+    + json.dumps({"language": EXAMPLE_SUPPORTED_LANGUAGE_CODE, "key_path": "hello"})
+    + "\n"
+    + json.dumps(
+        {"language": EXAMPLE_SUPPORTED_LANGUAGE_CODE, "key_path": "missing.key"}
+    )
+    + "\n"
+)
+
+
+def _translate_jsonl(
+    records: str, workers: int | None = None, batch_size: int = DEFAULT_BATCH_SIZE
+) -> tuple[list[dict], int]:
+    out_stream = io.StringIO()
+    failed = translate_stream(
+        io.StringIO(records), out_stream, workers=workers, batch_size=batch_size
+    )
+    return [json.loads(line) for line in out_stream.getvalue().splitlines()], failed
+
+
+def test_translate_stream_jsonl() -> None:
+    results, failed = _translate_jsonl(EXAMPLE_JSONL_RECORDS, batch_size=2)
+    assert [result["line"] for result in results] == [1, 3, 4, 5]
+    assert [result["ok"] for result in results] == [True, False, True, False]
+    assert results[0]["result"] == "Welcome Blake!"
+    assert results[1]["type"] == "JSONDecodeError"
+    assert results[3]["type"] == "PathAccessError"
+    assert failed == 2
+
+
+def test_translate_stream_workers_keep_order() -> None:
+    records = EXAMPLE_JSONL_RECORDS * 20
+    assert _translate_jsonl(records, workers=2, batch_size=16) == _translate_jsonl(
+        records
+    )
+
+
+@pytest.mark.skipif(
+    "fork" not in multiprocessing.get_all_start_methods(), reason="needs fork"
+)
+def test_translate_stream_workers_are_forked(monkeypatch: pytest.MonkeyPatch) -> None:
+    # only forked workers see what this process changed after importing
+    def handle_request(request: dict[str, object]) -> dict[str, object]:
+        return {"ok": True, "result": "from the parent"}
+
+    monkeypatch.setattr(stream, "handle_request", handle_request)
+    results, failed = _translate_jsonl(EXAMPLE_JSONL_RECORDS, workers=2)
+    assert [result.get("result") for result in results if result["ok"]] == [
+        "from the parent"
+    ] * 3
+    assert failed == 1
+
+
+def test_translate_stream_tsv() -> None:
+    out_stream = io.StringIO()
+    failed = translate_stream(
+        io.StringIO(
+            f"{EXAMPLE_SUPPORTED_LANGUAGE_CODE}\tstart.welcome\tname=Blake\n"
+            f"{EXAMPLE_UNSUPPORTED_LANGUAGE_CODE}\tsetting\n"
+            f"{EXAMPLE_SUPPORTED_LANGUAGE_CODE}\n"
+        ),
+        out_stream,
+        record_format="tsv",
+    )
+    lines = [line.split("\t") for line in out_stream.getvalue().splitlines()]
+    assert lines[0] == ["1", "ok", "Welcome Blake!"]
+    assert [line[:2] for line in lines[1:]] == [["2", "error"], ["3", "error"]]
+    assert failed == 2
+
+
+def test_translate_stream_unknown_format_fail() -> None:
+    with pytest.raises(ValueError):
+        translate_stream(io.StringIO(""), io.StringIO(), record_format="csv")
@@ -0,0 +1,91 @@
+"""
+fixtures shared by the unit tests
+"""
+
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+
+from translation_library.utils.config_utils import set_project_root
+from translation_library.utils.message_utils import clear_message_cache
+
+# The English name, native name and file name of each language code that
+# test projects use. Other codes are named after themselves
+LANGUAGE_NAMES = {
+    "en": ("English", "English", "english.toml"),
+    "de": ("German", "Deutsch", "german.toml"),
+    "de-at": ("Austrian German", "Österreichisch", "austrian.toml"),
+    "fr": ("French", "Français", "french.toml"),
+    "pl": ("Polish", "Polski", "polish.toml"),
+}
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    config.addinivalue_line(
+        "markers",
+        "project(languages, fallbacks=None, options=None): the language files, "
+        "fallback chains and extra language config of the `project_root` fixture",
+    )
+
+
+def write_project(
+    root: Path,
+    languages: dict[str, str | None],
+    fallbacks: dict[str, list[str]] | None = None,
+    options: dict[str, str] | None = None,
+) -> None:
+    """
+    Write a config.toml and an i18n dir of language files into `root`.
+
+    Args:
+        root (Path): the project root to write into
+        languages (dict[str, str | None]): each language code mapped to the
+        contents of its language file, or None to leave the file out, in
+        config order
+        fallbacks (dict[str, list[str]] | None, optional): the `[fallbacks]`
+        table. Defaults to None.
+        options (dict[str, str] | None, optional): extra TOML lines of the
+        config table of a language code, such as `aliases = ["deu"]`.
+        Defaults to None.
+    """
+    (root / "i18n").mkdir()
+    config = '[paths]\ni18n_dir = "i18n"\n'
+    if fallbacks:
+        config += "\n[fallbacks]\n" + "".join(
+            f'"{code}" = {chain!r}\n'.replace("'", '"')
+            for code, chain in fallbacks.items()
+        )
+    for code, contents in languages.items():
+        english_name, native_name, file_name = LANGUAGE_NAMES.get(
+            code, (code, code, f"{code}.toml")
+        )
+        if contents is not None:
+            (root / "i18n" / file_name).write_text(contents, encoding="utf-8")
+        config += (
+            f'\n[languages.{code}]\nenglish_name = "{english_name}"\n'
+            f'native_name = "{native_name}"\nfile = "{file_name}"\n'
+        )
+        if options and code in options:
+            config += options[code] + "\n"
+    (root / "config.toml").write_text(config, encoding="utf-8")
+
+
+@pytest.fixture
+def project_root(request: pytest.FixtureRequest, tmp_path: Path) -> Iterator[Path]:
+    """
+    A temporary project with the languages of the test's `project` marker,
+    set as the project root for the duration of the test, which also empties
+    the catalog cache.
+    """
+    marker = request.node.get_closest_marker("project")
+    if marker is None:
+        raise pytest.UsageError(
+            f"{request.node.nodeid} uses `project_root` without a `project` marker"
+        )
+    write_project(tmp_path, *marker.args, **marker.kwargs)
+    clear_message_cache()
+    set_project_root(tmp_path)
+    yield tmp_path
+    set_project_root(None)
+    clear_message_cache()
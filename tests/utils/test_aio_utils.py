@@ -0,0 +1,97 @@
+import asyncio
+import inspect
+import threading
+import time
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+from glom.core import PathAccessError  # type: ignore
+
+from translation_library.utils import aio_utils
+from translation_library.utils.aio_utils import (
+    get_i18n_obj,
+    load_language,
+    load_languages,
+    shutdown_executor,
+)
+from translation_library.utils.binary_catalog_utils import MappedCatalog
+from translation_library.utils.catalog_utils import (
+    Catalog,
+    get_catalog,
+    get_fallback_catalog,
+    get_loaded_languages,
+)
+
+pytestmark = pytest.mark.project(
+    {"en": 'hello = "Hello {name}"\nbye = "Bye"\n', "de": 'hello = "Hallo {name}"\n'},
+    fallbacks={"de": ["en"]},
+)
+
+
+@pytest.fixture(autouse=True)
+def executor() -> Iterator[None]:
+    yield
+    shutdown_executor()
+
+
+def test_get_i18n_obj(project_root: Path) -> None:
+    assert inspect.iscoroutinefunction(get_i18n_obj)
+    assert asyncio.run(get_i18n_obj("en", "hello")) == "Hello {name}"
+    assert asyncio.run(get_i18n_obj("de", "bye")) == "Bye"
+
+
+def test_get_i18n_obj_missing_key_fail(project_root: Path) -> None:
+    with pytest.raises(PathAccessError):
+        asyncio.run(get_i18n_obj("en", "goodbye"))
+
+
+def test_load_language_coalesces_concurrent_loads(
+    project_root: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    loads: list[str] = []
+    main_thread = threading.get_ident()
+
+    def slow_get_fallback_catalog(language: str) -> Catalog | MappedCatalog:
+        assert threading.get_ident() != main_thread
+        loads.append(language)
+        time.sleep(0.05)
+        return get_catalog(language)
+
+    monkeypatch.setattr(aio_utils, "get_fallback_catalog", slow_get_fallback_catalog)
+
+    async def load_many() -> list[object]:
+        return await asyncio.gather(*(load_language("en") for _ in range(10)))
+
+    catalogs = asyncio.run(load_many())
+    assert loads == ["en"]
+    assert all(catalog is catalogs[0] for catalog in catalogs)
+
+
+def test_load_language_checks_loaded_language_off_the_loop(
+    project_root: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    asyncio.run(load_language("de"))
+    main_thread = threading.get_ident()
+
+    def off_loop_get_fallback_catalog(language: str) -> Catalog | MappedCatalog:
+        assert threading.get_ident() != main_thread
+        return get_fallback_catalog(language)
+
+    monkeypatch.setattr(
+        aio_utils, "get_fallback_catalog", off_loop_get_fallback_catalog
+    )
+    assert asyncio.run(load_language("de")).get("bye") == "Bye"
+
+
+def test_load_languages(project_root: Path) -> None:
+    catalogs = asyncio.run(load_languages())
+    assert set(catalogs) == {"en", "de"}
+    assert set(get_loaded_languages()) == {"en", "de"}
+    assert catalogs["de"].get("bye") == "Bye"
+
+
+def test_load_languages_skips_failures(project_root: Path) -> None:
+    (project_root / "i18n" / "german.toml").unlink()
+    catalogs = asyncio.run(load_languages(["en", "de"]))
+    assert set(catalogs) == {"en"}
@@ -0,0 +1,128 @@
+import os
+from pathlib import Path
+
+import pytest
+from glom.core import PathAccessError  # type: ignore
+
+from translation_library.utils.binary_catalog_utils import (
+    MappedCatalog,
+    compile_catalog,
+    compile_catalogs,
+    get_compiled_catalog_path,
+    is_compiled_catalog_stale,
+    load_compiled_catalog,
+)
+from translation_library.utils.catalog_utils import (
+    Catalog,
+    clear_catalogs,
+    get_catalog,
+)
+
+EXAMPLE_TOML_STR = """setting = "Einstellung"
+count = 3
+plurals = ["one", "other"]
+
+[start]
+welcome = "Willkommen {name}!"
+section_name = "Willkommen"
+
+[start.nested]
+deep = "Tief"
+
+[empty]
+"""
+
+
+pytestmark = pytest.mark.project({"de": EXAMPLE_TOML_STR})
+
+
+def _touch_source(project_root: Path, contents: str) -> None:
+    file_path = project_root / "i18n" / "german.toml"
+    stat_result = os.stat(file_path)
+    file_path.write_text(contents)
+    # make sure the mtime changes even on coarse-grained filesystems
+    os.utime(file_path, ns=(stat_result.st_atime_ns, stat_result.st_mtime_ns + 10**9))
+
+
+def test_compile_catalogs(project_root: Path) -> None:
+    compiled_paths = compile_catalogs()
+    assert compiled_paths == {"de": project_root / "i18n" / "german.tlcat"}
+    assert get_compiled_catalog_path(project_root / "i18n" / "german.toml") == (
+        compiled_paths["de"]
+    )
+    assert not is_compiled_catalog_stale(project_root / "i18n" / "german.toml")
+
+
+def test_mapped_catalog_matches_toml_catalog(project_root: Path) -> None:
+    file_path = project_root / "i18n" / "german.toml"
+    catalog = MappedCatalog.from_compiled_file("de", file_path, compile_catalog("de"))
+    toml_catalog = Catalog.from_toml_file("de", file_path)
+    assert len(catalog) == len(toml_catalog)
+    for key_path, value in toml_catalog.entries.items():
+        assert key_path in catalog
+        assert catalog.get(key_path) == value
+    assert catalog.toml_dict == toml_catalog.toml_dict
+    assert bytes(catalog.get_bytes("start.welcome")) == "Willkommen {name}!".encode()
+    assert catalog.get_template("start.welcome").render({"name": "Blake"}) == (
+        "Willkommen Blake!"
+    )
+    catalog.close()
+
+
+def test_mapped_catalog_close_with_live_views(project_root: Path) -> None:
+    catalog = MappedCatalog.from_compiled_file(
+        "de", project_root / "i18n" / "german.toml", compile_catalog("de")
+    )
+    value = catalog.get_bytes("start.welcome")
+    catalog.close()
+    assert bytes(value) == "Willkommen {name}!".encode()
+
+
+def test_mapped_catalog_missing_key_fail(project_root: Path) -> None:
+    catalog = MappedCatalog.from_compiled_file(
+        "de", project_root / "i18n" / "german.toml", compile_catalog("de")
+    )
+    with pytest.raises(PathAccessError):
+        catalog.get("start.goodbye")
+    with pytest.raises(PathAccessError):
+        catalog.get("welcome")
+    with pytest.raises(TypeError):
+        catalog.get_bytes("start")
+    catalog.close()
+
+
+def test_mapped_catalog_get_array_index(project_root: Path) -> None:
+    catalog = MappedCatalog.from_compiled_file(
+        "de", project_root / "i18n" / "german.toml", compile_catalog("de")
+    )
+    assert catalog.get("plurals.1") == "other"
+    with pytest.raises(PathAccessError):
+        catalog.get("plurals.2")
+    catalog.close()
+
+
+def test_get_catalog_uses_compiled_catalog(project_root: Path) -> None:
+    assert isinstance(get_catalog("de"), Catalog)
+    compile_catalog("de")
+    clear_catalogs()
+    assert isinstance(get_catalog("de"), MappedCatalog)
+    assert get_catalog("de").get("start.nested.deep") == "Tief"
+
+
+def test_stale_compiled_catalog_is_ignored(project_root: Path) -> None:
+    compile_catalog("de")
+    assert isinstance(get_catalog("de"), MappedCatalog)
+    _touch_source(project_root, 'setting = "Neu"\n')
+    assert is_compiled_catalog_stale(project_root / "i18n" / "german.toml")
+    assert load_compiled_catalog("de", project_root / "i18n" / "german.toml") is None
+    catalog = get_catalog("de")
+    assert isinstance(catalog, Catalog)
+    assert catalog.get("setting") == "Neu"
+
+
+def test_invalid_compiled_catalog_is_ignored(project_root: Path) -> None:
+    compiled_path = project_root / "i18n" / "german.tlcat"
+    compiled_path.write_bytes(b"not a catalog")
+    assert is_compiled_catalog_stale(project_root / "i18n" / "german.toml")
+    assert load_compiled_catalog("de", project_root / "i18n" / "german.toml") is None
+    assert get_catalog("de").get("setting") == "Einstellung"
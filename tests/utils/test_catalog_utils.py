@@ -0,0 +1,281 @@
+import sys
+import threading
+from pathlib import Path
+from typing import Iterator, cast
+
+import pytest
+from glom.core import PathAccessError  # type: ignore
+
+from resources.constants.values import (
+    EXAMPLE_ENGLISH_TOML_DICT,
+    EXAMPLE_ENGLISH_TOML_PATH,
+    EXAMPLE_SUPPORTED_LANGUAGE_CODE,
+)
+from translation_library.utils.catalog_utils import (
+    Catalog,
+    configure_catalog_cache,
+    flatten_toml_dict,
+    get_cache_stats,
+    get_catalog,
+    get_fallback_catalog,
+    get_loaded_languages,
+    merge_toml_dicts,
+    preload_languages,
+    reload_catalog,
+    reset_cache_stats,
+    set_staleness_checks,
+)
+
+
+def test_flatten_toml_dict() -> None:
+    flat_dict = flatten_toml_dict(EXAMPLE_ENGLISH_TOML_DICT)
+    assert flat_dict["hello"] == "Hello {name}"
+    assert flat_dict["start.welcome"] == "Welcome {name}!"
+    assert flat_dict["start"] == EXAMPLE_ENGLISH_TOML_DICT["start"]
+
+
+def test_merge_toml_dicts() -> None:
+    merged = merge_toml_dicts(
+        EXAMPLE_ENGLISH_TOML_DICT, {"hello": "Hi {name}", "start": {"extra": "!"}}
+    )
+    assert merged["hello"] == "Hi {name}"
+    start = cast(dict[str, object], EXAMPLE_ENGLISH_TOML_DICT["start"])
+    assert merged["start"] == {**start, "extra": "!"}
+
+
+def test_catalog_get() -> None:
+    catalog = Catalog.from_toml_file(
+        EXAMPLE_SUPPORTED_LANGUAGE_CODE, EXAMPLE_ENGLISH_TOML_PATH
+    )
+    assert catalog.get("setting") == "This is the English language file"
+    assert catalog.get("start.section_name") == (
+        "This message is under the start section"
+    )
+    assert "start.welcome" in catalog
+    assert not catalog.is_stale()
+
+
+def test_catalog_get_wrong_section_fail() -> None:
+    catalog = Catalog.from_toml_file(
+        EXAMPLE_SUPPORTED_LANGUAGE_CODE, EXAMPLE_ENGLISH_TOML_PATH
+    )
+    with pytest.raises(PathAccessError):
+        catalog.get("welcome")
+
+
+def test_catalog_get_nested_missing_key_fail() -> None:
+    catalog = Catalog.from_toml_file(
+        EXAMPLE_SUPPORTED_LANGUAGE_CODE, EXAMPLE_ENGLISH_TOML_PATH
+    )
+    with pytest.raises(PathAccessError):
+        catalog.get("start.goodbye")
+
+
+def test_catalog_get_array_index() -> None:
+    catalog = Catalog(
+        EXAMPLE_SUPPORTED_LANGUAGE_CODE,
+        Path("english.toml"),
+        {"items": [{"name": "first"}, {"name": "last"}], "start": {"welcome": "Hi"}},
+    )
+    assert catalog.get("items.0.name") == "first"
+    assert catalog.get("items.-1.name") == "last"
+    with pytest.raises(PathAccessError) as exc_info:
+        catalog.get("items.5.name")
+    assert exc_info.value.part_idx == 1
+    with pytest.raises(PathAccessError) as exc_info:
+        catalog.get("start.welcome.0")
+    assert exc_info.value.part_idx == 2
+
+
+def test_catalog_get_template() -> None:
+    catalog = Catalog.from_toml_file(
+        EXAMPLE_SUPPORTED_LANGUAGE_CODE, EXAMPLE_ENGLISH_TOML_PATH
+    )
+    template = catalog.get_template("start.welcome")
+    assert template is catalog.get_template("start.welcome")
+    assert template.render({"name": "Blake"}) == "Welcome Blake!"
+
+
+def test_catalog_get_template_table_fail() -> None:
+    catalog = Catalog.from_toml_file(
+        EXAMPLE_SUPPORTED_LANGUAGE_CODE, EXAMPLE_ENGLISH_TOML_PATH
+    )
+    with pytest.raises(TypeError):
+        catalog.get_template("start")
+
+
+pytestmark = pytest.mark.project(
+    {
+        "en": 'hello = "Hello {name}"\nbye = "Bye"\n\n[start]\nwelcome = "Welcome!"\n',
+        "de": 'hello = "Hallo {name}"\n',
+        "de-at": '[start]\nwelcome = "Servus!"\n',
+    },
+    fallbacks={"de-at": ["de", "en"]},
+)
+
+
+def test_get_fallback_catalog(project_root: Path) -> None:
+    catalog = get_fallback_catalog("de-at")
+    assert catalog.get("start.welcome") == "Servus!"
+    assert catalog.get("hello") == "Hallo {name}"
+    assert catalog.get("bye") == "Bye"
+    assert get_fallback_catalog("de-at") is catalog
+    assert get_fallback_catalog("DE-AT") is catalog
+    assert not catalog.is_stale()
+    assert get_fallback_catalog("de") is get_catalog("de")
+    assert get_fallback_catalog("DE") is get_catalog("de")
+
+
+def test_get_fallback_catalog_missing_key_fail(project_root: Path) -> None:
+    with pytest.raises(PathAccessError):
+        get_fallback_catalog("de-at").get("start.goodbye")
+
+
+def test_get_fallback_catalog_source_reloaded(project_root: Path) -> None:
+    catalog = get_fallback_catalog("de-at")
+    (project_root / "i18n" / "english.toml").write_text('bye = "Ciao"\n')
+    reload_catalog("en")
+    assert get_fallback_catalog("de-at") is not catalog
+    assert get_fallback_catalog("de-at").get("bye") == "Ciao"
+
+
+def test_get_fallback_catalog_source_reloaded_while_watching(
+    project_root: Path,
+) -> None:
+    catalog = get_fallback_catalog("de-at")
+    set_staleness_checks(False)
+    try:
+        (project_root / "i18n" / "english.toml").write_text('bye = "Ciao"\n')
+        # what a `CatalogWatcher` does when the file changes
+        reload_catalog("en")
+        assert get_fallback_catalog("de-at") is not catalog
+        assert get_fallback_catalog("de-at").get("bye") == "Ciao"
+    finally:
+        set_staleness_checks(True)
+
+
+@pytest.mark.parametrize("use_processes", [False, True])
+def test_preload_languages(project_root: Path, use_processes: bool) -> None:
+    timings = preload_languages(workers=2, use_processes=use_processes)
+    assert set(timings) == {"en", "de", "de-at"}
+    assert all(milliseconds >= 0 for milliseconds in timings.values())
+    assert set(get_loaded_languages()) == {"en", "de", "de-at"}
+    assert get_catalog("de").get("hello") == "Hallo {name}"
+
+
+def test_preload_languages_skips_failures(project_root: Path) -> None:
+    (project_root / "i18n" / "german.toml").unlink()
+    assert set(preload_languages(["en", "de"])) == {"en"}
+
+
+@pytest.fixture
+def bounded_cache(project_root: Path) -> Iterator[Path]:
+    reset_cache_stats()
+    yield project_root
+    configure_catalog_cache()
+    reset_cache_stats()
+
+
+def test_catalog_cache_evicts_least_recently_used(bounded_cache: Path) -> None:
+    configure_catalog_cache(max_languages=2)
+    get_catalog("en")
+    get_catalog("de")
+    get_catalog("de-at")
+    # "en" is the first language in config.toml, so it is pinned
+    assert set(get_loaded_languages()) == {"en", "de-at"}
+    get_catalog("de")
+    assert set(get_loaded_languages()) == {"en", "de"}
+    assert get_cache_stats()["evictions"] == 2
+    assert get_cache_stats()["misses"] == 4
+
+
+def test_catalog_cache_counts_hits(bounded_cache: Path) -> None:
+    get_catalog("de")
+    get_catalog("de")
+    get_catalog("de")
+    stats = get_cache_stats()
+    assert (stats["hits"], stats["misses"], stats["evictions"]) == (2, 1, 0)
+    assert stats["languages"] == 1
+    assert stats["bytes"] == get_catalog("de").nbytes > 0
+
+
+def test_catalog_cache_max_bytes(bounded_cache: Path) -> None:
+    configure_catalog_cache(max_bytes=1, pinned=[])
+    get_catalog("en")
+    get_catalog("de")
+    # the catalog that was just loaded is kept even if it is over the budget
+    assert get_loaded_languages() == ["de"]
+
+
+def test_catalog_cache_counts_fallback_catalogs(bounded_cache: Path) -> None:
+    merged_catalog = get_fallback_catalog("de-at")
+    languages_bytes = sum(get_catalog(code).nbytes for code in ("en", "de", "de-at"))
+    stats = get_cache_stats()
+    assert stats["fallback_catalogs"] == 1
+    assert stats["bytes"] == languages_bytes + merged_catalog.nbytes
+
+    configure_catalog_cache(max_bytes=languages_bytes, pinned=["en", "de", "de-at"])
+    # the merged catalog is dropped before any language
+    assert get_cache_stats()["fallback_catalogs"] == 0
+    assert len(get_loaded_languages()) == 3
+
+
+def test_catalog_cache_loads_outside_the_lock(
+    bounded_cache: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    load_started = threading.Event()
+    finish_load = threading.Event()
+    from_toml_file = Catalog.from_toml_file
+
+    def slow_from_toml_file(language: str, file_path: Path) -> Catalog:
+        if language == "de":
+            load_started.set()
+            finish_load.wait(5)
+        return from_toml_file(language, file_path)
+
+    monkeypatch.setattr(Catalog, "from_toml_file", slow_from_toml_file)
+    threads = [threading.Thread(target=get_catalog, args=("de",)) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    assert load_started.wait(5)
+    # another language loads while "de" is still being parsed
+    en_thread = threading.Thread(target=get_catalog, args=("en",))
+    en_thread.start()
+    en_thread.join(2)
+    loaded_first = not en_thread.is_alive()
+    finish_load.set()
+    en_thread.join()
+    assert loaded_first
+    for thread in threads:
+        thread.join()
+    # and the concurrent misses on "de" parsed its file once
+    assert get_cache_stats()["misses"] == 2
+
+
+def test_catalog_cache_evicts_during_concurrent_hits(bounded_cache: Path) -> None:
+    # big catalogs, so that sizing them for eviction takes a while
+    codes = ("en", "de", "de-at")
+    for file_name in ("english", "german", "austrian"):
+        (bounded_cache / "i18n" / f"{file_name}.toml").write_text(
+            "".join(f'key{idx} = "value"\n' for idx in range(5000))
+        )
+    for code in codes:
+        get_catalog(code)
+    stop = threading.Event()
+
+    def hammer() -> None:
+        while not stop.is_set():
+            for code in codes:
+                get_catalog(code)
+
+    # switch threads as often as possible, so that hits land mid-eviction
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    thread = threading.Thread(target=hammer)
+    thread.start()
+    try:
+        configure_catalog_cache(max_bytes=10**9, pinned=[])
+    finally:
+        stop.set()
+        thread.join()
+        sys.setswitchinterval(switch_interval)
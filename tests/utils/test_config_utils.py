@@ -9,25 +9,47 @@ from resources.constants.values import (
     EXAMPLE_UNSUPPORTED_LANGUAGE,
     EXAMPLE_UNSUPPORTED_LANGUAGE_CODE,
 )
+from translation_library.utils.catalog_utils import get_catalog
 from translation_library.utils.config_utils import (
+    PathRegistry,
     get_all_english_names,
     get_all_file_names,  # TODO: test this
     get_all_language_codes,
     get_all_native_names,
+    get_config,
     get_config_file_path,
+    get_fallback_chain,
     get_i18n_dir_path,
+    get_language_code_set,
+    get_language_index,
     get_language_file_path,
     get_value_from_config,  # TODO: test this
     language_code_to_english_name,
     language_code_to_file_name,  # TODO: test this
     language_code_to_native_name,
+    normalize_language_name,
+    reload_config,
+    set_project_root,
 )
+from translation_library.utils.path_utils import get_project_root
 
 
 def test_get_config_file_path() -> None:
     assert get_config_file_path().exists()
 
 
+def test_get_config_is_cached() -> None:
+    assert get_config() is get_config()
+
+
+def test_reload_config() -> None:
+    config = get_config()
+    reloaded_config = reload_config()
+    assert reloaded_config is not config
+    assert reloaded_config == config
+    assert get_config() is reloaded_config
+
+
 # def test_get_value_from_config() -> None:
 
 
@@ -73,6 +95,11 @@ def test_get_all_language_codes() -> None:
     assert EXAMPLE_SUPPORTED_LANGUAGE_CODE in get_all_language_codes()
 
 
+def test_get_language_code_set() -> None:
+    assert get_language_code_set() == frozenset(get_all_language_codes())
+    assert get_language_code_set() is get_language_code_set()
+
+
 def test_language_code_to_english_name() -> None:
     assert (
         language_code_to_english_name(code=EXAMPLE_SUPPORTED_LANGUAGE_CODE).casefold()
@@ -102,3 +129,54 @@ def test_language_code_to_native_name_fail() -> None:
 
 def test_get_language_file_path() -> None:
     assert get_language_file_path(EXAMPLE_SUPPORTED_LANGUAGE_CODE).exists()
+
+
+def test_path_registry_language_file_path() -> None:
+    registry = PathRegistry(get_project_root())
+    file_path = registry.language_file_path(EXAMPLE_SUPPORTED_LANGUAGE_CODE)
+    assert file_path.exists()
+    assert file_path.is_relative_to(registry.i18n_dir)
+    assert registry.language_file_path(EXAMPLE_SUPPORTED_LANGUAGE_CODE) is file_path
+
+
+def test_path_registry_language_file_path_fail() -> None:
+    with pytest.raises(PathAccessError):
+        PathRegistry().language_file_path(EXAMPLE_UNSUPPORTED_LANGUAGE_CODE)
+
+
+@pytest.mark.project({"en": ""})
+def test_set_project_root(project_root: Path) -> None:
+    assert get_config_file_path() == project_root / "config.toml"
+    assert get_language_file_path("en") == project_root / "i18n" / "english.toml"
+    set_project_root(None)
+    assert get_config_file_path() == get_project_root() / "config.toml"
+
+
+@pytest.mark.project({"en": 'hello = "Hello"\n'})
+def test_set_project_root_drops_catalogs(project_root: Path) -> None:
+    assert get_catalog("en").get("hello") == "Hello"
+    other_root = project_root / "other"
+    (other_root / "i18n").mkdir(parents=True)
+    (other_root / "i18n" / "english.toml").write_text('hello = "Hi"\n')
+    (other_root / "config.toml").write_text((project_root / "config.toml").read_text())
+    set_project_root(other_root)
+    assert get_catalog("en").get("hello") == "Hi"
+
+
+def test_get_fallback_chain() -> None:
+    assert get_fallback_chain(EXAMPLE_SUPPORTED_LANGUAGE_CODE)[0] == (
+        EXAMPLE_SUPPORTED_LANGUAGE_CODE
+    )
+
+
+@pytest.mark.project({"de": ""}, options={"de": 'aliases = ["deu", "GER"]'})
+def test_get_language_index(project_root: Path) -> None:
+    index = get_language_index()
+    assert index == {
+        "de": "de",
+        "german": "de",
+        "deutsch": "de",
+        "deu": "de",
+        "ger": "de",
+    }
+    assert index[normalize_language_name("ＤＥＵＴＳＣＨ ")] == "de"
@@ -0,0 +1,81 @@
+import json
+from pathlib import Path
+
+import pytest
+from glom.core import PathAccessError  # type: ignore
+
+from translation_library.utils import coverage_utils
+from translation_library.utils.coverage_utils import get_coverage_report
+
+EXAMPLE_LANGUAGE_FILES = {
+    "en": (
+        'setting = "Settings"\nhello = "Hello {name}"\nitems = ["one", "two"]\n\n'
+        '[start]\nwelcome = "Welcome {name}!"\nsection_name = "Start"\n'
+    ),
+    "de": (
+        'setting = "Einstellungen"\nhello = "Hallo {nme}"\nitems = ["eins"]\n\n'
+        '[start]\nwelcome = "Willkommen {name}!"\ngoodbye = "Tschüss {"\n'
+    ),
+    # listed in config.toml, but without a language file
+    "fr": None,
+}
+
+
+pytestmark = pytest.mark.project(EXAMPLE_LANGUAGE_FILES)
+
+
+def test_get_coverage_report(project_root: Path) -> None:
+    report = get_coverage_report()
+    assert report["default_language"] == "en"
+    assert report["keys"] == 5
+    assert report["languages"]["en"]["coverage"] == 100.0
+    assert report["languages"]["de"] == {
+        "keys": 5,
+        "translated": 4,
+        "coverage": 80.0,
+        "missing": ["start.section_name"],
+        "extra": ["start.goodbye"],
+        "placeholder_mismatches": {"hello": {"missing": ["name"], "extra": ["nme"]}},
+        "invalid_templates": ["start.goodbye"],
+    }
+    assert "FileNotFoundError" in report["languages"]["fr"]["error"]
+    # the report is machine-readable as is
+    assert json.loads(json.dumps(report)) == report
+
+
+def test_get_coverage_report_summary(project_root: Path) -> None:
+    report = get_coverage_report(["de"], default_language="de", include_keys=False)
+    assert report["default_language"] == "de"
+    assert list(report["languages"]) == ["de"]
+    assert report["languages"]["de"]["missing"] == 0
+    assert report["languages"]["de"]["invalid_templates"] == 1
+
+
+@pytest.mark.project(
+    {
+        "en": 'files = "{count, plural, one {# file} other {# files}}"\n',
+        "de": 'files = "{num, plural, one {# Datei} other {# Dateien}}"\n',
+        "fr": 'files = "{count, plural, one {# fichier} other {# fichiers}}"\n',
+    }
+)
+def test_get_coverage_report_messages(project_root: Path) -> None:
+    languages = get_coverage_report()["languages"]
+    assert languages["fr"]["placeholder_mismatches"] == {}
+    assert languages["fr"]["invalid_templates"] == []
+    assert languages["de"]["placeholder_mismatches"] == {
+        "files": {"missing": ["count"], "extra": ["num"]}
+    }
+    assert languages["de"]["invalid_templates"] == []
+
+
+def test_get_coverage_report_unsupported_default_fail(project_root: Path) -> None:
+    with pytest.raises(PathAccessError):
+        get_coverage_report(default_language="pl")
+
+
+def test_get_coverage_report_no_languages_fail(
+    project_root: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(coverage_utils, "get_all_language_codes", lambda: [])
+    with pytest.raises(ValueError, match="no languages"):
+        get_coverage_report()
@@ -1,11 +1,24 @@
 from resources.constants.values import EXAMPLE_SUPPORTED_LANGUAGE_CODE
 from translation_library.utils.language_utils import into_toml_dict, into_toml_str
+from translation_library.utils.translation_utils import get_i18n_obj
 
 
 def test_language_toml() -> None:
     assert isinstance(into_toml_dict(EXAMPLE_SUPPORTED_LANGUAGE_CODE), dict)
 
 
+def test_into_toml_dict_is_a_copy() -> None:
+    toml_dict = into_toml_dict(EXAMPLE_SUPPORTED_LANGUAGE_CODE)
+    toml_dict["start"]["welcome"] = "Changed"  # type: ignore
+    toml_dict.clear()
+    assert get_i18n_obj(EXAMPLE_SUPPORTED_LANGUAGE_CODE, "start.welcome") == (
+        "Welcome {name}!"
+    )
+    assert into_toml_dict(EXAMPLE_SUPPORTED_LANGUAGE_CODE)["start"]["welcome"] == (  # type: ignore
+        "Welcome {name}!"
+    )
+
+
 def test_into_toml_str() -> None:
     assert isinstance(into_toml_str(EXAMPLE_SUPPORTED_LANGUAGE_CODE), str)
 
@@ -0,0 +1,80 @@
+import logging
+from pathlib import Path
+
+import pytest
+
+from translation_library.utils.log_utils import (
+    LOG_LEVEL_ENV_VAR,
+    configure_logging_from_config,
+    configure_logging_from_env,
+    disable_logging,
+    enable_logging,
+    is_logging_enabled,
+    package_logger,
+)
+
+
+def test_logging_disabled_by_default() -> None:
+    assert not is_logging_enabled()
+    assert not package_logger.isEnabledFor(logging.DEBUG)
+
+
+def test_enable_logging(tmp_path: Path) -> None:
+    log_file_path = tmp_path / "logs" / "test.log"
+    enable_logging(logging.DEBUG, log_file_path)
+    try:
+        logging.getLogger("translation_library.utils").debug("queued %s", "record")
+    finally:
+        disable_logging()
+    assert "queued record" in log_file_path.read_text()
+    assert not is_logging_enabled()
+
+
+def test_configure_logging_from_config(tmp_path: Path) -> None:
+    log_file_path = tmp_path / "test.log"
+    configure_logging_from_config(
+        {"logging": {"level": "info", "file": str(log_file_path)}}
+    )
+    try:
+        assert package_logger.isEnabledFor(logging.INFO)
+        assert not package_logger.isEnabledFor(logging.DEBUG)
+    finally:
+        disable_logging()
+
+
+def test_configure_logging_from_config_only_when_changed() -> None:
+    configure_logging_from_config({})
+    configure_logging_from_config({"logging": {"level": "info"}})
+    try:
+        assert package_logger.isEnabledFor(logging.INFO)
+        # reloading an unchanged config leaves the setup alone
+        disable_logging()
+        configure_logging_from_config({"logging": {"level": "info"}})
+        assert not is_logging_enabled()
+        configure_logging_from_config({"logging": {"level": "debug"}})
+        assert package_logger.isEnabledFor(logging.DEBUG)
+        configure_logging_from_config({})
+        assert not is_logging_enabled()
+    finally:
+        disable_logging()
+
+
+def test_configure_logging_from_config_keeps_enable_logging() -> None:
+    configure_logging_from_config({})
+    enable_logging(logging.WARNING)
+    try:
+        configure_logging_from_config({"logging": {"level": "debug"}})
+        assert not package_logger.isEnabledFor(logging.INFO)
+        configure_logging_from_config({})
+        assert package_logger.isEnabledFor(logging.WARNING)
+    finally:
+        disable_logging()
+
+
+def test_configure_logging_invalid_level(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv(LOG_LEVEL_ENV_VAR, "verbose")
+    with pytest.warns(RuntimeWarning, match="'verbose'"):
+        configure_logging_from_env()
+    with pytest.warns(RuntimeWarning, match="'loud'"):
+        configure_logging_from_config({"logging": {"level": "loud"}})
+    assert not is_logging_enabled()
@@ -0,0 +1,106 @@
+from pathlib import Path
+
+import pytest
+from glom.core import PathAccessError  # type: ignore
+
+from translation_library.utils.message_utils import (
+    CompiledMessage,
+    clear_message_cache,
+    format_message,
+    get_message,
+)
+from translation_library.utils.plural_utils import (
+    BUILTIN_PLURAL_RULES,
+    PluralRule,
+    get_plural_rule,
+)
+
+EXAMPLE_LANGUAGE_FILES = {
+    "en": (
+        'files = "{count, plural, =0 {No files} one {# file} other {# files}}"\n'
+        'invite = "{host} invited {guest, select, female {her} other {them}}"\n'
+        'hello = "Hello {name}"\n'
+    ),
+    "pl": ('files = "{count, plural, one {# plik} few {# pliki} other {# plików}}"\n'),
+    "xx": ('files = "{count, plural, one {# item} two {a pair} other {# items}}"\n'),
+}
+
+
+pytestmark = pytest.mark.project(
+    EXAMPLE_LANGUAGE_FILES,
+    fallbacks={"pl": ["en"]},
+    options={"xx": 'plural_rules = { one = "n = 1", two = "n = 2" }'},
+)
+
+
+def test_format_message_plural(project_root: Path) -> None:
+    assert [format_message("en", "files", count=n) for n in (0, 1, 2)] == [
+        "No files",
+        "1 file",
+        "2 files",
+    ]
+    assert [format_message("pl", "files", count=n) for n in (1, 3, 5, 22)] == [
+        "1 plik",
+        "3 pliki",
+        "5 plików",
+        "22 pliki",
+    ]
+    assert format_message("xx", "files", count=2) == "a pair"
+    assert get_plural_rule("xx").categories == ("one", "two", "other")
+
+
+def test_format_message_select_and_fallback(project_root: Path) -> None:
+    assert format_message("en", "invite", host="Ana", guest="female") == (
+        "Ana invited her"
+    )
+    assert format_message("en", "invite", host="Ana", guest="x") == "Ana invited them"
+    # falls back to the English message
+    assert format_message("pl", "hello", name="Blake") == "Hello Blake"
+
+
+def test_get_message_is_cached(project_root: Path) -> None:
+    assert get_message("en", "files") is get_message("en", "files")
+    assert get_message("en", "files").arguments == frozenset({"count"})
+
+
+def test_format_message_fail(project_root: Path) -> None:
+    with pytest.raises(PathAccessError):
+        format_message("en", "missing")
+    with pytest.raises(KeyError):
+        format_message("en", "files")
+    with pytest.raises(TypeError):
+        format_message("en", "files", count="some")
+
+
+def test_compiled_message_offset_and_quoting() -> None:
+    message = CompiledMessage(
+        "{n, plural, offset:1 =0 {nobody} =1 {you} other {you and # others}}"
+        " '{braces}' don't"
+    )
+    rule = PluralRule(BUILTIN_PLURAL_RULES["en"])
+    assert [message.render({"n": n}, rule) for n in (0, 1, 3)] == [
+        "nobody {braces} don't",
+        "you {braces} don't",
+        "you and 2 others {braces} don't",
+    ]
+
+
+def test_compiled_message_empty_branches() -> None:
+    message = CompiledMessage(
+        "{n, plural, =0 {} one {} other {# left}}"
+        "{who, select, female {} other { for them}}"
+    )
+    rule = PluralRule(BUILTIN_PLURAL_RULES["en"])
+    assert [
+        message.render({"n": n, "who": who}, rule)
+        for n, who in ((0, "female"), (1, "female"), (2, "x"))
+    ] == ["", "", "2 left for them"]
+
+
+@pytest.mark.parametrize(
+    "source",
+    ["{n, plural, one {x}}", "{n", "n}", "{n, number}", "{n, plural, some {x}}"],
+)
+def test_compiled_message_invalid_fail(source: str) -> None:
+    with pytest.raises(ValueError):
+        CompiledMessage(source)
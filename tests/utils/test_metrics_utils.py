@@ -0,0 +1,154 @@
+import json
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+
+from translation_library.utils import metrics_utils
+from translation_library.utils.message_utils import format_message
+from translation_library.utils.metrics_utils import (
+    JsonLinesExporter,
+    LatencyHistogram,
+    disable_metrics,
+    enable_metrics,
+    export_metrics,
+    get_metrics_snapshot,
+    is_metrics_enabled,
+    profile_lookups,
+    reset_metrics,
+    set_metrics_exporter,
+)
+from translation_library.utils.translation_utils import format_i18n, get_i18n_obj
+
+pytestmark = pytest.mark.project(
+    {
+        "en": (
+            'hello = "Hello {name}"\n'
+            'files = "{count, plural, one {# file} other {# files}}"\n'
+        )
+    }
+)
+
+
+@pytest.fixture(autouse=True)
+def metrics() -> Iterator[None]:
+    reset_metrics()
+    yield
+    disable_metrics()
+    reset_metrics()
+    set_metrics_exporter(None)
+
+
+def test_metrics_disabled_by_default(project_root: Path) -> None:
+    get_i18n_obj("en", "hello")
+    assert not is_metrics_enabled()
+    assert not metrics_utils.enabled
+    assert get_metrics_snapshot() == {"counters": {}, "histograms": {}}
+
+
+def test_metrics_record_loads_and_lookups(project_root: Path) -> None:
+    enable_metrics()
+    for _ in range(3):
+        get_i18n_obj("en", "hello")
+    format_i18n("en", "hello", name="Blake")
+    format_message("en", "files", count=2)
+
+    snapshot = get_metrics_snapshot()
+    counters = snapshot["counters"]
+    histograms = snapshot["histograms"]
+    assert counters["cache_misses"] == {"en": 1}  # type: ignore
+    assert counters["cache_hits"]["en"] == 4  # type: ignore
+    assert histograms["catalog_load_seconds"]["en"]["count"] == 1  # type: ignore
+    assert histograms["toml_parse_seconds"]["en"]["count"] == 1  # type: ignore
+    assert histograms["lookup_seconds"]["en"]["count"] == 3  # type: ignore
+    assert histograms["format_seconds"]["en"]["count"] == 1  # type: ignore
+    assert histograms["format_message_seconds"]["en"]["count"] == 1  # type: ignore
+    json.dumps(snapshot)
+
+
+def test_metrics_record_failed_lookups(project_root: Path) -> None:
+    enable_metrics()
+    with pytest.raises(KeyError):
+        format_i18n("en", "hello")
+    assert get_metrics_snapshot()["histograms"]["format_seconds"]["en"]["count"] == 1  # type: ignore
+
+
+def test_disable_metrics_keeps_recorded(project_root: Path) -> None:
+    enable_metrics()
+    get_i18n_obj("en", "hello")
+    disable_metrics()
+    get_i18n_obj("en", "hello")
+    assert get_metrics_snapshot()["histograms"]["lookup_seconds"]["en"]["count"] == 1  # type: ignore
+
+
+def test_metrics_bucket_unknown_languages(project_root: Path) -> None:
+    enable_metrics()
+    for language in ("xx", "yy", "en"):
+        with pytest.raises(Exception):
+            get_i18n_obj(language, "missing")
+
+    histograms = get_metrics_snapshot()["histograms"]
+    assert histograms["lookup_seconds"].keys() == {"en", "unknown"}  # type: ignore
+    assert histograms["lookup_seconds"]["unknown"]["count"] == 2  # type: ignore
+
+
+def test_latency_histogram_quantiles() -> None:
+    histogram = LatencyHistogram()
+    for _ in range(90):
+        histogram.observe(1e-6)
+    for _ in range(10):
+        histogram.observe(1e-3)
+
+    assert histogram.count == 100
+    assert histogram.min == 1e-6 and histogram.max == 1e-3
+    # buckets are at most 19% wide
+    assert 1e-6 <= histogram.quantile(0.5) <= 1.19e-6
+    assert histogram.quantile(0.99) == 1e-3
+    assert sum(count for _, count in histogram.to_dict()["buckets"]) == 100  # type: ignore
+    assert LatencyHistogram().quantile(0.5) == 0.0
+
+
+def test_profile_lookups(project_root: Path) -> None:
+    with profile_lookups() as profile:
+        get_i18n_obj("en", "hello")
+        assert metrics_utils.enabled
+    get_i18n_obj("en", "hello")
+
+    assert not metrics_utils.enabled
+    assert profile.seconds > 0
+    assert profile.metrics["histograms"]["lookup_seconds"]["en"]["count"] == 1  # type: ignore
+    # metrics are off globally, so only the profile recorded the lookup
+    assert get_metrics_snapshot() == {"counters": {}, "histograms": {}}
+
+
+def test_profile_lookups_with_global_metrics(project_root: Path) -> None:
+    enable_metrics()
+    get_i18n_obj("en", "hello")
+    with profile_lookups(cprofile=True) as profile:
+        get_i18n_obj("en", "hello")
+
+    assert profile.metrics["histograms"]["lookup_seconds"]["en"]["count"] == 1  # type: ignore
+    assert profile.stats is not None
+    assert get_metrics_snapshot()["histograms"]["lookup_seconds"]["en"]["count"] == 2  # type: ignore
+    assert metrics_utils.enabled
+
+
+def test_json_lines_exporter(project_root: Path) -> None:
+    file_path = project_root / "metrics.jsonl"
+    enable_metrics()
+    set_metrics_exporter(JsonLinesExporter(file_path))
+    get_i18n_obj("en", "hello")
+    export_metrics()
+    export_metrics()
+
+    lines = [json.loads(line) for line in file_path.read_text().splitlines()]
+    assert len(lines) == 2
+    assert lines[0]["histograms"]["lookup_seconds"]["en"]["count"] == 1
+
+
+def test_export_metrics_exporter_error(project_root: Path) -> None:
+    def failing_exporter(_: dict[str, object]) -> None:
+        raise RuntimeError("unreachable")
+
+    set_metrics_exporter(failing_exporter)
+    export_metrics()
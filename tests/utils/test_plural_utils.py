@@ -0,0 +1,62 @@
+from decimal import Decimal
+
+import pytest
+
+from translation_library.utils.plural_utils import (
+    BUILTIN_PLURAL_RULES,
+    PluralRule,
+    compile_plural_condition,
+    get_plural_operands,
+)
+
+
+def test_get_plural_operands() -> None:
+    assert get_plural_operands(-3) == (3, 3, 0, 0, 0, 0, 0)
+    assert get_plural_operands("1.50") == (Decimal("1.50"), 1, 2, 1, 50, 5, 0)
+    assert get_plural_operands(1.5) == (Decimal("1.5"), 1, 1, 1, 5, 5, 0)
+
+
+def test_get_plural_operands_not_a_number_fail() -> None:
+    with pytest.raises(TypeError):
+        get_plural_operands("many")
+
+
+@pytest.mark.parametrize(
+    "code, expected",
+    [
+        ("en", {1: "one", 0: "other", 2: "other", "1.0": "other"}),
+        ("fr", {0: "one", 1.5: "one", 2: "other", 1_000_000: "many"}),
+        ("ru", {1: "one", 21: "one", 3: "few", 11: "many", 25: "many", 1.5: "other"}),
+        ("pl", {1: "one", 22: "few", 12: "many", 5: "many"}),
+        ("ar", {0: "zero", 2: "two", 103: "few", 111: "many", 100: "other"}),
+        ("ja", {1: "other"}),
+    ],
+)
+def test_builtin_plural_rules(
+    code: str, expected: dict[int | float | Decimal | str, str]
+) -> None:
+    rule = PluralRule(BUILTIN_PLURAL_RULES[code])
+    assert {number: rule.select(number) for number in expected} == expected
+
+
+def test_compile_plural_condition() -> None:
+    condition = compile_plural_condition("n % 10 = 2..4,7 and n != 13 @integer 2~4")
+    operands = [get_plural_operands(number) for number in (2, 7, 13, 14, 2.5)]
+    assert [condition(operands) for operands in operands] == [
+        True,
+        True,
+        False,
+        True,
+        False,
+    ]
+
+
+@pytest.mark.parametrize("condition", ["", "x = 1", "n = ", "n = 1 and", "n ~ 1"])
+def test_compile_plural_condition_invalid_fail(condition: str) -> None:
+    with pytest.raises(ValueError):
+        compile_plural_condition(condition)
+
+
+def test_plural_rule_unknown_category_fail() -> None:
+    with pytest.raises(ValueError):
+        PluralRule({"several": "n = 3"})
@@ -0,0 +1,113 @@
+import multiprocessing
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+from translation_library.utils.binary_catalog_utils import MappedCatalog
+from translation_library.utils.catalog_utils import get_catalog
+from translation_library.utils.shared_catalog_utils import (
+    SharedCatalogs,
+    attach_shared_catalogs,
+    share_catalogs,
+)
+
+pytestmark = pytest.mark.project(
+    {
+        "en": 'hello = "Hello {name}"\n\n[start]\nwelcome = "Welcome!"\n',
+        "de": 'hello = "Hallo {name}"\n',
+    }
+)
+
+
+def _get_in_child(
+    name: str, language: str, key_path: str, results: "multiprocessing.Queue[object]"
+) -> None:
+    with SharedCatalogs.attach(name) as shared_catalogs:
+        results.put(shared_catalogs.catalogs[language].get(key_path))
+
+
+def test_share_catalogs(project_root: Path) -> None:
+    with share_catalogs() as shared_catalogs:
+        assert set(shared_catalogs.catalogs) == {"en", "de"}
+        catalog = get_catalog("en")
+        assert isinstance(catalog, MappedCatalog)
+        assert catalog is shared_catalogs.catalogs["en"]
+        assert catalog.get("start.welcome") == "Welcome!"
+        assert get_catalog("de").get("hello") == "Hallo {name}"
+    assert not isinstance(get_catalog("en"), MappedCatalog)
+
+
+def test_attach_shared_catalogs(project_root: Path) -> None:
+    with SharedCatalogs.create(["de"]) as owner:
+        with attach_shared_catalogs(owner.name) as shared_catalogs:
+            assert not shared_catalogs.is_owner
+            assert get_catalog("de") is shared_catalogs.catalogs["de"]
+            assert get_catalog("de").get("hello") == "Hallo {name}"
+        name = owner.name
+    with pytest.raises(FileNotFoundError):
+        SharedCatalogs.attach(name)
+
+
+def test_attach_shared_catalogs_from_child_process(project_root: Path) -> None:
+    context = multiprocessing.get_context("fork")
+    results: "multiprocessing.Queue[object]" = context.Queue()
+    with SharedCatalogs.create() as owner:
+        process = context.Process(
+            target=_get_in_child, args=(owner.name, "en", "hello", results)
+        )
+        process.start()
+        process.join(10)
+        assert results.get(timeout=10) == "Hello {name}"
+        assert process.exitcode == 0
+
+
+def _run_python(source: str, *args: str) -> "subprocess.CompletedProcess[str]":
+    return subprocess.run(
+        [sys.executable, "-c", source, *args],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=Path(__file__).parents[2],
+    )
+
+
+def test_attach_shared_catalogs_from_child_process_shares_tracker(
+    project_root: Path,
+) -> None:
+    # the child shares the owner's resource tracker, so it must leave the
+    # owner's registration alone, or the tracker fails to unregister the
+    # segment when the owner unlinks it
+    result = _run_python(
+        "import multiprocessing, sys\n"
+        "from translation_library.utils.config_utils import set_project_root\n"
+        "from translation_library.utils.shared_catalog_utils import SharedCatalogs\n"
+        "def attach(name):\n"
+        "    SharedCatalogs.attach(name).close()\n"
+        "set_project_root(sys.argv[1])\n"
+        "with SharedCatalogs.create() as owner:\n"
+        "    process = multiprocessing.get_context('fork').Process(\n"
+        "        target=attach, args=(owner.name,)\n"
+        "    )\n"
+        "    process.start()\n"
+        "    process.join()\n",
+        str(project_root),
+    )
+    assert result.stderr == ""
+
+
+def test_attach_shared_catalogs_from_other_process(project_root: Path) -> None:
+    with SharedCatalogs.create() as owner:
+        # a process that was not started by the owner has a resource tracker
+        # of its own, which must not unlink the segment once it exits
+        _run_python(
+            "import sys\n"
+            "from translation_library.utils.shared_catalog_utils import SharedCatalogs\n"
+            "SharedCatalogs.attach(sys.argv[1]).close()\n",
+            owner.name,
+        )
+        time.sleep(0.2)
+        with SharedCatalogs.attach(owner.name) as shared_catalogs:
+            assert shared_catalogs.catalogs["en"].get("hello") == "Hello {name}"
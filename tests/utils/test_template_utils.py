@@ -0,0 +1,32 @@
+import pytest
+
+from translation_library.utils.template_utils import CompiledTemplate
+
+
+def test_compiled_template_placeholders() -> None:
+    template = CompiledTemplate("Hello {name}, you have {count:>3} new {{items}}")
+    assert template.placeholders == frozenset({"name", "count"})
+
+
+def test_compiled_template_render() -> None:
+    template = CompiledTemplate("Hello {name}, you have {count:>3} new {{items}}")
+    assert template.render({"name": "Blake", "count": 7}) == (
+        "Hello Blake, you have   7 new {items}"
+    )
+
+
+def test_compiled_template_render_conversion() -> None:
+    assert CompiledTemplate("{name!r}").render({"name": "Blake"}) == "'Blake'"
+
+
+def test_compiled_template_render_attribute_access() -> None:
+    template = CompiledTemplate("{value.real} and {items[0]}")
+    assert template.placeholders == frozenset({"value", "items"})
+    assert template.render({"value": 3, "items": ["a"]}) == "3 and a"
+
+
+def test_compiled_template_render_missing_arg_fail() -> None:
+    template = CompiledTemplate("Welcome {name}!")
+    assert template.missing_args({}) == frozenset({"name"})
+    with pytest.raises(KeyError):
+        template.render({})
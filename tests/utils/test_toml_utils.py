@@ -10,6 +10,7 @@ from resources.constants.values import (
     EXAMPLE_UNSUPPORTED_FILE_EXTENSION_PATH,
     EXAMPLE_UNSUPPORTED_LANGUAGE_TOML_PATH,
 )
+from translation_library.utils import toml_utils
 from translation_library.utils.toml_utils import (
     deserialize_toml_dict,
     get_value_from_key,
@@ -21,6 +22,12 @@ def test_serialize_toml() -> None:
     assert serialize_toml_dict(EXAMPLE_ENGLISH_TOML_PATH) == EXAMPLE_ENGLISH_TOML_DICT
 
 
+def test_serialize_toml_read_only() -> None:
+    toml_dict = serialize_toml_dict(EXAMPLE_ENGLISH_TOML_PATH, read_only=True)
+    assert type(toml_dict) is dict
+    assert toml_dict == EXAMPLE_ENGLISH_TOML_DICT
+
+
 def test_serialize_toml_wrong_extension_fail() -> None:
     with pytest.raises(ValueError):
         serialize_toml_dict(EXAMPLE_UNSUPPORTED_FILE_EXTENSION_PATH)
@@ -31,6 +38,11 @@ def test_serialize_toml_invalid_toml_syntax_fail() -> None:
         serialize_toml_dict(EXAMPLE_INVALID_TOML_SYNTAX_PATH)
 
 
+def test_serialize_toml_read_only_invalid_toml_syntax_fail() -> None:
+    with pytest.raises(ValueError):
+        serialize_toml_dict(EXAMPLE_INVALID_TOML_SYNTAX_PATH, read_only=True)
+
+
 def test_deserialize_toml() -> None:
     deserialize_toml_dict(EXAMPLE_ENGLISH_TOML_DICT, EXAMPLE_ENGLISH_TOML_PATH)
     assert serialize_toml_dict(EXAMPLE_ENGLISH_TOML_PATH) == EXAMPLE_ENGLISH_TOML_DICT
@@ -71,6 +83,26 @@ def test_get_value_from_key_wrong_section_fail() -> None:
         get_value_from_key(EXAMPLE_ENGLISH_TOML_PATH, key_path="welcome")
 
 
+def test_get_value_from_key_missing_path_logged(
+    caplog: pytest.LogCaptureFixture, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    with pytest.raises(PathAccessError):
+        get_value_from_key(EXAMPLE_ENGLISH_TOML_PATH, key_path="welcome")
+    assert "does not exist" in caplog.text
+
+    def broken_get_value_from_toml_dict(*_: object) -> object:
+        raise KeyError("broken")
+
+    caplog.clear()
+    monkeypatch.setattr(
+        toml_utils, "get_value_from_toml_dict", broken_get_value_from_toml_dict
+    )
+    with pytest.raises(KeyError):
+        get_value_from_key(EXAMPLE_ENGLISH_TOML_PATH, key_path="setting")
+    assert "does not exist" not in caplog.text
+    assert "Could not get value" in caplog.text
+
+
 def test_get_value_from_key_unsupported_language_fail() -> None:
     with pytest.raises(FileNotFoundError):
         get_value_from_key(EXAMPLE_UNSUPPORTED_LANGUAGE_TOML_PATH, key_path="hello")
@@ -1,3 +1,9 @@
+from pathlib import Path
+
+import pytest
+from glom.core import PathAccessError  # type: ignore
+from pydantic_core import ValidationError
+
 from resources.constants.values import (
     EXAMPLE_SUPPORTED_LANGUAGE,
     EXAMPLE_SUPPORTED_LANGUAGE_CODE,
@@ -5,10 +11,14 @@ from resources.constants.values import (
     EXAMPLE_UNSUPPORTED_LANGUAGE_CODE,
 )
 from translation_library.utils.translation_utils import (
+    get_i18n_many,
+    get_i18n_matrix,
     get_i18n_obj,  # TODO: test this
     get_languages,
     get_languages_as_english_names,
+    has_key,
     is_supported,
+    resolve_language,
 )
 
 
@@ -36,3 +46,77 @@ def test_is_supported_language() -> None:
 
 def test_is_supported_language_fail() -> None:
     assert not is_supported(EXAMPLE_UNSUPPORTED_LANGUAGE_CODE)
+
+
+def test_get_i18n_many() -> None:
+    values = get_i18n_many(EXAMPLE_SUPPORTED_LANGUAGE_CODE, ["setting", "start"])
+    assert list(values) == ["setting", "start"]
+    assert isinstance(values["start"], dict)
+
+
+def test_get_i18n_many_empty_keys_fail() -> None:
+    with pytest.raises(ValidationError):
+        get_i18n_many(EXAMPLE_SUPPORTED_LANGUAGE_CODE, [])
+
+
+def test_get_i18n_matrix() -> None:
+    values = get_i18n_matrix([EXAMPLE_SUPPORTED_LANGUAGE_CODE], ["start"])
+    assert values[EXAMPLE_SUPPORTED_LANGUAGE_CODE] == get_i18n_many(
+        EXAMPLE_SUPPORTED_LANGUAGE_CODE, ["start"]
+    )
+
+
+def test_get_i18n_matrix_missing_key_fail() -> None:
+    with pytest.raises(PathAccessError):
+        get_i18n_matrix(
+            [EXAMPLE_SUPPORTED_LANGUAGE_CODE], [EXAMPLE_UNSUPPORTED_LANGUAGE]
+        )
+
+
+@pytest.mark.project({"en": '[[items]]\nname = "first"\n\n[[items]]\nname = "last"\n'})
+def test_get_i18n_obj_array_index(project_root: Path) -> None:
+    assert get_i18n_obj("en", "items.0.name") == "first"
+    assert get_i18n_obj("en", "items.1.name") == "last"
+    with pytest.raises(PathAccessError):
+        get_i18n_obj("en", "items.2.name")
+
+
+def test_has_key() -> None:
+    assert has_key(EXAMPLE_SUPPORTED_LANGUAGE_CODE, "start.welcome")
+    assert has_key(EXAMPLE_SUPPORTED_LANGUAGE_CODE, "start")
+
+
+def test_has_key_fail(caplog: pytest.LogCaptureFixture) -> None:
+    assert not has_key(EXAMPLE_SUPPORTED_LANGUAGE_CODE, "start.goodbye")
+    assert not has_key(EXAMPLE_SUPPORTED_LANGUAGE_CODE, "welcome")
+    assert not has_key(EXAMPLE_UNSUPPORTED_LANGUAGE_CODE, "start.welcome")
+    assert not has_key("", "")
+    assert not caplog.records
+
+
+@pytest.mark.project({"en": 'hello = "Hello"\n', "de": "hello = \n"})
+def test_has_key_invalid_file(
+    project_root: Path, caplog: pytest.LogCaptureFixture
+) -> None:
+    assert not has_key("de", "hello")
+    assert [record.levelname for record in caplog.records] == ["ERROR"]
+    assert "german.toml" in caplog.text
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        EXAMPLE_SUPPORTED_LANGUAGE_CODE,
+        EXAMPLE_SUPPORTED_LANGUAGE_CODE.upper(),
+        EXAMPLE_SUPPORTED_LANGUAGE,
+        EXAMPLE_SUPPORTED_LANGUAGE.casefold(),
+        f" {EXAMPLE_SUPPORTED_LANGUAGE.upper()} ",
+    ],
+)
+def test_resolve_language(text: str) -> None:
+    assert resolve_language(text) == EXAMPLE_SUPPORTED_LANGUAGE_CODE
+
+
+def test_resolve_language_fail() -> None:
+    assert resolve_language(EXAMPLE_UNSUPPORTED_LANGUAGE) is None
+    assert resolve_language(EXAMPLE_UNSUPPORTED_LANGUAGE_CODE) is None
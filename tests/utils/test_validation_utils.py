@@ -0,0 +1,64 @@
+import subprocess
+import sys
+from typing import Annotated
+
+import pytest
+from pydantic_core import ValidationError
+
+from translation_library.utils.path_utils import get_project_root
+from translation_library.utils.validation_utils import (
+    MinLength,
+    is_validation_enabled,
+    set_validation_enabled,
+    validate_call,
+)
+
+
+@validate_call
+def _join(words: Annotated[list[Annotated[str, MinLength(1)]], MinLength(1)]) -> str:
+    return " ".join(words)
+
+
+def test_validate_call() -> None:
+    assert _join(["Hello", "Blake"]) == "Hello Blake"
+
+
+def test_validate_call_empty_list_fail() -> None:
+    with pytest.raises(ValidationError):
+        _join([])
+
+
+def test_validate_call_empty_str_fail() -> None:
+    with pytest.raises(ValidationError):
+        _join(["Hello", ""])
+
+
+def test_validate_call_raw_function() -> None:
+    assert _join.raw_function([]) == ""  # type: ignore
+
+
+def test_set_validation_enabled() -> None:
+    set_validation_enabled(False)
+    try:
+        assert not is_validation_enabled()
+        assert _join([]) == ""
+    finally:
+        set_validation_enabled(True)
+    with pytest.raises(ValidationError):
+        _join([])
+
+
+def test_heavy_dependencies_not_imported_eagerly() -> None:
+    code = (
+        "import sys, translation_library.utils.language_utils;"
+        "print(*(m for m in ('pydantic', 'glom', 'tomlkit', 'typer') "
+        "if m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=get_project_root(),
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert result.stdout.strip() == ""
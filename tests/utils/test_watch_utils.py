@@ -0,0 +1,63 @@
+import os
+import time
+from pathlib import Path
+
+import pytest
+
+from translation_library.utils.catalog_utils import get_catalog
+from translation_library.utils.watch_utils import CatalogWatcher
+
+pytestmark = pytest.mark.project({"en": 'hello = "Hello {name}"\n'})
+
+
+def _replace_file(file_path: Path, contents: str) -> None:
+    tmp_file_path = file_path.with_suffix(".tmp")
+    tmp_file_path.write_text(contents)
+    os.replace(tmp_file_path, file_path)
+
+
+def _wait_for(language: str, key_path: str, expected: object) -> object:
+    deadline = time.monotonic() + 5
+    while time.monotonic() < deadline:
+        if (value := get_catalog(language).get(key_path)) == expected:
+            return value
+        time.sleep(0.02)
+    return get_catalog(language).get(key_path)
+
+
+@pytest.mark.parametrize("use_inotify", [True, False])
+def test_catalog_watcher_reloads_changed_file(
+    project_root: Path, use_inotify: bool
+) -> None:
+    catalog = get_catalog("en")
+    with CatalogWatcher(poll_interval=0.05, use_inotify=use_inotify):
+        _replace_file(project_root / "i18n" / "english.toml", 'hello = "Hi {name}"\n')
+        assert _wait_for("en", "hello", "Hi {name}") == "Hi {name}"
+    assert get_catalog("en") is not catalog
+
+
+def test_catalog_watcher_keeps_catalog_on_invalid_file(project_root: Path) -> None:
+    catalog = get_catalog("en")
+    with CatalogWatcher(poll_interval=0.05, use_inotify=False) as watcher:
+        _replace_file(project_root / "i18n" / "english.toml", "hello = \n")
+        assert watcher.reload_file("english.toml") == []
+        assert get_catalog("en") is catalog
+
+
+def test_catalog_watcher_restores_staleness_checks_on_error(
+    project_root: Path,
+) -> None:
+    watched_dir_path = project_root / "watched"
+    watched_dir_path.mkdir()
+    get_catalog("en")
+    watcher = CatalogWatcher(watched_dir_path, poll_interval=0.01, use_inotify=False)
+    watcher.start()
+    # the next poll fails, which stops the watcher without `stop()`
+    watched_dir_path.rmdir()
+    deadline = time.monotonic() + 5
+    while watcher.is_running and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert not watcher.is_running
+
+    _replace_file(project_root / "i18n" / "english.toml", 'hello = "Hi {name}"\n')
+    assert get_catalog("en").get("hello") == "Hi {name}"
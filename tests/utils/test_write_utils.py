@@ -0,0 +1,139 @@
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+
+from translation_library.utils.catalog_utils import (
+    clear_catalogs,
+    get_cache_stats,
+    get_catalog,
+)
+from translation_library.utils.write_utils import (
+    clear_edited_files,
+    configure_write_back,
+    flush_writes,
+    get_edited_languages,
+    get_pending_writes,
+    set_i18n_value,
+    update_many,
+)
+
+EXAMPLE_TOML_STR = """# German language file
+setting = "Einstellung"
+
+[start]
+welcome = "Willkommen {name}!"  # shown on the start page
+section_name = "Willkommen"
+"""
+
+
+pytestmark = pytest.mark.project({"de": EXAMPLE_TOML_STR})
+
+
+@pytest.fixture(autouse=True)
+def write_back() -> Iterator[None]:
+    configure_write_back(delay=60.0)
+    yield
+    clear_edited_files()
+    configure_write_back()
+
+
+def test_set_i18n_value(project_root: Path) -> None:
+    get_catalog("de")
+    set_i18n_value("de", "start.welcome", "Hallo {name}!")
+    # lookups see the edit before it is written
+    assert get_catalog("de").get("start.welcome") == "Hallo {name}!"
+    assert get_catalog("de").get_template("start.welcome").render({"name": "A"}) == (
+        "Hallo A!"
+    )
+    assert "Willkommen {name}!" in (project_root / "i18n" / "german.toml").read_text()
+
+    assert flush_writes() == [project_root / "i18n" / "german.toml"]
+    assert (project_root / "i18n" / "german.toml").read_text() == (
+        EXAMPLE_TOML_STR.replace("Willkommen {name}!", "Hallo {name}!")
+    )
+    # the catalog is kept in sync instead of being loaded again
+    misses = get_cache_stats()["misses"]
+    assert get_catalog("de").get("start.welcome") == "Hallo {name}!"
+    assert get_cache_stats()["misses"] == misses
+
+
+def test_update_many_coalesces_writes(project_root: Path) -> None:
+    update_many("de", {"setting": "Einstellungen", "start.section_name": "Start"})
+    set_i18n_value("de", "end.goodbye", "Tschüss")
+    assert get_pending_writes() == ["de"]
+    assert get_catalog("de").get("end") == {"goodbye": "Tschüss"}
+
+    flush_writes()
+    assert get_pending_writes() == []
+    clear_edited_files()
+    clear_catalogs()
+    catalog = get_catalog("de")
+    assert catalog.get("setting") == "Einstellungen"
+    assert catalog.get("start.section_name") == "Start"
+    assert catalog.get("end.goodbye") == "Tschüss"
+    assert "# shown on the start page" in (
+        (project_root / "i18n" / "german.toml").read_text()
+    )
+
+
+def test_write_without_delay(project_root: Path) -> None:
+    configure_write_back(delay=0)
+    set_i18n_value("de", "setting", "Neu")
+    assert get_pending_writes() == []
+    assert 'setting = "Neu"' in (project_root / "i18n" / "german.toml").read_text()
+
+
+def test_update_many_invalid_key_path_fail(project_root: Path) -> None:
+    with pytest.raises(TypeError):
+        update_many("de", {"start.welcome": "Hallo", "setting.deep": "Tief"})
+    with pytest.raises(ValueError):
+        set_i18n_value("de", "start.*", "Hallo")
+    assert get_pending_writes() == []
+    assert get_catalog("de").get("start.welcome") == "Willkommen {name}!"
+    flush_writes()
+    assert (project_root / "i18n" / "german.toml").read_text() == EXAMPLE_TOML_STR
+
+
+def test_update_many_invalid_value_fail(project_root: Path) -> None:
+    with pytest.raises(TypeError):
+        update_many("de", {"aaa": "first", "bbb": None})
+    # nothing of the failed edit is written along with a later one
+    set_i18n_value("de", "setting", "Einstellungen")
+    flush_writes()
+    assert "aaa" not in (project_root / "i18n" / "german.toml").read_text()
+
+
+def test_set_i18n_value_replace_table(project_root: Path) -> None:
+    with pytest.raises(TypeError):
+        set_i18n_value("de", "start", "Start")
+    assert get_catalog("de").get("start.welcome") == "Willkommen {name}!"
+    set_i18n_value("de", "start", "Start", replace_tables=True)
+    assert get_catalog("de").get("start") == "Start"
+
+
+def test_write_swaps_in_a_new_catalog(project_root: Path) -> None:
+    set_i18n_value("de", "setting", "Einstellungen")
+    catalog = get_catalog("de")
+    flush_writes()
+    # the published catalog is replaced, not changed in place
+    assert get_catalog("de") is not catalog
+    assert get_catalog("de").get("setting") == "Einstellungen"
+    assert catalog.is_stale()
+
+
+@pytest.mark.project(
+    {"de": EXAMPLE_TOML_STR, "en": 'setting = "Settings"\n', "fr": 'setting = ""\n'}
+)
+def test_edited_documents_are_bounded(project_root: Path) -> None:
+    configure_write_back(delay=60.0, max_documents=1)
+    set_i18n_value("de", "setting", "Einstellungen")
+    set_i18n_value("en", "setting", "Preferences")
+    # both have pending edits, so both are kept
+    assert get_edited_languages() == ["de", "en"]
+    flush_writes()
+    assert get_edited_languages() == ["en"]
+    set_i18n_value("fr", "setting", "Paramètres")
+    flush_writes("fr")
+    assert get_edited_languages() == ["fr"]
+    assert "Einstellungen" in (project_root / "i18n" / "german.toml").read_text()
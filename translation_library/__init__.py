@@ -1,14 +1,17 @@
 """
 init for the translation_library package
+
+Logging is off by default. Set the `TRANSLATION_LIBRARY_LOG_LEVEL` (and
+optionally `TRANSLATION_LIBRARY_LOG_FILE`) environment variables, add a
+`[logging]` table to config.toml, or call `log_utils.enable_logging()` to
+turn it on.
 """
 
-import datetime
 import logging
 
-logging.basicConfig(
-    level=logging.DEBUG,
-    format="[%(levelname)s] (%(asctime)s) %(funcName)s(): %(message)s ['%(pathname)s:%(lineno)s']",
-    filename=f"logs/{datetime.datetime.now().strftime("%H:%M:%S_%m-%d-%y")}.log",
-)
+from translation_library.utils.log_utils import configure_logging_from_env
+
+logging.getLogger(__name__).addHandler(logging.NullHandler())
+configure_logging_from_env()
 
 logging.getLogger(__name__).debug("Starting session")
@@ -0,0 +1,124 @@
+"""
+A thin client for the translation server started with the `serve` command. It
+only depends on the standard library, so calling it does not pay for the
+imports and TOML parsing that the server keeps warm:
+
+$ python -m translation_library.cli.client -s /tmp/tl.sock translate en hello name=Blake
+"""
+
+import argparse
+import json
+import socket
+
+
+class TranslationServerError(RuntimeError):
+    """
+    Raised when the translation server answers a request with an error.
+    """
+
+    def __init__(self, message: str, error_type: str) -> None:
+        super().__init__(f"{error_type}: {message}")
+        self.error_type = error_type
+
+
+class TranslationClient:
+    """
+    A persistent connection to a translation server listening on a Unix socket.
+    """
+
+    def __init__(self, socket_path: str, timeout: float | None = 5.0) -> None:
+        self.socket_path = socket_path
+        self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._socket.settimeout(timeout)
+        self._socket.connect(socket_path)
+        self._reader = self._socket.makefile("rb")
+
+    def request(self, command: str, **fields: object) -> object:
+        """
+        Send a single request and wait for its response.
+
+        Args:
+            command (str): the server command, such as `translate`
+            **fields (object): the other fields of the request
+
+        Raises:
+            TranslationServerError: if the server could not handle the request
+            ConnectionError: if the server closed the connection
+
+        Returns:
+            object: the result of the request
+        """
+        line = json.dumps({"command": command, **fields}, ensure_ascii=False) + "\n"
+        self._socket.sendall(line.encode("utf-8"))
+        if not (raw_response := self._reader.readline()):
+            raise ConnectionError(f"'{self.socket_path}' closed the connection")
+
+        response = json.loads(raw_response)
+        if not response["ok"]:
+            raise TranslationServerError(response["error"], response["type"])
+        return response["result"]
+
+    def translate(self, language: str, key_path: str, **args: object) -> object:
+        return self.request(
+            "translate", language=language, key_path=key_path, args=args
+        )
+
+    def list(self, as_english: bool = False, casefold: bool = False) -> object:
+        return self.request("list", as_english=as_english, casefold=casefold)
+
+    def supported(self, language: str) -> bool:
+        return bool(self.request("supported", language=language))
+
+    def stats(self) -> object:
+        return self.request("stats")
+
+    def close(self) -> None:
+        self._reader.close()
+        self._socket.close()
+
+    def __enter__(self) -> "TranslationClient":
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        self.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Query a translation server.")
+    parser.add_argument("-s", "--socket", required=True, help="server socket path")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    translate_parser = subparsers.add_parser("translate")
+    translate_parser.add_argument("language")
+    translate_parser.add_argument("key_path")
+    translate_parser.add_argument("args", nargs="*", help="placeholders as k=v")
+
+    list_parser = subparsers.add_parser("list")
+    list_parser.add_argument("-e", "--english", action="store_true")
+
+    supported_parser = subparsers.add_parser("supported")
+    supported_parser.add_argument("language")
+
+    subparsers.add_parser("stats")
+
+    args = parser.parse_args()
+    with TranslationClient(args.socket) as client:
+        match args.command:
+            case "translate":
+                # Example: "name=Blake", adds {"name": "Blake"} to the dictionary
+                placeholder_args = {
+                    k: v for k, v in (arg.split("=") for arg in args.args)
+                }
+                print(
+                    client.translate(args.language, args.key_path, **placeholder_args)
+                )
+            case "list":
+                print(client.list(as_english=args.english))
+            case "supported":
+                print(client.supported(args.language))
+            case "stats":
+                print(json.dumps(client.stats(), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,12 +1,23 @@
-from typing import Annotated, List  # pyright: ignore[reportDeprecated]
+import json
+import sys
+from typing import Annotated, List, Optional  # pyright: ignore[reportDeprecated]
 
 import typer  # ignore-errors
 
+# The server, stream, compile, coverage, metrics and watch modules are only
+# imported by the commands that use them, so that the lookup commands start fast
+from translation_library.utils.catalog_utils import get_catalog
+from translation_library.utils.config_utils import (
+    get_all_language_codes,
+    get_language_file_path,
+)
 from translation_library.utils.translation_utils import (
+    format_i18n,
     get_i18n_obj,
     get_languages,
     get_languages_as_english_names,
     is_supported,
+    resolve_language,
 )
 
 cli = typer.Typer(no_args_is_help=True, suggest_commands=True)
@@ -43,16 +54,42 @@ def translate(
         key_path (Annotated[str, typer.Option): _description_
         args (Annotated[dict, typer.Option): _description_
     """
-    raw_i18n_str: str = str(get_i18n_obj(language.lower(), key_path))
-
+    # accept language names and aliases like "Deutsch" as well as codes
+    language = resolve_language(language) or language.lower()
     # Example: "name=Blake", adds {"name": "Blake"} to the dictionary
     if args:
         placeholder_args: dict[str, str] = {
             k: v for k, v in (arg.split("=") for arg in args)
         }
-        print(raw_i18n_str.format(**placeholder_args))
+        print(format_i18n(language, key_path, **placeholder_args))
     else:
-        print(raw_i18n_str)
+        print(str(get_i18n_obj(language, key_path)))
+
+
+@cli.command("translate-stream")
+def translate_stream_command(
+    record_format: Annotated[str, typer.Option("--format", "-f")] = "jsonl",
+    workers: Annotated[Optional[int], typer.Option("--workers", "-w")] = None,
+    batch_size: Annotated[Optional[int], typer.Option("--batch-size", "-b")] = None,
+):
+    """
+    Translate JSON Lines or TSV records read from stdin and write one result
+    per record to stdout. A record that fails is reported in its result line
+    instead of stopping the stream, and the exit status is 1 if any failed.
+
+    Args:
+        record_format (Annotated[str, typer.Option): `jsonl` or `tsv`
+        workers (Annotated[Optional[int], typer.Option): translate on this many processes
+        batch_size (Annotated[Optional[int], typer.Option): records read and written at a time, 1000 by default
+    """
+    from translation_library.cli.server import warm_catalogs
+    from translation_library.cli.stream import DEFAULT_BATCH_SIZE, translate_stream
+
+    if batch_size is None:
+        batch_size = DEFAULT_BATCH_SIZE
+    warm_catalogs()
+    if translate_stream(sys.stdin, sys.stdout, record_format, workers, batch_size):
+        raise typer.Exit(1)
 
 
 @cli.command()
@@ -65,7 +102,7 @@ def supported(
     Args:
         language (Annotated[str, typer.Option): _description_
     """
-    print(is_supported(language.lower()))
+    print(is_supported(resolve_language(language) or language.lower()))
 
 
 @cli.command()
@@ -80,4 +117,160 @@ def i18n_print(
         language (Annotated[str, typer.Option): _description_
         key_path (Annotated[str, typer.Option): _description_
     """
-    print(get_i18n_obj(language.lower(), key_path))
+    print(get_i18n_obj(resolve_language(language) or language.lower(), key_path))
+
+
+@cli.command()
+def serve(
+    socket_path: Annotated[Optional[str], typer.Option("--socket", "-s")] = None,
+    watch: Annotated[bool, typer.Option("--watch", "-w")] = False,
+    metrics: Annotated[bool, typer.Option("--metrics", "-m")] = False,
+):
+    """
+    Keep every language catalog loaded and answer JSON line requests on a Unix
+    socket, or on stdin/stdout if no socket path is given.
+
+    Args:
+        socket_path (Annotated[Optional[str], typer.Option): the Unix socket to listen on
+        watch (Annotated[bool, typer.Option): reload language files when they change
+        metrics (Annotated[bool, typer.Option): record metrics, served by the `stats` request
+    """
+    from translation_library.cli.server import (
+        serve_stdio,
+        serve_unix_socket,
+        warm_catalogs,
+    )
+    from translation_library.utils.metrics_utils import enable_metrics
+    from translation_library.utils.watch_utils import CatalogWatcher
+
+    if metrics:
+        enable_metrics()
+    warm_catalogs()
+    if watch:
+        CatalogWatcher().start()
+    if socket_path:
+        serve_unix_socket(socket_path)
+    else:
+        serve_stdio(sys.stdin, sys.stdout)
+
+
+@cli.command()
+def compile(
+    languages: Annotated[Optional[List[str]], typer.Option("--language", "-l")] = None,
+    check: Annotated[bool, typer.Option("--check", "-c")] = False,
+):
+    """
+    Compile language TOML files into binary catalogs that are memory-mapped
+    instead of parsed. Compiles every language in config.toml by default.
+
+    Args:
+        languages (Annotated[Optional[List[str]], typer.Option): the language codes to compile
+        check (Annotated[bool, typer.Option): only list stale catalogs, failing if there are any
+    """
+    from translation_library.utils.binary_catalog_utils import (
+        compile_catalog,
+        is_compiled_catalog_stale,
+    )
+
+    failed = False
+    for code in languages or get_all_language_codes():
+        code = resolve_language(code) or code.lower()
+        try:
+            if check:
+                if is_compiled_catalog_stale(get_language_file_path(code)):
+                    print(f"{code}: stale")
+                    failed = True
+                continue
+            print(f"{code}: {compile_catalog(code)}")
+        except Exception as e:
+            print(f"{code}: {type(e).__name__}: {e}", file=sys.stderr)
+            failed = True
+    if failed:
+        raise typer.Exit(1)
+
+
+@cli.command()
+def coverage(
+    languages: Annotated[Optional[List[str]], typer.Option("--language", "-l")] = None,
+    default_language: Annotated[Optional[str], typer.Option("--default", "-d")] = None,
+    summary: Annotated[bool, typer.Option("--summary", "-s")] = False,
+    fail_under: Annotated[float, typer.Option("--fail-under")] = 0.0,
+    strict: Annotated[bool, typer.Option("--strict")] = False,
+):
+    """
+    Print a JSON report of the keys each language is missing (or has extra)
+    compared to the default language, and of placeholder names that differ.
+    Exits with status 1 if a language fails to load or is under `--fail-under`.
+
+    Args:
+        languages (Annotated[Optional[List[str]], typer.Option): the language codes to report on
+        default_language (Annotated[Optional[str], typer.Option): the language code to compare against
+        summary (Annotated[bool, typer.Option): only count the findings instead of listing their keys
+        fail_under (Annotated[float, typer.Option): the least coverage percent each language needs
+        strict (Annotated[bool, typer.Option): also fail on any missing key or placeholder mismatch
+    """
+    from translation_library.utils.coverage_utils import get_coverage_report
+
+    report = get_coverage_report(
+        [resolve_language(code) or code.lower() for code in languages or []] or None,
+        (
+            (resolve_language(default_language) or default_language.lower())
+            if default_language
+            else None
+        ),
+        include_keys=not summary,
+    )
+    print(json.dumps(report, indent=2, ensure_ascii=False))
+
+    failed = False
+    for language_report in report["languages"].values():
+        if "error" in language_report:
+            failed = True
+        elif language_report["coverage"] < fail_under:
+            failed = True
+        elif strict and any(
+            language_report[finding]
+            for finding in ("missing", "placeholder_mismatches", "invalid_templates")
+        ):
+            failed = True
+    if failed:
+        raise typer.Exit(1)
+
+
+@cli.command()
+def stats(
+    socket_path: Annotated[Optional[str], typer.Option("--socket", "-s")] = None,
+    languages: Annotated[Optional[List[str]], typer.Option("--language", "-l")] = None,
+    key_paths: Annotated[Optional[List[str]], typer.Option("--key-path", "-k")] = None,
+    repeat: Annotated[int, typer.Option("--repeat", "-n")] = 1000,
+):
+    """
+    Print JSON cache stats and metrics (load, parse and lookup latencies per
+    language) of a running server, or else of loading the languages here and
+    looking up each key in each of them.
+
+    Args:
+        socket_path (Annotated[Optional[str], typer.Option): the Unix socket of a running server
+        languages (Annotated[Optional[List[str]], typer.Option): the language codes to load
+        key_paths (Annotated[Optional[List[str]], typer.Option): the keys to look up
+        repeat (Annotated[int, typer.Option): how many times to look up each key
+    """
+    if socket_path:
+        from translation_library.cli.client import TranslationClient
+
+        with TranslationClient(socket_path) as client:
+            print(json.dumps(client.stats(), indent=2))
+        return
+
+    from translation_library.cli.server import get_stats
+    from translation_library.utils.metrics_utils import enable_metrics
+
+    enable_metrics()
+    codes = [resolve_language(code) or code.lower() for code in languages or []]
+    for code in codes or get_all_language_codes():
+        get_catalog(code)
+    for code in codes or get_all_language_codes():
+        for key_path in key_paths or []:
+            for _ in range(repeat):
+                get_i18n_obj(code, key_path)
+    print(json.dumps(get_stats(), indent=2))
@@ -0,0 +1,216 @@
+"""
+A long-running translation server that keeps language catalogs warm and
+answers requests over a JSON line protocol, either on stdin/stdout or on a
+local Unix socket. Each request is a single JSON object on its own line:
+
+>>> {"command": "translate", "language": "en", "key_path": "hello", "args": {"name": "Blake"}}
+{"ok": true, "result": "Hello Blake"}
+
+Failed requests answer with `{"ok": false, "error": "...", "type": "..."}`
+and never stop the server.
+"""
+
+import json
+import logging
+import os
+import socketserver
+import stat
+from typing import Callable, TextIO
+
+from translation_library.utils.catalog_utils import get_cache_stats, preload_languages
+from translation_library.utils.metrics_utils import (
+    get_metrics_snapshot,
+    is_metrics_enabled,
+)
+from translation_library.utils.translation_utils import (
+    format_i18n,
+    get_i18n_obj,
+    get_languages,
+    get_languages_as_english_names,
+    is_supported,
+    resolve_language,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def _to_language_code(language: object) -> str:
+    # accept names and aliases like "Deutsch" as well as codes
+    return resolve_language(str(language)) or str(language).lower()
+
+
+def _translate(request: dict[str, object]) -> object:
+    language = _to_language_code(request["language"])
+    key_path = str(request["key_path"])
+    if args := request.get("args"):
+        return format_i18n(language, key_path, **dict(args))  # type: ignore
+    return get_i18n_obj(language, key_path)
+
+
+def _list(request: dict[str, object]) -> object:
+    casefold = bool(request.get("casefold", False))
+    if request.get("as_english"):
+        return get_languages_as_english_names(casefold=casefold)
+    return get_languages(casefold=casefold)
+
+
+def _supported(request: dict[str, object]) -> object:
+    return is_supported(_to_language_code(request["language"]))
+
+
+def get_stats() -> dict[str, object]:
+    """
+    Returns:
+        dict: the catalog cache stats as `cache`, and the recorded metrics as
+        `metrics` if metrics are enabled (see `metrics_utils`)
+    """
+    stats: dict[str, object] = {"cache": get_cache_stats()}
+    if is_metrics_enabled():
+        stats["metrics"] = get_metrics_snapshot()
+    return stats
+
+
+COMMANDS: dict[str, Callable[[dict[str, object]], object]] = {
+    "translate": _translate,
+    "list": _list,
+    "supported": _supported,
+    "stats": lambda _: get_stats(),
+    "ping": lambda _: "pong",
+}
+
+
+def handle_request(request: dict[str, object]) -> dict[str, object]:
+    """
+    Run a single decoded request and build its response.
+
+    Args:
+        request (dict): the decoded request, with a `command` key
+
+    Returns:
+        dict: `{"ok": True, "result": ...}` or `{"ok": False, "error": ...}`
+    """
+    try:
+        command = COMMANDS[str(request.get("command"))]
+    except KeyError:
+        logger.error("Unknown command in request '%s'", request)
+        return {
+            "ok": False,
+            "error": f"unknown command '{request.get('command')}'",
+            "type": "ValueError",
+        }
+
+    try:
+        return {"ok": True, "result": command(request)}
+    except Exception as e:
+        logger.exception("Could not handle request '%s' due to:", request)
+        return {"ok": False, "error": str(e), "type": type(e).__name__}
+
+
+def handle_line(line: str | bytes) -> str:
+    """
+    Decode a request line, run it and encode its response line. A line that
+    is not valid UTF-8 or JSON gets an error response like any failed request.
+
+    Args:
+        line (str | bytes): a single JSON-encoded request
+
+    Returns:
+        str: the JSON-encoded response, without a trailing newline
+    """
+    try:
+        request = json.loads(line)
+        if not isinstance(request, dict):
+            raise ValueError("request must be a JSON object")
+    except ValueError as e:
+        logger.error("Could not decode request line '%s'", line)
+        response: dict[str, object] = {
+            "ok": False,
+            "error": str(e),
+            "type": type(e).__name__,
+        }
+    else:
+        response = handle_request(request)
+    return json.dumps(response, ensure_ascii=False, default=str)
+
+
+def warm_catalogs() -> None:
+    """
+    Load the catalog of every language in config.toml in parallel, so that
+    the first request for a language does not pay for parsing its file.
+    """
+    preload_languages()
+
+
+def serve_stdio(in_stream: TextIO, out_stream: TextIO) -> None:
+    """
+    Answer one request per line read from `in_stream` until it is closed.
+
+    Args:
+        in_stream (TextIO): where request lines are read from
+        out_stream (TextIO): where response lines are written to
+    """
+    for line in in_stream:
+        if not line.strip():
+            continue
+        out_stream.write(handle_line(line) + "\n")
+        out_stream.flush()
+
+
+class _TranslationRequestHandler(socketserver.StreamRequestHandler):
+    def handle(self) -> None:
+        for raw_line in self.rfile:
+            if not raw_line.strip():
+                continue
+            response = handle_line(raw_line) + "\n"
+            self.wfile.write(response.encode("utf-8"))
+            self.wfile.flush()
+
+
+class TranslationServer(socketserver.ThreadingUnixStreamServer):
+    """
+    A threaded Unix socket server where each connection can send any number
+    of request lines.
+    """
+
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, socket_path: str) -> None:
+        """
+        Args:
+            socket_path (str): the file path of the Unix socket to listen on.
+            A socket left behind by a previous server is replaced.
+
+        Raises:
+            FileExistsError: if something other than a socket is at the path
+        """
+        try:
+            mode = os.lstat(socket_path).st_mode
+        except FileNotFoundError:
+            pass
+        else:
+            # never delete a regular file given by mistake, e.g. config.toml
+            if not stat.S_ISSOCK(mode):
+                raise FileExistsError(f"'{socket_path}' exists and is not a socket")
+            os.unlink(socket_path)
+        super().__init__(socket_path, _TranslationRequestHandler)
+
+    def server_close(self) -> None:
+        super().server_close()
+        if os.path.exists(str(self.server_address)):
+            os.unlink(str(self.server_address))
+
+
+def serve_unix_socket(socket_path: str) -> None:
+    """
+    Answer requests on a Unix socket until the process is interrupted.
+
+    Args:
+        socket_path (str): the file path of the Unix socket to listen on
+    """
+    with TranslationServer(socket_path) as server:
+        logger.info("Serving translations on '%s'", socket_path)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            logger.info("Stopped serving translations on '%s'", socket_path)
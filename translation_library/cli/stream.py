@@ -0,0 +1,177 @@
+"""
+Bulk translation of records streamed on stdin, for build pipelines that
+translate many (language, key, args) triples in a single process. Records are
+either JSON Lines:
+
+>>> {"language": "en", "key_path": "hello", "args": {"name": "Blake"}}
+{"line": 1, "ok": true, "result": "Hello Blake"}
+
+or tab-separated values, with placeholder args as `name=value` fields:
+
+>>> en	hello	name=Blake
+1	ok	Hello Blake
+
+Every output record carries the line number of its input record. A record
+that fails is reported in the output (`"ok": false` or `error`) and never
+stops the stream.
+"""
+
+import json
+import logging
+from itertools import islice
+from typing import TYPE_CHECKING, Callable, Iterable, TextIO
+
+from translation_library.cli.server import handle_request
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
+logger = logging.getLogger(__name__)
+
+RECORD_FORMATS = ("jsonl", "tsv")
+
+# How many records are read, translated and written at a time. Bounds memory
+# no matter how long the stream is
+DEFAULT_BATCH_SIZE = 1000
+
+
+def _translate_record(record: dict[str, object]) -> dict[str, object]:
+    return handle_request({**record, "command": "translate"})
+
+
+def _translate_jsonl_line(numbered_line: tuple[int, str]) -> tuple[str, bool]:
+    line_number, line = numbered_line
+    try:
+        record = json.loads(line)
+        if not isinstance(record, dict):
+            raise ValueError("record must be a JSON object")
+    except ValueError as e:
+        logger.error("Could not decode record line %d '%s'", line_number, line)
+        response: dict[str, object] = {
+            "ok": False,
+            "error": str(e),
+            "type": type(e).__name__,
+        }
+    else:
+        response = _translate_record(record)
+    response = {"line": line_number, **response}
+    return json.dumps(response, ensure_ascii=False, default=str), bool(response["ok"])
+
+
+def _escape_tsv(value: str) -> str:
+    return (
+        value.replace("\\", "\\\\")
+        .replace("\t", "\\t")
+        .replace("\n", "\\n")
+        .replace("\r", "\\r")
+    )
+
+
+def _translate_tsv_line(numbered_line: tuple[int, str]) -> tuple[str, bool]:
+    line_number, line = numbered_line
+    fields = line.rstrip("\r\n").split("\t")
+    if len(fields) < 2:
+        response: dict[str, object] = {
+            "ok": False,
+            "error": "record must have a language and a key path",
+            "type": "ValueError",
+        }
+    else:
+        # Example: "name=Blake", adds {"name": "Blake"} to the args
+        args = {
+            name: value
+            for name, _, value in (field.partition("=") for field in fields[2:])
+            if name
+        }
+        response = _translate_record(
+            {"language": fields[0], "key_path": fields[1], "args": args}
+        )
+
+    if response["ok"]:
+        result = response["result"]
+        text = result if isinstance(result, str) else json.dumps(result, default=str)
+        return f"{line_number}\tok\t{_escape_tsv(text)}", True
+    error = f"{response['type']}: {response['error']}"
+    return f"{line_number}\terror\t{_escape_tsv(error)}", False
+
+
+TRANSLATORS: dict[str, Callable[[tuple[int, str]], tuple[str, bool]]] = {
+    "jsonl": _translate_jsonl_line,
+    "tsv": _translate_tsv_line,
+}
+
+
+def _numbered_records(in_stream: Iterable[str]) -> Iterable[tuple[int, str]]:
+    for line_number, line in enumerate(in_stream, start=1):
+        if line.strip():
+            yield line_number, line
+
+
+def translate_stream(
+    in_stream: Iterable[str],
+    out_stream: TextIO,
+    record_format: str = "jsonl",
+    workers: int | None = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> int:
+    """
+    Translate every record read from `in_stream` and write one result per
+    record to `out_stream`, in input order. Records are handled `batch_size`
+    at a time, and the output is flushed after each batch.
+
+    Args:
+        in_stream (Iterable[str]): where record lines are read from
+        out_stream (TextIO): where result lines are written to
+        record_format (str, optional): `jsonl` or `tsv`. Defaults to `jsonl`.
+        workers (int | None, optional): translate on a pool of this many
+        processes. Defaults to translating in this process.
+        batch_size (int, optional): records handled at a time. Defaults to 1000.
+
+    Raises:
+        ValueError: if the record format is unknown
+
+    Returns:
+        int: the number of records that could not be translated
+    """
+    try:
+        translate_line = TRANSLATORS[record_format]
+    except KeyError as e:
+        raise ValueError(
+            f"unknown record format '{record_format}', expected one of {RECORD_FORMATS}"
+        ) from e
+
+    pool: "Executor | None" = None
+    if workers and workers > 1:
+        # imported here since they pull in multiprocessing, which would slow
+        # down the startup of every CLI command
+        import multiprocessing
+        from concurrent.futures import ProcessPoolExecutor
+
+        # forked workers inherit the catalogs already loaded in this process,
+        # where fork is unavailable each worker loads them on first use
+        context = (
+            multiprocessing.get_context("fork")
+            if "fork" in multiprocessing.get_all_start_methods()
+            else None
+        )
+        pool = ProcessPoolExecutor(max_workers=workers, mp_context=context)
+    failed = 0
+    records = _numbered_records(in_stream)
+    try:
+        while batch := list(islice(records, batch_size)):
+            if pool is not None:
+                chunk_size = max(1, len(batch) // (4 * (workers or 1)))
+                results = pool.map(translate_line, batch, chunksize=chunk_size)
+            else:
+                results = map(translate_line, batch)
+            for output_line, ok in results:
+                out_stream.write(output_line + "\n")
+                failed += not ok
+            out_stream.flush()
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+    if failed:
+        logger.warning("Could not translate %d records", failed)
+    return failed
@@ -0,0 +1,156 @@
+import asyncio
+import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Annotated
+
+from translation_library.utils import translation_utils
+from translation_library.utils.binary_catalog_utils import MappedCatalog
+from translation_library.utils.catalog_utils import Catalog, get_fallback_catalog
+from translation_library.utils.config_utils import get_all_language_codes
+from translation_library.utils.validation_utils import MinLength, validate_call
+
+logger = logging.getLogger(__name__)
+
+# Language files are read and parsed on these threads so that the event loop
+# never blocks on them. Created on first use
+_executor: ThreadPoolExecutor | None = None
+_executor_lock = threading.Lock()
+
+# The load in flight for each language. Every coroutine (on any event loop)
+# that needs a language while it loads waits on the same future
+_loads: dict[str, Future[Catalog | MappedCatalog]] = {}
+_loads_lock = threading.Lock()
+
+
+def set_executor(executor: ThreadPoolExecutor | None) -> None:
+    """
+    Use a given thread pool to load language files, e.g. to bound how many
+    files are parsed at once.
+
+    Args:
+        executor (ThreadPoolExecutor | None): the pool to use, or None for
+        a default pool
+    """
+    global _executor
+    with _executor_lock:
+        _executor = executor
+
+
+def shutdown_executor() -> None:
+    """
+    Wait for in-flight loads and shut down the thread pool that loads
+    language files. A new default pool is created on the next load.
+    """
+    global _executor
+    with _executor_lock:
+        executor, _executor = _executor, None
+    if executor is not None:
+        executor.shutdown()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(thread_name_prefix="translation-library-aio")
+        return _executor
+
+
+def _submit_load(language: str) -> Future[Catalog | MappedCatalog]:
+    with _loads_lock:
+        if (future := _loads.get(language)) is not None:
+            return future
+        future = _get_executor().submit(get_fallback_catalog, language)
+        _loads[language] = future
+
+    def forget_load(done_future: Future[Catalog | MappedCatalog]) -> None:
+        with _loads_lock:
+            if _loads.get(language) is done_future:
+                del _loads[language]
+
+    future.add_done_callback(forget_load)
+    return future
+
+
+@validate_call
+async def load_language(
+    language: Annotated[str, MinLength(1)],
+) -> Catalog | MappedCatalog:
+    """
+    Load the catalog of a language (and of its fallback chain) on a worker
+    thread without blocking the event loop. Concurrent calls for the same
+    language share a single load. A language that is already loaded costs a
+    hop to the thread, as checking that its files are unchanged reads from
+    disk as well.
+
+    Args:
+        language (str): the code of the language to load
+
+    Raises:
+        PathAccessError: if the language is not listed in config.toml
+        FileNotFoundError: if the language file does not exist
+
+    Returns:
+        Catalog | MappedCatalog: the catalog that lookups of the language use
+    """
+    return await asyncio.wrap_future(_submit_load(language))
+
+
+@validate_call
+async def get_i18n_obj(
+    language: Annotated[str, MinLength(1)], key_path: Annotated[str, MinLength(1)]
+) -> object:
+    """
+    The async equivalent of `translation_utils.get_i18n_obj()`. The lookup
+    runs on the same threads as `load_language()`, so it never blocks the
+    event loop on reading, checking or merging language files.
+
+    Args:
+        language (str): the name of the language TOML dict to get value from
+        key_path (str): the path to the key in the specified language TOML dict
+
+    Raises:
+        PathAccessError: if the key path does not exist in the language file
+
+    Returns:
+        object: the value of a given key
+    """
+    return await asyncio.wrap_future(
+        _get_executor().submit(
+            translation_utils.get_i18n_obj.raw_function, language, key_path
+        )
+    )
+
+
+async def load_languages(
+    codes: list[str] | None = None,
+) -> dict[str, Catalog | MappedCatalog]:
+    """
+    Load the catalogs of many languages concurrently. A language that fails
+    to load is logged and left out.
+
+    Args:
+        codes (list[str] | None, optional): the language codes to load.
+        Defaults to every language in config.toml.
+
+    Returns:
+        dict[str, Catalog | MappedCatalog]: each loaded language code and its catalog
+    """
+    language_codes: list[str] = (
+        codes
+        if codes is not None
+        else await asyncio.wrap_future(_get_executor().submit(get_all_language_codes))
+    )
+    results = await asyncio.gather(
+        *(load_language.raw_function(code) for code in language_codes),
+        return_exceptions=True,
+    )
+
+    catalogs: dict[str, Catalog | MappedCatalog] = {}
+    for code, result in zip(language_codes, results):
+        if isinstance(result, BaseException):
+            logger.error("Could not preload the catalog of '%s'", code, exc_info=result)
+        else:
+            catalogs[code] = result
+    return catalogs
@@ -0,0 +1,540 @@
+import json
+import logging
+import mmap
+import os
+import struct
+import tempfile
+from pathlib import Path
+from typing import Any
+
+from translation_library.utils.catalog_utils import Catalog, get_array_item
+from translation_library.utils.config_utils import (
+    get_all_language_codes,
+    get_language_file_path,
+)
+from translation_library.utils.template_utils import CompiledTemplate
+from translation_library.utils.toml_utils import (
+    get_value_from_toml_dict,
+    path_access_error,
+)
+
+logger = logging.getLogger(__name__)
+
+# Layout of a compiled catalog, all integers little-endian:
+#   header: magic, format version, entry count, source mtime_ns, source size
+#   index:  one fixed-size entry per key, sorted by the UTF-8 bytes of the key
+#   string table: the UTF-8 bytes of every key and value the index points at
+COMPILED_CATALOG_SUFFIX = ".tlcat"
+FORMAT_VERSION = 1
+_MAGIC = b"TLCATLOG"
+_HEADER = struct.Struct("<8sIIqq")
+# key offset, key length, value offset, value length, value kind
+_ENTRY = struct.Struct("<IIIIB3x")
+
+# A value is either a str, a table (rebuilt from the keys under it) or any
+# other TOML value stored as JSON
+_KIND_STR = 0
+_KIND_TABLE = 1
+_KIND_JSON = 2
+
+
+def get_compiled_catalog_path(file_path: str | Path) -> Path:
+    """
+    Args:
+        file_path (str | Path): the path of a language TOML file
+
+    Returns:
+        Path: where the compiled catalog of the file is written, next to it
+    """
+    return Path(file_path).with_suffix(COMPILED_CATALOG_SUFFIX)
+
+
+def _encode_value(value: object) -> tuple[int, bytes]:
+    if isinstance(value, str):
+        return _KIND_STR, value.encode("utf-8")
+    if isinstance(value, dict):
+        return _KIND_TABLE, b""
+    return _KIND_JSON, json.dumps(value, ensure_ascii=False).encode("utf-8")
+
+
+def build_compiled_catalog(
+    entries: dict[str, object], source_path: str | Path
+) -> bytes:
+    """
+    Encode flattened catalog entries in the compiled catalog format.
+
+    Args:
+        entries (dict): dotted key paths and their values, as in `Catalog.entries`
+        source_path (str | Path): the language TOML file the entries came from
+
+    Raises:
+        TypeError: if a value cannot be stored, such as a TOML date
+
+    Returns:
+        bytes: the compiled catalog
+    """
+    items = sorted(
+        (key_path.encode("utf-8"), _encode_value(value))
+        for key_path, value in entries.items()
+    )
+
+    strings_offset = _HEADER.size + len(items) * _ENTRY.size
+    strings = bytearray()
+    index = bytearray()
+    # repeated values are only stored once in the string table
+    value_offsets: dict[bytes, int] = {}
+    for key, (kind, value) in items:
+        key_offset = strings_offset + len(strings)
+        strings += key
+        if (value_offset := value_offsets.get(value)) is None:
+            value_offset = value_offsets[value] = strings_offset + len(strings)
+            strings += value
+        index += _ENTRY.pack(key_offset, len(key), value_offset, len(value), kind)
+
+    source_stat = os.stat(source_path)
+    header = _HEADER.pack(
+        _MAGIC,
+        FORMAT_VERSION,
+        len(items),
+        source_stat.st_mtime_ns,
+        source_stat.st_size,
+    )
+    return header + index + strings
+
+
+def write_compiled_catalog(
+    entries: dict[str, object], source_path: str | Path, output_path: str | Path
+) -> Path:
+    """
+    Write flattened catalog entries to a compiled catalog file. The file is
+    written to a temp file and renamed into place, so processes that have the
+    old file mapped keep reading it unharmed.
+
+    Args:
+        entries (dict): dotted key paths and their values, as in `Catalog.entries`
+        source_path (str | Path): the language TOML file the entries came from
+        output_path (str | Path): where to write the compiled catalog
+
+    Raises:
+        TypeError: if a value cannot be stored, such as a TOML date
+
+    Returns:
+        Path: the path of the compiled catalog
+    """
+    output_path = Path(output_path)
+    compiled_catalog = build_compiled_catalog(entries, source_path)
+
+    file_descriptor, tmp_path = tempfile.mkstemp(
+        prefix=f".{output_path.name}.", dir=output_path.parent
+    )
+    try:
+        with os.fdopen(file_descriptor, "wb") as file:
+            file.write(compiled_catalog)
+        os.replace(tmp_path, output_path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+    logger.debug("Compiled '%s' into '%s'", source_path, output_path)
+    return output_path
+
+
+def compile_catalog(language: str) -> Path:
+    """
+    Compile the language TOML file of a language from config.toml into a
+    binary catalog next to it.
+
+    Args:
+        language (str): the code of the language to compile
+
+    Raises:
+        PathAccessError: if the language is not listed in config.toml
+        FileNotFoundError: if the language file does not exist
+        TypeError: if a value cannot be stored, such as a TOML date
+
+    Returns:
+        Path: the path of the compiled catalog
+    """
+    file_path = get_language_file_path(language)
+    catalog = Catalog.from_toml_file(language, file_path)
+    return write_compiled_catalog(
+        catalog.entries, file_path, get_compiled_catalog_path(file_path)
+    )
+
+
+def compile_catalogs() -> dict[str, Path]:
+    """
+    Compile the language file of every language in config.toml.
+
+    Returns:
+        dict[str, Path]: each language code and the path of its compiled catalog
+    """
+    return {code: compile_catalog(code) for code in get_all_language_codes()}
+
+
+def _read_header(buffer: object) -> tuple[int, tuple[int, int]]:
+    try:
+        magic, version, count, mtime_ns, size = _HEADER.unpack_from(buffer)  # type: ignore
+    except struct.error as e:
+        raise ValueError("truncated compiled catalog header") from e
+    if magic != _MAGIC:
+        raise ValueError("not a compiled catalog")
+    if version != FORMAT_VERSION:
+        raise ValueError(f"unsupported compiled catalog version {version}")
+    return count, (mtime_ns, size)
+
+
+def is_compiled_catalog_stale(file_path: str | Path) -> bool:
+    """
+    Checks whether the compiled catalog of a language TOML file is missing,
+    unreadable or was compiled from an older version of the file.
+
+    Args:
+        file_path (str | Path): the path of the language TOML file
+
+    Returns:
+        bool: `True` if the file needs to be compiled again
+    """
+    try:
+        with open(get_compiled_catalog_path(file_path), "rb") as file:
+            _, signature = _read_header(file.read(_HEADER.size))
+        source_stat = os.stat(file_path)
+    except (OSError, ValueError):
+        return True
+    return (source_stat.st_mtime_ns, source_stat.st_size) != signature
+
+
+class MappedCatalog:
+    """
+    A read-only catalog backed by a compiled catalog in shared memory, either a
+    memory-mapped compiled catalog file or a shared memory segment. Keys are
+    found with a binary search over the sorted index and values are decoded
+    straight from the buffer, so nothing is parsed up front and every process
+    that maps the buffer shares the same physical pages.
+
+    It can be used wherever a `Catalog` is, with the same lookup methods.
+    """
+
+    __slots__ = (
+        "language",
+        "file_path",
+        "compiled_path",
+        "signature",
+        "compiled_signature",
+        "templates",
+        "_buffer",
+        "_view",
+        "_count",
+        "_values",
+    )
+
+    def __init__(
+        self,
+        language: str,
+        file_path: str | Path,
+        buffer: "mmap.mmap | memoryview",
+        compiled_path: str | Path | None = None,
+        compiled_signature: tuple[int, int] | None = None,
+    ) -> None:
+        """
+        Args:
+            language (str): the language code the buffer belongs to
+            file_path (str | Path): the path of the source language TOML file
+            buffer (mmap.mmap | memoryview): the bytes of the compiled catalog
+            compiled_path (str | Path | None, optional): the compiled catalog
+            file the buffer maps, if any. Defaults to None.
+            compiled_signature (tuple[int, int] | None, optional): the inode and
+            mtime of `compiled_path` when it was mapped. Defaults to None.
+
+        Raises:
+            ValueError: if the buffer is truncated or not a compiled catalog
+        """
+        self.language = language
+        self.file_path = Path(file_path)
+        self.compiled_path = Path(compiled_path) if compiled_path else None
+        self.compiled_signature = compiled_signature
+        self._count, self.signature = _read_header(buffer)
+        if len(buffer) < _HEADER.size + self._count * _ENTRY.size:
+            raise ValueError("truncated compiled catalog index")
+        self.templates: dict[str, CompiledTemplate] = {}
+        self._buffer = buffer
+        self._view = memoryview(buffer)
+        self._values: dict[str, object] = {}
+
+    @classmethod
+    def from_compiled_file(
+        cls, language: str, file_path: str | Path, compiled_path: str | Path
+    ) -> "MappedCatalog":
+        """
+        Memory-map a compiled catalog file.
+
+        Args:
+            language (str): the language code the file belongs to
+            file_path (str | Path): the path of the source language TOML file
+            compiled_path (str | Path): the path of the compiled catalog
+
+        Raises:
+            OSError: if the compiled catalog cannot be opened or mapped
+            ValueError: if the compiled catalog is empty, truncated or not one
+
+        Returns:
+            MappedCatalog: the mapped catalog
+        """
+        with open(compiled_path, "rb") as file:
+            compiled_stat = os.fstat(file.fileno())
+            buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            return cls(
+                language,
+                file_path,
+                buffer,
+                compiled_path,
+                (compiled_stat.st_ino, compiled_stat.st_mtime_ns),
+            )
+        except ValueError:
+            buffer.close()
+            raise
+
+    def _entry(self, idx: int) -> tuple[int, int, int, int, int]:
+        return _ENTRY.unpack_from(self._view, _HEADER.size + idx * _ENTRY.size)
+
+    def _key(self, idx: int) -> bytes:
+        key_offset, key_len, _, _, _ = self._entry(idx)
+        return self._view[key_offset : key_offset + key_len].tobytes()
+
+    def _lower_bound(self, key: bytes) -> int:
+        low, high = 0, self._count
+        while low < high:
+            mid = (low + high) // 2
+            if self._key(mid) < key:
+                low = mid + 1
+            else:
+                high = mid
+        return low
+
+    def _find(self, key_path: str) -> int:
+        key = key_path.encode("utf-8")
+        idx = self._lower_bound(key)
+        if idx < self._count and self._key(idx) == key:
+            return idx
+        return -1
+
+    def _decode(self, idx: int) -> object:
+        key_offset, key_len, value_offset, value_len, kind = self._entry(idx)
+        value_view = self._view[value_offset : value_offset + value_len]
+        if kind == _KIND_STR:
+            return str(value_view, "utf-8")
+        if kind == _KIND_JSON:
+            return json.loads(str(value_view, "utf-8"))
+        return self._build_table(
+            self._view[key_offset : key_offset + key_len].tobytes()
+        )
+
+    def _build_table(self, key: bytes) -> dict[str, object]:
+        # every key under a table sorts right after it, in one contiguous range
+        prefix = key + b"." if key else b""
+        table: dict[str, Any] = {}
+        for idx in range(self._lower_bound(prefix), self._count):
+            key_offset, key_len, value_offset, value_len, kind = self._entry(idx)
+            child_key = self._view[key_offset : key_offset + key_len].tobytes()
+            if not child_key.startswith(prefix):
+                break
+            *parents, name = child_key[len(prefix) :].decode("utf-8").split(".")
+            node = table
+            for parent in parents:
+                node = node.setdefault(parent, {})
+            if kind == _KIND_TABLE:
+                node.setdefault(name, {})
+            elif kind == _KIND_STR:
+                node[name] = str(
+                    self._view[value_offset : value_offset + value_len], "utf-8"
+                )
+            else:
+                node[name] = json.loads(
+                    str(self._view[value_offset : value_offset + value_len], "utf-8")
+                )
+        return table
+
+    @property
+    def toml_dict(self) -> dict[str, object]:
+        """
+        Returns:
+            dict: the whole catalog rebuilt as a nested TOML-like dict
+        """
+        return self._build_table(b"")
+
+    def get_bytes(self, key_path: str) -> memoryview:
+        """
+        Get the raw UTF-8 bytes of a str value without copying them out of
+        the mapping.
+
+        Args:
+            key_path (str): the path to the key, such as `start.welcome`
+
+        Raises:
+            PathAccessError: if the key path does not exist in the catalog
+            TypeError: if the value of the key path is not a str
+
+        Returns:
+            memoryview: a read-only view of the value in the mapping
+        """
+        if (idx := self._find(key_path)) < 0:
+            raise self._missing_key_error(key_path)
+        _, _, value_offset, value_len, kind = self._entry(idx)
+        if kind != _KIND_STR:
+            raise TypeError(f"'{key_path}' in '{self.file_path}' is not a str")
+        return self._view[value_offset : value_offset + value_len]
+
+    def get(self, key_path: str) -> object:
+        """
+        Get the value of a dotted key path from the catalog.
+
+        Args:
+            key_path (str): the path to the key, such as `start.welcome`
+
+        Raises:
+            PathAccessError: if the key path does not exist in the catalog
+
+        Returns:
+            object: the value associated with the given key path
+        """
+        try:
+            return self._values[key_path]
+        except KeyError:
+            pass
+
+        if (idx := self._find(key_path)) >= 0:
+            value = self._values[key_path] = self._decode(idx)
+            return value
+
+        # wildcard specs cannot be looked up in the index, so defer to glom
+        if "*" in key_path:
+            return get_value_from_toml_dict(self.toml_dict, key_path)
+        return get_array_item(self, key_path)
+
+    def _missing_key_error(self, key_path: str) -> Exception:
+        parts = key_path.split(".")
+        part_idx = next(
+            idx for idx in range(len(parts)) if ".".join(parts[: idx + 1]) not in self
+        )
+        return path_access_error(key_path, part_idx)
+
+    def get_template(self, key_path: str) -> CompiledTemplate:
+        """
+        Get the compiled placeholder template of a string value. Templates are
+        compiled on first use and kept for the lifetime of the catalog.
+
+        Args:
+            key_path (str): the path to the key, such as `start.welcome`
+
+        Raises:
+            PathAccessError: if the key path does not exist in the catalog
+            TypeError: if the value of the key path is not a str
+
+        Returns:
+            CompiledTemplate: the compiled template of the value
+        """
+        try:
+            return self.templates[key_path]
+        except KeyError:
+            pass
+
+        value = self.get(key_path)
+        if not isinstance(value, str):
+            logger.error("'%s' in '%s' is not a str", key_path, self.file_path)
+            raise TypeError(f"'{key_path}' in '{self.file_path}' is not a str")
+        template = self.templates[key_path] = CompiledTemplate(value)
+        return template
+
+    def is_stale(self) -> bool:
+        """
+        Checks whether the source file changed since the catalog was compiled,
+        or the compiled catalog file was replaced since it was mapped.
+
+        Returns:
+            bool: `True` if either file changed or was removed
+        """
+        try:
+            source_stat = os.stat(self.file_path)
+            if (source_stat.st_mtime_ns, source_stat.st_size) != self.signature:
+                return True
+            if self.compiled_path is None:
+                return False
+            compiled_stat = os.stat(self.compiled_path)
+        except FileNotFoundError:
+            return True
+        return (
+            compiled_stat.st_ino,
+            compiled_stat.st_mtime_ns,
+        ) != self.compiled_signature
+
+    @property
+    def nbytes(self) -> int:
+        """
+        Returns:
+            int: the size of the compiled catalog in bytes
+        """
+        return len(self._buffer)
+
+    def close(self) -> None:
+        """
+        Release the buffer, unmapping it if it was mapped from a compiled
+        catalog file. Values already looked up stay usable. While views from
+        `get_bytes()` are alive, the mapping is only unmapped once they are
+        garbage collected.
+        """
+        self._view.release()
+        try:
+            if isinstance(self._buffer, mmap.mmap):
+                self._buffer.close()
+            else:
+                self._buffer.release()
+        except BufferError:
+            logger.debug(
+                "Views of '%s' are still in use, deferring its unmapping",
+                self.compiled_path or self.language,
+            )
+
+    def __contains__(self, key_path: object) -> bool:
+        return isinstance(key_path, str) and (
+            key_path in self._values or self._find(key_path) >= 0
+        )
+
+    def __len__(self) -> int:
+        return self._count
+
+
+def load_compiled_catalog(language: str, file_path: str | Path) -> MappedCatalog | None:
+    """
+    Map the compiled catalog of a language TOML file if it exists and is up
+    to date with the file.
+
+    Args:
+        language (str): the language code the file belongs to
+        file_path (str | Path): the path of the language TOML file
+
+    Returns:
+        MappedCatalog | None: the mapped catalog, or None if the file has to
+        be parsed instead
+    """
+    compiled_path = get_compiled_catalog_path(file_path)
+    try:
+        catalog = MappedCatalog.from_compiled_file(language, file_path, compiled_path)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError):
+        logger.exception("Could not map '%s' due to:", compiled_path)
+        return None
+
+    if catalog.is_stale():
+        logger.warning(
+            "'%s' is older than '%s', run `compile` to update it",
+            compiled_path,
+            file_path,
+        )
+        catalog.close()
+        return None
+    logger.debug(
+        "Mapped %d keys for '%s' from '%s'", len(catalog), language, compiled_path
+    )
+    return catalog
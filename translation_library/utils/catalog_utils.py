@@ -0,0 +1,865 @@
+import logging
+import os
+import sys
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from translation_library.utils import metrics_utils
+from translation_library.utils.config_utils import (
+    get_all_language_codes,
+    get_config,
+    get_fallback_chain,
+    get_language_code_set,
+    get_language_file_path,
+)
+from translation_library.utils.template_utils import CompiledTemplate
+from translation_library.utils.toml_utils import (
+    get_value_from_toml_dict,
+    path_access_error,
+    serialize_toml_dict,
+    walk_key_path,
+)
+
+if TYPE_CHECKING:
+    from translation_library.utils.binary_catalog_utils import MappedCatalog
+
+logger = logging.getLogger(__name__)
+
+
+def flatten_toml_dict(
+    toml_dict: dict[str, object], prefix: str = ""
+) -> dict[str, object]:
+    """
+    Flatten a nested TOML-like dict into a single dict keyed by dotted key
+    paths. Tables are kept as entries too, so both `start` and
+    `start.welcome` can be looked up:
+
+    >>> {"start": {...}, "start.welcome": "Welcome {name}!"}
+
+    Args:
+        toml_dict (dict): the TOML-like dict to flatten
+        prefix (str, optional): the key path of `toml_dict` itself. Defaults to "".
+
+    Returns:
+        dict: a flat mapping of every dotted key path to its value
+    """
+    flat_dict: dict[str, object] = {}
+    for key, value in toml_dict.items():
+        key_path = f"{prefix}.{key}" if prefix else str(key)
+        flat_dict[key_path] = value
+        if isinstance(value, dict):
+            flat_dict.update(flatten_toml_dict(value, key_path))
+    return flat_dict
+
+
+def merge_toml_dicts(
+    base: dict[str, object], override: dict[str, object]
+) -> dict[str, object]:
+    """
+    Deep-merge two TOML-like dicts into a new dict. Values in `override` win,
+    and tables that exist in both are merged key by key.
+
+    Args:
+        base (dict): the TOML-like dict to merge into
+        override (dict): the TOML-like dict whose values take precedence
+
+    Returns:
+        dict: the merged TOML-like dict
+    """
+    merged = dict(base)
+    for key, value in override.items():
+        base_value = merged.get(key)
+        if isinstance(value, dict) and isinstance(base_value, dict):
+            merged[key] = merge_toml_dicts(base_value, value)
+        else:
+            merged[key] = value
+    return merged
+
+
+def get_array_item(catalog: "Catalog | MappedCatalog", key_path: str) -> object:
+    """
+    Get the value of a key path that indexes into an array, such as
+    `items.0.name`. Arrays are not flattened into catalogs, so the path is
+    walked from the longest part of it that is in the catalog.
+
+    Args:
+        catalog (Catalog | MappedCatalog): the catalog to get the value from
+        key_path (str): the path to the key, which is not in the catalog itself
+
+    Raises:
+        PathAccessError: if the key path does not exist in the catalog
+
+    Returns:
+        object: the value associated with the given key path
+    """
+    parts = key_path.split(".")
+    for part_idx in range(len(parts) - 1, 0, -1):
+        prefix = ".".join(parts[:part_idx])
+        if prefix in catalog:
+            value = catalog.get(prefix)
+            if not isinstance(value, list):
+                break
+            return walk_key_path(value, key_path, start_idx=part_idx)
+    else:
+        part_idx = 0
+    raise path_access_error(key_path, part_idx)
+
+
+def _get_file_signature(file_path: Path) -> tuple[int, int]:
+    stat_result = os.stat(file_path)
+    return stat_result.st_ino, stat_result.st_mtime_ns
+
+
+class Catalog:
+    """
+    An in-memory view of a single language TOML file. The file is parsed once
+    and flattened into a dotted-key hash map, so every lookup is a single dict
+    access instead of a file parse plus a `glom` walk.
+    """
+
+    __slots__ = (
+        "language",
+        "file_path",
+        "signature",
+        "toml_dict",
+        "entries",
+        "templates",
+        "_nbytes",
+    )
+
+    def __init__(
+        self,
+        language: str,
+        file_path: Path,
+        toml_dict: dict[str, object],
+        signature: tuple[int, int] | None = None,
+        entries: dict[str, object] | None = None,
+    ) -> None:
+        self.language = language
+        self.file_path = file_path
+        self.signature = signature
+        self.toml_dict = toml_dict
+        self.entries = flatten_toml_dict(toml_dict) if entries is None else entries
+        self.templates: dict[str, CompiledTemplate] = {}
+        self._nbytes: int | None = None
+
+    @classmethod
+    def from_toml_file(cls, language: str, file_path: str | Path) -> "Catalog":
+        """
+        Parse and flatten a language TOML file into a new catalog.
+
+        Args:
+            language (str): the language code the file belongs to
+            file_path (str | Path): the path of the language TOML file
+
+        Returns:
+            Catalog: the loaded catalog
+        """
+        file_path = Path(file_path)
+        signature = _get_file_signature(file_path)
+        start = time.perf_counter() if metrics_utils.enabled else None
+        toml_dict = serialize_toml_dict.raw_function(file_path, read_only=True)
+        if start is not None:
+            metrics_utils.observe(
+                metrics_utils.TOML_PARSE_SECONDS,
+                language,
+                time.perf_counter() - start,
+            )
+        catalog = cls(language, file_path, toml_dict, signature)
+        logger.debug(
+            "Loaded %d keys for '%s' from '%s'", len(catalog), language, file_path
+        )
+        return catalog
+
+    def with_values(self, values: dict[str, object]) -> "Catalog":
+        """
+        Build a new catalog with some key paths set to new values, without
+        reading the file again. Only the tables along each changed key path
+        are copied; everything else, compiled templates included, is shared
+        with this catalog. Missing tables are created.
+
+        Args:
+            values (dict): dotted key paths and their new values
+
+        Raises:
+            TypeError: if a key path goes through a value that is not a table
+
+        Returns:
+            Catalog: the updated catalog, with the same file signature
+        """
+        toml_dict = dict(self.toml_dict)
+        entries = dict(self.entries)
+        templates = dict(self.templates)
+        copied_tables = {id(toml_dict)}
+        for key_path, value in values.items():
+            parts = key_path.split(".")
+            table = toml_dict
+            for part_idx, part in enumerate(parts[:-1]):
+                child = table.get(part, {})
+                if not isinstance(child, dict):
+                    raise TypeError(
+                        f"'{key_path}' goes through a value that is not a table"
+                    )
+                if id(child) not in copied_tables:
+                    child = dict(child)
+                    copied_tables.add(id(child))
+                table[part] = entries[".".join(parts[: part_idx + 1])] = child
+                table = child
+
+            if isinstance(table.get(parts[-1]), dict):
+                # drop the entries of the replaced table
+                prefix = f"{key_path}."
+                for stale_key_path in [k for k in entries if k.startswith(prefix)]:
+                    del entries[stale_key_path]
+                    templates.pop(stale_key_path, None)
+            table[parts[-1]] = entries[key_path] = value
+            templates.pop(key_path, None)
+            if isinstance(value, dict):
+                entries.update(flatten_toml_dict(value, key_path))
+
+        catalog = Catalog(
+            self.language, self.file_path, toml_dict, self.signature, entries
+        )
+        catalog.templates = templates
+        return catalog
+
+    def with_signature(self, signature: tuple[int, int]) -> "Catalog":
+        """
+        Build a new catalog with the same contents and a new file signature,
+        for a file that was just rewritten with what this catalog holds. The
+        entries and compiled templates are shared with this catalog.
+
+        Args:
+            signature (tuple[int, int]): the signature of the rewritten file
+
+        Returns:
+            Catalog: the catalog with the new signature
+        """
+        catalog = Catalog(
+            self.language, self.file_path, self.toml_dict, signature, self.entries
+        )
+        catalog.templates = self.templates
+        return catalog
+
+    def get(self, key_path: str) -> object:
+        """
+        Get the value of a dotted key path from the catalog.
+
+        Args:
+            key_path (str): the path to the key, such as `start.welcome`
+
+        Raises:
+            PathAccessError: if the key path does not exist in the catalog
+
+        Returns:
+            object: the value associated with the given key path
+        """
+        try:
+            return self.entries[key_path]
+        except KeyError:
+            pass
+
+        # wildcard specs cannot be flattened ahead of time, so defer to glom
+        if "*" in key_path:
+            return get_value_from_toml_dict(self.toml_dict, key_path)
+        return get_array_item(self, key_path)
+
+    def get_template(self, key_path: str) -> CompiledTemplate:
+        """
+        Get the compiled placeholder template of a string value. Templates are
+        compiled on first use and kept for the lifetime of the catalog.
+
+        Args:
+            key_path (str): the path to the key, such as `start.welcome`
+
+        Raises:
+            PathAccessError: if the key path does not exist in the catalog
+            TypeError: if the value of the key path is not a str
+
+        Returns:
+            CompiledTemplate: the compiled template of the value
+        """
+        try:
+            return self.templates[key_path]
+        except KeyError:
+            pass
+
+        value = self.get(key_path)
+        if not isinstance(value, str):
+            logger.error("'%s' in '%s' is not a str", key_path, self.file_path)
+            raise TypeError(f"'{key_path}' in '{self.file_path}' is not a str")
+        template = self.templates[key_path] = CompiledTemplate(value)
+        return template
+
+    def is_stale(self) -> bool:
+        """
+        Checks whether the source file changed on disk since it was loaded.
+
+        Returns:
+            bool: `True` if the file's inode/mtime differ or it was removed
+        """
+        try:
+            return _get_file_signature(self.file_path) != self.signature
+        except FileNotFoundError:
+            return True
+
+    @property
+    def nbytes(self) -> int:
+        """
+        Returns:
+            int: a rough estimate of the memory the catalog holds, in bytes
+        """
+        if self._nbytes is None:
+            nbytes = sys.getsizeof(self.entries)
+            for key_path, value in self.entries.items():
+                nbytes += sys.getsizeof(key_path) + sys.getsizeof(value)
+            self._nbytes = nbytes
+        return self._nbytes
+
+    def __contains__(self, key_path: object) -> bool:
+        return key_path in self.entries
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+
+class MergedCatalog(Catalog):
+    """
+    The catalogs of a fallback chain merged into one, where keys missing from
+    a language are filled in from the next language in its chain. It is stale
+    as soon as any of the catalogs it was merged from is.
+    """
+
+    __slots__ = ("sources",)
+
+    def __init__(self, sources: "tuple[Catalog | MappedCatalog, ...]") -> None:
+        """
+        Args:
+            sources (tuple[Catalog | MappedCatalog, ...]): the catalogs of the
+            chain, starting with the language itself
+        """
+        toml_dict: dict[str, object] = {}
+        for source in reversed(sources):
+            toml_dict = merge_toml_dicts(toml_dict, source.toml_dict)
+        super().__init__(sources[0].language, sources[0].file_path, toml_dict)
+        self.sources = sources
+
+    def is_stale(self) -> bool:
+        return any(source.is_stale() for source in self.sources)
+
+
+# One catalog per language code, shared by the whole process, from least to
+# most recently used. Catalogs are never mutated once published; a reload
+# builds a new one and swaps it in
+_catalogs_lock = threading.Lock()
+_catalogs: "OrderedDict[str, Catalog | MappedCatalog]" = OrderedDict()
+
+# Limits of the catalog cache set with `configure_catalog_cache()`. None
+# falls back to the `[cache]` table of config.toml
+_max_languages: int | None = None
+_max_bytes: int | None = None
+_pinned: frozenset[str] | None = None
+
+# Held while a language is being loaded, so that concurrent misses on the
+# same language parse its file once while misses on other languages go ahead
+_load_locks: dict[str, threading.Lock] = {}
+
+# Cache counters, guarded by `_stats_lock`
+_stats_lock = threading.Lock()
+_hits = 0
+_misses = 0
+_evictions = 0
+
+# The merged catalog of each fallback chain. One is only used while each of
+# its sources is still the catalog loaded for its language
+_fallback_catalogs: dict[tuple[str, ...], MergedCatalog] = {}
+
+# Whether `get_catalog()` stats the language file on every call to pick up
+# changes. A `CatalogWatcher` turns this off while it keeps catalogs fresh
+_staleness_checks = True
+
+
+def set_staleness_checks(enabled: bool) -> None:
+    """
+    Turn the per-lookup check of whether a language file changed on or off.
+
+    Args:
+        enabled (bool): whether `get_catalog()` should check for changes
+    """
+    global _staleness_checks
+    _staleness_checks = enabled
+
+
+def configure_catalog_cache(
+    max_languages: int | None = None,
+    max_bytes: int | None = None,
+    pinned: list[str] | None = None,
+) -> None:
+    """
+    Bound the catalog cache. Once it holds more languages or more (estimated)
+    bytes than allowed, the least recently used languages are dropped until it
+    fits again, except for pinned languages and the one just loaded. Each
+    limit left as None is read from the optional `[cache]` table of
+    config.toml instead, and 0 means unbounded:
+
+    >>> [cache]
+    >>> max_languages = 20
+    >>> max_bytes = 268435456
+    >>> pinned = ["en"]
+
+    Args:
+        max_languages (int | None, optional): the most languages to keep loaded. Defaults to None.
+        max_bytes (int | None, optional): the most bytes of catalogs to keep loaded. Defaults to None.
+        pinned (list[str] | None, optional): languages that are never dropped.
+        Defaults to None, which pins the first language in config.toml.
+    """
+    global _max_languages, _max_bytes, _pinned
+    _max_languages = max_languages
+    _max_bytes = max_bytes
+    _pinned = frozenset(pinned) if pinned is not None else None
+
+    with _catalogs_lock:
+        if _catalogs:
+            _evict_catalogs()
+
+
+def _get_cache_limits() -> tuple[int, int, frozenset[str]]:
+    cache_config: dict[str, object] = get_config().get("cache", {})  # type: ignore
+    max_languages = _max_languages
+    if max_languages is None:
+        max_languages = int(cache_config.get("max_languages", 0))  # type: ignore
+    max_bytes = _max_bytes
+    if max_bytes is None:
+        max_bytes = int(cache_config.get("max_bytes", 0))  # type: ignore
+    pinned = _pinned
+    if pinned is None:
+        # the first language in config.toml is the default language
+        pinned = frozenset(
+            cache_config.get("pinned") or get_all_language_codes()[:1]  # type: ignore
+        )
+    return max_languages, max_bytes, pinned
+
+
+def _evict_catalogs(keep: tuple[str, ...] = ()) -> None:
+    # called with `_catalogs_lock` held, right after the languages or the
+    # fallback chain `keep` were added
+    global _evictions
+
+    max_languages, max_bytes, pinned = _get_cache_limits()
+    if not max_languages and not max_bytes:
+        return
+
+    # hits reorder `_catalogs` without the lock, so iterate over a snapshot.
+    # Merged catalogs count too, since they copy the entries of their chain
+    total_bytes = sum(catalog.nbytes for catalog in list(_catalogs.values()))
+    total_bytes += sum(catalog.nbytes for catalog in _fallback_catalogs.values())
+    if max_bytes:
+        # merged catalogs are rebuilt from loaded ones, so they go first
+        for chain, merged_catalog in list(_fallback_catalogs.items()):
+            if total_bytes <= max_bytes:
+                break
+            if chain != keep:
+                del _fallback_catalogs[chain]
+                total_bytes -= merged_catalog.nbytes
+
+    for language in list(_catalogs):
+        over_languages = max_languages and len(_catalogs) > max_languages
+        over_bytes = max_bytes and total_bytes > max_bytes
+        if not (over_languages or over_bytes):
+            break
+        if language in keep or language in pinned:
+            continue
+
+        catalog = _catalogs.pop(language)
+        total_bytes -= catalog.nbytes
+        _evictions += 1
+        # merged catalogs keep their sources alive, so drop them too
+        for chain, merged_catalog in list(_fallback_catalogs.items()):
+            if any(source is catalog for source in merged_catalog.sources):
+                del _fallback_catalogs[chain]
+                total_bytes -= merged_catalog.nbytes
+        logger.debug("Evicted the catalog of '%s'", language)
+
+
+def get_cache_stats() -> dict[str, int]:
+    """
+    Returns:
+        dict[str, int]: the `hits`, `misses` and `evictions` of the catalog
+        cache, the `languages` and merged `fallback_catalogs` it holds, and
+        the (estimated) `bytes` of both
+    """
+    catalogs = list(_catalogs.values())
+    merged_catalogs = list(_fallback_catalogs.values())
+    with _stats_lock:
+        hits, misses, evictions = _hits, _misses, _evictions
+    return {
+        "hits": hits,
+        "misses": misses,
+        "evictions": evictions,
+        "languages": len(catalogs),
+        "fallback_catalogs": len(merged_catalogs),
+        "bytes": sum(catalog.nbytes for catalog in catalogs + merged_catalogs),
+    }
+
+
+def reset_cache_stats() -> None:
+    """
+    Set the hit, miss and eviction counters of the catalog cache back to 0.
+    """
+    global _hits, _misses, _evictions
+    with _stats_lock:
+        _hits = _misses = _evictions = 0
+
+
+def _load_catalog(language: str) -> "Catalog | MappedCatalog":
+    # imported here since binary_catalog_utils builds on this module
+    from translation_library.utils.binary_catalog_utils import load_compiled_catalog
+
+    start = time.perf_counter() if metrics_utils.enabled else None
+    try:
+        file_path = get_language_file_path(language)
+        if (catalog := load_compiled_catalog(language, file_path)) is not None:
+            return catalog
+        return Catalog.from_toml_file(language, file_path)
+    finally:
+        if start is not None:
+            metrics_utils.observe(
+                metrics_utils.CATALOG_LOAD_SECONDS,
+                language,
+                time.perf_counter() - start,
+            )
+
+
+def get_catalog(language: str) -> "Catalog | MappedCatalog":
+    """
+    Return the catalog of a language, loading it on first use or when its
+    language file changed on disk since it was last loaded. An up-to-date
+    compiled catalog of the file is memory-mapped instead of parsing it.
+
+    Args:
+        language (str): the code of the language to get the catalog of
+
+    Raises:
+        PathAccessError: if the language is not listed in config.toml
+        FileNotFoundError: if the language file does not exist
+
+    Returns:
+        Catalog | MappedCatalog: the loaded catalog of the language
+    """
+    global _hits, _misses
+
+    catalog = _catalogs.get(language)
+    if catalog is not None and not (_staleness_checks and catalog.is_stale()):
+        with _stats_lock:
+            _hits += 1
+        if metrics_utils.enabled:
+            metrics_utils.increment(metrics_utils.CACHE_HITS, language)
+        try:
+            _catalogs.move_to_end(language)
+        except KeyError:
+            # evicted by another thread in the meantime, which is fine
+            pass
+        return catalog
+
+    # the file is parsed outside `_catalogs_lock`, so that a miss does not
+    # block lookups and loads of other languages
+    with _get_load_lock(language):
+        catalog = _catalogs.get(language)
+        if catalog is not None and not (_staleness_checks and catalog.is_stale()):
+            # loaded by another thread while this one waited
+            with _stats_lock:
+                _hits += 1
+            if metrics_utils.enabled:
+                metrics_utils.increment(metrics_utils.CACHE_HITS, language)
+            return catalog
+
+        with _stats_lock:
+            _misses += 1
+        if metrics_utils.enabled:
+            metrics_utils.increment(metrics_utils.CACHE_MISSES, language)
+        catalog = _load_catalog(language)
+        with _catalogs_lock:
+            _catalogs[language] = catalog
+            _catalogs.move_to_end(language)
+            _evict_catalogs(keep=(language,))
+        return catalog
+
+
+def _get_load_lock(language: str) -> threading.Lock:
+    if (lock := _load_locks.get(language)) is not None:
+        return lock
+    if language not in get_language_code_set():
+        # loading it fails anyway, and a lock per unknown code would pile up
+        return threading.Lock()
+    with _catalogs_lock:
+        return _load_locks.setdefault(language, threading.Lock())
+
+
+def clear_catalogs() -> None:
+    """
+    Drop every loaded catalog so that the next lookup re-reads its file.
+    """
+    with _catalogs_lock:
+        _catalogs.clear()
+        _fallback_catalogs.clear()
+    logger.debug("Cleared all loaded catalogs")
+
+
+def get_loaded_languages() -> list[str]:
+    """
+    Returns:
+        list[str]: the codes of every language whose catalog is loaded
+    """
+    return list(_catalogs.keys())
+
+
+def get_loaded_catalog(language: str) -> "Catalog | MappedCatalog | None":
+    """
+    Return the catalog of a language only if it is already loaded and up to
+    date, without ever reading its file.
+
+    Args:
+        language (str): the code of the language to get the catalog of
+
+    Returns:
+        Catalog | MappedCatalog | None: the loaded catalog, or None if getting
+        it would have to load the language file
+    """
+    catalog = _catalogs.get(language)
+    if catalog is None or (_staleness_checks and catalog.is_stale()):
+        return None
+    return catalog
+
+
+def reload_catalog(language: str) -> "Catalog | MappedCatalog":
+    """
+    Build a new catalog of a language from its file and swap it in. Readers
+    keep using the old catalog until the new one is fully loaded, so they
+    never block on the reload or see a half-loaded file.
+
+    Args:
+        language (str): the code of the language to reload
+
+    Raises:
+        PathAccessError: if the language is not listed in config.toml
+        FileNotFoundError: if the language file does not exist
+
+    Returns:
+        Catalog | MappedCatalog: the newly loaded catalog
+    """
+    catalog = _load_catalog(language)
+    with _catalogs_lock:
+        _catalogs[language] = catalog
+        _catalogs.move_to_end(language)
+        _evict_catalogs(keep=(language,))
+    logger.debug("Swapped in a reloaded catalog for '%s'", language)
+    return catalog
+
+
+def set_catalog(catalog: "Catalog | MappedCatalog") -> None:
+    """
+    Swap in an already built catalog for its language, e.g. one that is
+    backed by shared memory.
+
+    Args:
+        catalog (Catalog | MappedCatalog): the catalog to use for `catalog.language`
+    """
+    with _catalogs_lock:
+        _catalogs[catalog.language] = catalog
+        _catalogs.move_to_end(catalog.language)
+        _evict_catalogs(keep=(catalog.language,))
+    logger.debug("Swapped in a prebuilt catalog for '%s'", catalog.language)
+
+
+def replace_catalog(
+    old_catalog: "Catalog | MappedCatalog", new_catalog: "Catalog | MappedCatalog"
+) -> bool:
+    """
+    Swap in a new catalog for a language only if `old_catalog` is still the
+    one used for it, e.g. so that an update does not undo a reload.
+
+    Args:
+        old_catalog (Catalog | MappedCatalog): the catalog to replace
+        new_catalog (Catalog | MappedCatalog): the catalog to use instead
+
+    Returns:
+        bool: whether the new catalog was swapped in
+    """
+    with _catalogs_lock:
+        if _catalogs.get(old_catalog.language) is not old_catalog:
+            return False
+        _catalogs[new_catalog.language] = new_catalog
+    return True
+
+
+def remove_catalog(catalog: "Catalog | MappedCatalog") -> None:
+    """
+    Drop a catalog if it is still the one used for its language, so that the
+    next lookup loads the language again.
+
+    Args:
+        catalog (Catalog | MappedCatalog): the catalog to drop
+    """
+    with _catalogs_lock:
+        if _catalogs.get(catalog.language) is catalog:
+            del _catalogs[catalog.language]
+
+
+def get_fallback_catalog(language: str) -> "Catalog | MappedCatalog":
+    """
+    Return the catalog of a language merged with the catalogs of its fallback
+    chain from config.toml (e.g. `de-at` -> `de` -> `en`). Keys missing from a
+    language are filled in from the next language in its chain. The merged
+    catalog is built once per chain and reused until one of the catalogs of
+    the chain is reloaded, swapped or dropped, so a lookup that falls back is
+    a single key lookup in it instead of one per language. Like a direct
+    lookup, it still checks each language file of the chain for changes
+    unless a `CatalogWatcher` runs. Languages without fallbacks get their
+    own catalog.
+
+    Args:
+        language (str): the code of the language to get the catalog of
+
+    Raises:
+        PathAccessError: if a language in the chain is not listed in config.toml
+        FileNotFoundError: if a language file in the chain does not exist
+
+    Returns:
+        Catalog | MappedCatalog: the merged catalog of the fallback chain
+    """
+    chain = get_fallback_chain(language)
+    if len(chain) == 1:
+        return get_catalog(chain[0])
+
+    catalog = _fallback_catalogs.get(chain)
+    if (
+        catalog is not None
+        and _is_loaded(catalog.sources)
+        and not (_staleness_checks and catalog.is_stale())
+    ):
+        return catalog
+
+    catalog = MergedCatalog(tuple(get_catalog(code) for code in chain))
+    with _catalogs_lock:
+        # only cache the merge if none of its sources was replaced meanwhile
+        if _is_loaded(catalog.sources):
+            _fallback_catalogs[chain] = catalog
+            _evict_catalogs(keep=chain)
+    logger.debug("Merged the catalogs of fallback chain %s", chain)
+    return catalog
+
+
+def _is_loaded(sources: "tuple[Catalog | MappedCatalog, ...]") -> bool:
+    return all(_catalogs.get(source.language) is source for source in sources)
+
+
+def _parse_language_file(
+    file_path: Path,
+) -> tuple[dict[str, object], tuple[int, int], float]:
+    # runs in a worker process, so only the parsed dict is sent back
+    start = time.perf_counter()
+    signature = _get_file_signature(file_path)
+    toml_dict = serialize_toml_dict.raw_function(file_path, read_only=True)
+    return toml_dict, signature, time.perf_counter() - start
+
+
+def _timed_load_catalog(language: str) -> "tuple[Catalog | MappedCatalog, float]":
+    start = time.perf_counter()
+    catalog = _load_catalog(language)
+    return catalog, time.perf_counter() - start
+
+
+def preload_languages(
+    codes: list[str] | None = None,
+    workers: int | None = None,
+    use_processes: bool = False,
+) -> dict[str, float]:
+    """
+    Load the catalogs of many languages in parallel and fill the catalog
+    cache with them, e.g. to warm up a service before it takes traffic. A
+    language that fails to load is logged and left out.
+
+    Files are parsed on a thread pool by default. With `use_processes`,
+    TOML files are parsed on a process pool instead, which sidesteps the GIL
+    for many large files at the cost of sending each parsed file back.
+    Up-to-date compiled catalogs are always mapped in this process.
+
+    Args:
+        codes (list[str] | None, optional): the language codes to load.
+        Defaults to every language in config.toml.
+        workers (int | None, optional): the size of the pool. Defaults to
+        the default size of the chosen pool.
+        use_processes (bool, optional): parse on a process pool. Defaults to False.
+
+    Returns:
+        dict[str, float]: each loaded language code and how long loading
+        its file took, in ms
+    """
+    # only pay for importing the pools when preloading
+    from concurrent.futures import (
+        Executor,
+        Future,
+        ProcessPoolExecutor,
+        ThreadPoolExecutor,
+    )
+
+    from translation_library.utils.binary_catalog_utils import load_compiled_catalog
+
+    if codes is None:
+        codes = get_all_language_codes()
+
+    catalogs: "dict[str, Catalog | MappedCatalog]" = {}
+    timings: dict[str, float] = {}
+    futures: dict[str, Future[object]] = {}
+    file_paths: dict[str, Path] = {}
+    pool: Executor = (
+        ProcessPoolExecutor(max_workers=workers)
+        if use_processes
+        else ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="translation-library-preload"
+        )
+    )
+    with pool:
+        for code in codes:
+            if not use_processes:
+                futures[code] = pool.submit(_timed_load_catalog, code)
+                continue
+            try:
+                start = time.perf_counter()
+                file_path = file_paths[code] = get_language_file_path(code)
+                if catalog := load_compiled_catalog(code, file_path):
+                    catalogs[code] = catalog
+                    timings[code] = (time.perf_counter() - start) * 1000
+                else:
+                    futures[code] = pool.submit(_parse_language_file, file_path)
+            except Exception:
+                logger.exception("Could not preload the catalog of '%s' due to:", code)
+
+        for code, future in futures.items():
+            try:
+                if use_processes:
+                    toml_dict, signature, seconds = future.result()  # type: ignore
+                    start = time.perf_counter()
+                    catalogs[code] = Catalog(
+                        code, file_paths[code], toml_dict, signature
+                    )
+                    seconds += time.perf_counter() - start
+                    if metrics_utils.enabled:
+                        # parsed in another process, so not recorded there
+                        metrics_utils.observe(
+                            metrics_utils.CATALOG_LOAD_SECONDS, code, seconds
+                        )
+                else:
+                    catalogs[code], seconds = future.result()  # type: ignore
+                timings[code] = seconds * 1000
+            except Exception:
+                logger.exception("Could not preload the catalog of '%s' due to:", code)
+
+    for catalog in catalogs.values():
+        set_catalog(catalog)
+    for code, milliseconds in timings.items():
+        logger.info("Preloaded '%s' in %.2f ms", code, milliseconds)
+    return timings
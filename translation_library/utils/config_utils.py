@@ -1,42 +1,422 @@
 # mypy: ignore-errors
 
 import logging
+import os
+import threading
+import unicodedata
 from pathlib import Path
+from typing import cast
 
+from translation_library.utils.log_utils import configure_logging_from_config
 from translation_library.utils.path_utils import get_project_root
-from translation_library.utils.toml_utils import get_value_from_key
+from translation_library.utils.toml_utils import (
+    get_value_from_toml_dict,
+    serialize_toml_dict,
+)
 
 logger = logging.getLogger(__name__)
 
+# The parsed config.toml is shared by the whole process. It is re-read only
+# when the (inode, mtime) signature of the file changes or `reload_config()`
+# is called, so lookups cost a `stat()` and a dict access instead of a parse.
+_config_lock = threading.Lock()
+_config_data: dict[str, object] | None = None
+_config_signature: tuple[int, int] | None = None
+
+# The language codes of the config they were built from, so that membership
+# checks do not build a list of every code on every call
+_language_codes: tuple[dict[str, object], frozenset[str]] | None = None
+
+# Every normalized code, name and alias of each language mapped to its code,
+# with the config it was built from
+_language_index: tuple[dict[str, object], dict[str, str]] | None = None
+
+# Set to the absolute path of the dir that holds config.toml to skip searching
+# the parent dirs for it, e.g. when the package is installed outside the repo
+PROJECT_ROOT_ENV_VAR = "TRANSLATION_LIBRARY_ROOT"
+
+
+class PathRegistry:
+    """
+    Resolves the project root, config.toml, the i18n dir and the file path of
+    every language once and remembers them. The i18n dir and language file
+    paths are keyed on the loaded config, so they are resolved again after
+    config.toml changes.
+    """
+
+    def __init__(self, project_root: str | Path | None = None) -> None:
+        """
+        Args:
+            project_root (str | Path | None, optional): the dir that holds
+            config.toml. Defaults to `TRANSLATION_LIBRARY_ROOT` if it is set,
+            otherwise the parent dirs of the package are searched on first use.
+        """
+        project_root = project_root or os.environ.get(PROJECT_ROOT_ENV_VAR)
+        self._given_project_root = Path(project_root) if project_root else None
+        self.invalidate()
+
+    def invalidate(self) -> None:
+        """
+        Forget every resolved path, except a project root that was given.
+        """
+        self._project_root: Path | None = self._given_project_root
+        self._config_file_path: Path | None = None
+        self._config: dict[str, object] | None = None
+        self._i18n_dir: Path | None = None
+        self._language_file_paths: dict[str, Path] = {}
+
+    @property
+    def project_root(self) -> Path:
+        if self._project_root is None:
+            self._project_root = get_project_root.raw_function()
+        return self._project_root
+
+    @property
+    def config_file_path(self) -> Path:
+        if self._config_file_path is None:
+            self._config_file_path = self.project_root / "config.toml"
+        return self._config_file_path
+
+    def _sync_with_config(self) -> dict[str, object]:
+        config = get_config()
+        if config is not self._config:
+            self._config = config
+            self._i18n_dir = None
+            self._language_file_paths = {}
+        return config
+
+    @property
+    def i18n_dir(self) -> Path:
+        config = self._sync_with_config()
+        if self._i18n_dir is None:
+            # relative dirs are relative to the project root, not the cwd
+            i18n_dir = str(get_value_from_toml_dict(config, "paths.i18n_dir"))
+            self._i18n_dir = self.project_root / i18n_dir
+        return self._i18n_dir
+
+    def language_file_path(self, code: str) -> Path:
+        """
+        Get the path of the language file of a language code.
+
+        Args:
+            code (str): the language code, such as `en`
+
+        Raises:
+            PathAccessError: if the language is not listed in config.toml
+
+        Returns:
+            Path: the path of the language file
+        """
+        config = self._sync_with_config()
+        code = code.lower()
+        if file_path := self._language_file_paths.get(code):
+            return file_path
+
+        file_name = str(get_value_from_toml_dict(config, f"languages.{code}.file"))
+        file_path = self._language_file_paths[code] = self.i18n_dir / file_name
+        return file_path
+
+
+_path_registry = PathRegistry()
+
+
+def get_path_registry() -> PathRegistry:
+    return _path_registry
+
+
+def set_project_root(project_root: str | Path | None) -> None:
+    """
+    Use a different project root from now on, or go back to the default one
+    if `None` is given. The cached config, resolved paths and loaded
+    catalogs are discarded.
+
+    Args:
+        project_root (str | Path | None): the dir that holds config.toml
+    """
+    global _path_registry, _config_signature
+
+    # imported here since catalog_utils builds on this module
+    from translation_library.utils.catalog_utils import clear_catalogs
+
+    _path_registry = PathRegistry(project_root)
+    _config_signature = None
+    # they were loaded from the language files of the old root
+    clear_catalogs()
+
+
+def invalidate_paths() -> None:
+    """
+    Forget every resolved path, so that they are resolved again on next use.
+    """
+    _path_registry.invalidate()
+
 
 def get_config_file_path() -> Path:
-    return get_project_root() / "config.toml"
+    return _path_registry.config_file_path
+
+
+def _get_file_signature(file_path: Path) -> tuple[int, int]:
+    stat_result = os.stat(file_path)
+    return stat_result.st_ino, stat_result.st_mtime_ns
+
+
+def _validate_config(config: dict[str, object], config_path: Path) -> None:
+    """
+    Checks that a freshly parsed config has the tables and keys that the rest
+    of the utils rely on, so that lookups never have to re-check them.
+
+    Args:
+        config (dict): the parsed contents of config.toml
+        config_path (Path): the path config.toml was loaded from
+
+    Raises:
+        ValueError: if a required table or key is missing or of the wrong type
+    """
+    paths = config.get("paths")
+    if not isinstance(paths, dict) or not isinstance(paths.get("i18n_dir"), str):
+        logger.error("'%s' is missing a 'paths.i18n_dir' string", config_path)
+        raise ValueError(f"'{config_path}' must define 'paths.i18n_dir'")
+
+    languages = config.get("languages")
+    if not isinstance(languages, dict):
+        logger.error("'%s' is missing a 'languages' table", config_path)
+        raise ValueError(f"'{config_path}' must define a 'languages' table")
+
+    fallbacks = config.get("fallbacks", {})
+    if not isinstance(fallbacks, dict):
+        logger.error("'fallbacks' in '%s' is not a table", config_path)
+        raise ValueError(f"'fallbacks' in '{config_path}' must be a table")
+
+    for code, chain in fallbacks.items():
+        if not isinstance(chain, list) or not all(
+            fallback in languages for fallback in chain
+        ):
+            logger.error("'fallbacks.%s' in '%s' is invalid", code, config_path)
+            raise ValueError(
+                f"'fallbacks.{code}' in '{config_path}' must be a list of "
+                "language codes from the 'languages' table"
+            )
+
+    cache = config.get("cache", {})
+    if not isinstance(cache, dict):
+        logger.error("'cache' in '%s' is not a table", config_path)
+        raise ValueError(f"'cache' in '{config_path}' must be a table")
+    for key in ("max_languages", "max_bytes"):
+        if key in cache and (not isinstance(cache[key], int) or cache[key] < 0):
+            logger.error("'cache.%s' in '%s' is invalid", key, config_path)
+            raise ValueError(
+                f"'cache.{key}' in '{config_path}' must be a non-negative integer"
+            )
+    pinned = cache.get("pinned", [])
+    if not isinstance(pinned, list) or not all(code in languages for code in pinned):
+        logger.error("'cache.pinned' in '%s' is invalid", config_path)
+        raise ValueError(
+            f"'cache.pinned' in '{config_path}' must be a list of "
+            "language codes from the 'languages' table"
+        )
+
+    for code, entry in languages.items():
+        if not isinstance(entry, dict):
+            logger.error("'languages.%s' in '%s' is not a table", code, config_path)
+            raise ValueError(f"'languages.{code}' in '{config_path}' must be a table")
+        aliases = entry.get("aliases", [])
+        if not isinstance(aliases, list) or not all(
+            isinstance(alias, str) for alias in aliases
+        ):
+            logger.error("'languages.%s.aliases' in '%s' is invalid", code, config_path)
+            raise ValueError(
+                f"'languages.{code}.aliases' in '{config_path}' must be a list of strings"
+            )
+        plural_rules = entry.get("plural_rules", "")
+        if not isinstance(plural_rules, (str, dict)) or (
+            isinstance(plural_rules, dict)
+            and not all(isinstance(rule, str) for rule in plural_rules.values())
+        ):
+            logger.error(
+                "'languages.%s.plural_rules' in '%s' is invalid", code, config_path
+            )
+            raise ValueError(
+                f"'languages.{code}.plural_rules' in '{config_path}' must be a "
+                "language code or a table of CLDR plural rules"
+            )
+        for key in ("english_name", "native_name", "file"):
+            if not isinstance(entry.get(key), str):
+                logger.error(
+                    "'languages.%s.%s' missing in '%s'", code, key, config_path
+                )
+                raise ValueError(
+                    f"'languages.{code}.{key}' in '{config_path}' must be a string"
+                )
+
+
+def _load_config(config_path: Path, signature: tuple[int, int]) -> dict[str, object]:
+    global _config_data, _config_signature
+
+    config = serialize_toml_dict.raw_function(config_path, read_only=True)
+    _validate_config(config, config_path)
+    _config_data, _config_signature = config, signature
+    configure_logging_from_config(config)
+    logger.debug("Loaded and validated config from '%s'", config_path)
+    return config
+
+
+def get_config() -> dict[str, object]:
+    """
+    Return the parsed and validated config.toml. The file is only parsed on
+    first use or after its inode/mtime changes on disk.
+
+    Raises:
+        FileNotFoundError: if config.toml does not exist in the project root
+        ValueError: if config.toml is missing required tables or keys
+
+    Returns:
+        dict: the TOML-like dict of config.toml
+    """
+    config_path = get_config_file_path()
+    signature = _get_file_signature(config_path)
+    if _config_data is not None and _config_signature == signature:
+        return _config_data
+
+    with _config_lock:
+        # another thread may have already reloaded while we waited for the lock
+        if _config_data is not None and _config_signature == signature:
+            return _config_data
+        return _load_config(config_path, signature)
+
+
+def reload_config() -> dict[str, object]:
+    """
+    Discard the cached config and parse config.toml again, regardless of
+    whether the file changed on disk.
+
+    Returns:
+        dict: the freshly parsed TOML-like dict of config.toml
+    """
+    config_path = get_config_file_path()
+    with _config_lock:
+        return _load_config(config_path, _get_file_signature(config_path))
 
 
 def get_value_from_config(
     key_path: str,
 ) -> str | list[str] | list[dict[str, object]]:
-    return get_value_from_key(get_config_file_path(), key_path)
+    if value := get_value_from_toml_dict(get_config(), key_path):
+        return cast(str | list[str] | list[dict[str, object]], value)
+    logger.warning("None retrieved with key '%s' from config", key_path)
+    return [] if "*" in key_path else ""
 
 
 def get_i18n_dir_path() -> Path:
-    return Path(str(get_value_from_config("paths.i18n_dir")))
+    return _path_registry.i18n_dir
+
+
+def _get_languages_table() -> dict[str, dict[str, str]]:
+    # `_validate_config()` guarantees the shape of this table
+    return get_config()["languages"]  # type: ignore
 
 
 def get_all_english_names() -> list[str]:
-    return [str(name) for name in get_value_from_config("languages.*.english_name")]
+    return [entry["english_name"] for entry in _get_languages_table().values()]
 
 
 def get_all_native_names() -> list[str]:
-    return [str(name) for name in get_value_from_config("languages.*.native_name")]
+    return [entry["native_name"] for entry in _get_languages_table().values()]
 
 
 def get_all_file_names() -> list[str]:
-    return [str(name) for name in get_value_from_config("languages.*.file")]
+    return [entry["file"] for entry in _get_languages_table().values()]
 
 
 def get_all_language_codes() -> list[str]:
-    return [code for code in get_value_from_config("languages").keys()]
+    return list(_get_languages_table().keys())
+
+
+def get_language_code_set() -> frozenset[str]:
+    """
+    Returns:
+        frozenset[str]: every language code in config.toml, for O(1)
+        membership checks. It is built once per version of config.toml
+    """
+    global _language_codes
+
+    config = get_config()
+    cached = _language_codes
+    if cached is None or cached[0] is not config:
+        cached = _language_codes = (
+            config,
+            frozenset(config["languages"]),  # type: ignore
+        )
+    return cached[1]
+
+
+def normalize_language_name(text: str) -> str:
+    """
+    Normalize a language code, name or alias for lookups in the language
+    index: NFKC-normalized, casefolded and stripped, so that e.g. "DE",
+    " Deutsch" and "ＤＥＵＴＳＣＨ" all compare equal to their lowercase forms.
+
+    Args:
+        text (str): the text to normalize
+
+    Returns:
+        str: the normalized text
+    """
+    return unicodedata.normalize("NFKC", text).casefold().strip()
+
+
+def get_language_index() -> dict[str, str]:
+    """
+    Get a map of the normalized code, English name, native name and optional
+    `aliases` of every language in config.toml to its language code:
+
+    >>> [languages.de]
+    >>> english_name = "German"
+    >>> native_name = "Deutsch"
+    >>> aliases = ["deu", "ger"]
+
+    On a clash, codes win over English names, which win over native names,
+    which win over aliases. The index is built once per version of config.toml.
+
+    Returns:
+        dict[str, str]: the normalized text mapped to its language code
+    """
+    global _language_index
+
+    config = get_config()
+    cached = _language_index
+    if cached is None or cached[0] is not config:
+        languages: dict[str, dict[str, object]] = config["languages"]  # type: ignore
+        index: dict[str, str] = {}
+        # later updates win, so go from the weakest to the strongest kind
+        for code, entry in languages.items():
+            for alias in entry.get("aliases", []):  # type: ignore
+                index[normalize_language_name(alias)] = code
+        for key in ("native_name", "english_name"):
+            for code, entry in languages.items():
+                index[normalize_language_name(str(entry[key]))] = code
+        for code in languages:
+            index[normalize_language_name(code)] = code
+        cached = _language_index = (config, index)
+    return cached[1]
+
+
+def get_fallback_chain(code: str) -> tuple[str, ...]:
+    """
+    Get the fallback chain of a language from the optional `[fallbacks]`
+    table of config.toml, starting with the language itself:
+
+    >>> [fallbacks]
+    >>> de-at = ["de", "en"]
+
+    Args:
+        code (str): the language code, such as `de-at`
+
+    Returns:
+        tuple[str, ...]: the language codes to try in order, without duplicates
+    """
+    code = code.lower()
+    fallbacks: dict[str, list[str]] = get_config().get("fallbacks", {})  # type: ignore
+    return tuple(dict.fromkeys([code, *fallbacks.get(code, [])]))
 
 
 def language_code_to_english_name(code: str) -> str:
@@ -52,6 +432,4 @@ def language_code_to_file_name(code: str) -> str:
 
 
 def get_language_file_path(code: str) -> Path:
-    return get_i18n_dir_path() / Path(
-        str(get_value_from_config(f"languages.{code.lower()}.file"))
-    )
+    return _path_registry.language_file_path(code)
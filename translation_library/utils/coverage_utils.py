@@ -0,0 +1,182 @@
+import logging
+import math
+from typing import Any, TypedDict
+
+from translation_library.utils.catalog_utils import (
+    Catalog,
+    flatten_toml_dict,
+    get_catalog,
+)
+from translation_library.utils.config_utils import get_all_language_codes
+from translation_library.utils.message_utils import CompiledMessage
+from translation_library.utils.template_utils import CompiledTemplate
+
+logger = logging.getLogger(__name__)
+
+
+class CoverageReport(TypedDict):
+    """
+    The report of `get_coverage_report()`. Each language maps to either its
+    findings or `{"error": "..."}` if it failed to load.
+    """
+
+    default_language: str
+    keys: int
+    languages: dict[str, dict[str, Any]]
+
+
+def _get_leaf_values(language: str) -> dict[str, object]:
+    catalog = get_catalog(language)
+    if isinstance(catalog, Catalog):
+        entries = catalog.entries
+    else:
+        entries = flatten_toml_dict(catalog.toml_dict)
+    # tables are entries too, but only the keys under them are translated
+    return {
+        key_path: value
+        for key_path, value in entries.items()
+        if not isinstance(value, dict)
+    }
+
+
+def _get_placeholders(value: str) -> frozenset[str] | None:
+    if "{" not in value and "}" not in value:
+        return frozenset()
+    try:
+        return CompiledTemplate(value).placeholders
+    except ValueError:
+        pass
+    try:
+        # plural and select messages nest braces, which templates cannot
+        return CompiledMessage(value).arguments
+    except ValueError:
+        # unbalanced braces
+        return None
+
+
+def _compare_language(
+    values: dict[str, object],
+    default_values: dict[str, object],
+    default_placeholders: dict[str, frozenset[str] | None],
+    include_keys: bool,
+) -> dict[str, object]:
+    missing = default_values.keys() - values.keys()
+    extra = values.keys() - default_values.keys()
+
+    placeholder_mismatches: dict[str, dict[str, list[str]]] = {}
+    invalid_templates: list[str] = []
+    for key_path, value in values.items():
+        if not isinstance(value, str):
+            continue
+        if values is default_values:
+            placeholders = default_placeholders[key_path]
+        else:
+            placeholders = _get_placeholders(value)
+        if placeholders is None:
+            invalid_templates.append(key_path)
+            continue
+        expected = default_placeholders.get(key_path)
+        if expected is None or placeholders == expected:
+            continue
+        placeholder_mismatches[key_path] = {
+            "missing": sorted(expected - placeholders),
+            "extra": sorted(placeholders - expected),
+        }
+
+    translated = len(default_values) - len(missing)
+    report: dict[str, object] = {
+        "keys": len(values),
+        "translated": translated,
+        # rounded down, so that a language missing any key is under 100
+        "coverage": (
+            math.floor(10_000 * translated / len(default_values)) / 100
+            if default_values
+            else 100.0
+        ),
+    }
+    if include_keys:
+        report["missing"] = sorted(missing)
+        report["extra"] = sorted(extra)
+        report["placeholder_mismatches"] = dict(sorted(placeholder_mismatches.items()))
+        report["invalid_templates"] = sorted(invalid_templates)
+    else:
+        report["missing"] = len(missing)
+        report["extra"] = len(extra)
+        report["placeholder_mismatches"] = len(placeholder_mismatches)
+        report["invalid_templates"] = len(invalid_templates)
+    return report
+
+
+def get_coverage_report(
+    languages: list[str] | None = None,
+    default_language: str | None = None,
+    include_keys: bool = True,
+) -> CoverageReport:
+    """
+    Compare the keys of every language against the default language in a
+    single pass. Each language file is loaded once, and its flattened keys
+    are diffed against the default language's with set operations. Str
+    values are also checked for using the same placeholder names as the
+    default language, whether they are templates or MessageFormat messages.
+    The report is JSON-serializable:
+
+    >>> get_coverage_report()
+    {"default_language": "en", "keys": 3, "languages": {"de": {"keys": 2,
+    "translated": 2, "coverage": 66.67, "missing": ["hello"], "extra": [],
+    "placeholder_mismatches": {"start.welcome": {"missing": ["name"],
+    "extra": []}}, "invalid_templates": []}, ...}}
+
+    A language that fails to load is reported as `{"error": "..."}`.
+
+    Args:
+        languages (list[str] | None, optional): the language codes to report
+        on. Defaults to every language in config.toml.
+        default_language (str | None, optional): the language code the others
+        are compared against. Defaults to the first language in config.toml.
+        include_keys (bool, optional): list the key paths of each finding
+        instead of only counting them. Defaults to True.
+
+    Raises:
+        ValueError: if no default language is given and config.toml lists none
+        PathAccessError: if the default language is not listed in config.toml
+        FileNotFoundError: if the default language file does not exist
+
+    Returns:
+        CoverageReport: the coverage of each language
+    """
+    all_codes = get_all_language_codes()
+    if not default_language:
+        if not all_codes:
+            raise ValueError("config.toml lists no languages to compare against")
+        default_language = all_codes[0]
+    default_values = _get_leaf_values(default_language)
+    default_placeholders = {
+        key_path: _get_placeholders(value)
+        for key_path, value in default_values.items()
+        if isinstance(value, str)
+    }
+
+    language_reports: dict[str, dict[str, Any]] = {}
+    for code in languages or all_codes:
+        try:
+            values = (
+                default_values if code == default_language else _get_leaf_values(code)
+            )
+        except Exception as e:
+            logger.exception("Could not load '%s' for its coverage due to:", code)
+            language_reports[code] = {"error": f"{type(e).__name__}: {e}"}
+            continue
+        language_reports[code] = _compare_language(
+            values, default_values, default_placeholders, include_keys
+        )
+
+    logger.info(
+        "Checked the coverage of %d languages against '%s'",
+        len(language_reports),
+        default_language,
+    )
+    return {
+        "default_language": default_language,
+        "keys": len(default_values),
+        "languages": language_reports,
+    }
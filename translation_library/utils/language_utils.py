@@ -1,20 +1,31 @@
+import copy
 import logging
+from typing import Annotated
 
-import tomlkit
-from pydantic import Field, validate_call
-
-from translation_library.utils.config_utils import get_language_file_path
-from translation_library.utils.toml_utils import serialize_toml_dict
+from translation_library.utils.catalog_utils import get_catalog
 from translation_library.utils.translation_utils import is_supported
+from translation_library.utils.validation_utils import MinLength, validate_call
 
 logger = logging.getLogger(__name__)
 
 
+def _get_toml_dict(language: str) -> dict[str, object]:
+    # the dict comes from the catalog cache, so it is shared with every other
+    # lookup and must not be modified
+    logger.debug("Attempting to retrieve TOML dict from '%s.toml'", language)
+    if toml_dict := get_catalog(language).toml_dict:
+        logger.info("Successfully retrieved toml dict from '%s.toml'", language)
+        return toml_dict
+    logger.warning("None dict retrieved from '%s.toml'", language)
+    return {}
+
+
 # TODO: make `language` into `language_code`
 @validate_call
-def into_toml_dict(language: str = Field(..., min_length=1)) -> dict[str, object]:
+def into_toml_dict(language: Annotated[str, MinLength(1)]) -> dict[str, object]:
     """
-    Returns a TOML-like dictionary of a specified language.
+    Returns a TOML-like dictionary of a specified language. It is a copy of
+    the cached catalog, so it can be modified without affecting lookups.
 
     Args:
         language (str): the language to convert into a TOML-like dict
@@ -22,17 +33,12 @@ def into_toml_dict(language: str = Field(..., min_length=1)) -> dict[str, object
     Returns:
         dict: the language file as a TOML-like dict or {} if file was empty
     """
-    logger.debug("Attempting to retrieve TOML dict from '%s.toml'", language)
-    if toml_dict := serialize_toml_dict(get_language_file_path(language)):
-        logger.info("Successfully retrieved toml dict from '%s.toml'", language)
-        return toml_dict
-    logger.warning("None dict retrieved from '%s.toml'", language)
-    return {}
+    return copy.deepcopy(_get_toml_dict(language))
 
 
 # TODO: make `language` into `language_code`
 @validate_call
-def into_toml_str(language: str = Field(..., min_length=1)) -> str:
+def into_toml_str(language: Annotated[str, MinLength(1)]) -> str:
     """
     Return the TOML language file of a specified language as a TOML-based
     pretty str.
@@ -40,12 +46,14 @@ def into_toml_str(language: str = Field(..., min_length=1)) -> str:
     Args:
         language (str): the name of the language TOML dict to convert into a str
     """
-    if not is_supported(language):
+    if not is_supported.raw_function(language):
         logger.error("is_supported() returned False for language arg '%s'", language)
         raise ValueError(f"{language} is not supported")
 
+    import tomlkit
+
     logger.debug("Converting '%s.toml' as a dictionary into str")
-    if toml_str := tomlkit.dumps(into_toml_dict(language)):
+    if toml_str := tomlkit.dumps(_get_toml_dict(language)):
         logger.info("Successfully converted the '%s' TOML dict into str")
         return toml_str
     logger.warning("None received from into_toml_dict() with arg '%s'", language)
@@ -54,7 +62,7 @@ def into_toml_str(language: str = Field(..., min_length=1)) -> str:
 
 # TODO: make `language` into `language_code`
 @validate_call
-def print_toml_dict(language: str = Field(..., min_length=1)) -> None:
+def print_toml_dict(language: Annotated[str, MinLength(1)]) -> None:
     """
     Pretty print, or print with TOML-based formatting, the language file of a
     specified language.
@@ -63,4 +71,4 @@ def print_toml_dict(language: str = Field(..., min_length=1)) -> None:
         language (str): the name of the language TOML dict to pretty print
     """
     logger.debug("Printing '%s.toml'", language)
-    print(into_toml_str(language))
+    print(into_toml_str.raw_function(language))
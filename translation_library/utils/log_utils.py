@@ -0,0 +1,153 @@
+import atexit
+import logging
+import os
+import warnings
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from logging.handlers import QueueHandler, QueueListener
+
+LOG_FORMAT = (
+    "[%(levelname)s] (%(asctime)s) %(funcName)s(): %(message)s "
+    "['%(pathname)s:%(lineno)s']"
+)
+
+# Environment variables that turn on library logging, e.g.
+# TRANSLATION_LIBRARY_LOG_LEVEL=DEBUG TRANSLATION_LIBRARY_LOG_FILE=logs/tl.log
+LOG_LEVEL_ENV_VAR = "TRANSLATION_LIBRARY_LOG_LEVEL"
+LOG_FILE_ENV_VAR = "TRANSLATION_LIBRARY_LOG_FILE"
+
+package_logger = logging.getLogger("translation_library")
+
+_queue_handler: "QueueHandler | None" = None
+_listener: "QueueListener | None" = None
+
+# The `[logging]` table of config.toml last applied, so that reloading the
+# config only touches logging when the table changed, and whether the current
+# setup came from it rather than from the environment or `enable_logging()`
+_config_logging: dict[str, object] | None = None
+_enabled_from_config = False
+
+
+def enable_logging(
+    level: int | str = logging.DEBUG, file_path: str | Path | None = None
+) -> None:
+    """
+    Turn on logging for the whole package. Records are handed to a queue and
+    written to the file (or stderr) by a background thread, so logging never
+    blocks the caller on I/O. Calling this again replaces the previous setup.
+
+    Args:
+        level (int | str, optional): the minimum level to log. Defaults to DEBUG.
+        file_path (str | Path | None, optional): the file to log to, or stderr if None. Defaults to None.
+    """
+    global _queue_handler, _listener
+
+    # only pay for importing the handlers when logging is actually turned on
+    import queue
+    from logging.handlers import QueueHandler, QueueListener
+
+    disable_logging()
+    if file_path:
+        Path(file_path).parent.mkdir(parents=True, exist_ok=True)
+        handler: logging.Handler = logging.FileHandler(file_path, encoding="utf-8")
+    else:
+        handler = logging.StreamHandler()
+    handler.setFormatter(logging.Formatter(LOG_FORMAT))
+
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    _queue_handler = QueueHandler(log_queue)
+    _listener = QueueListener(log_queue, handler)
+    _listener.start()
+
+    package_logger.addHandler(_queue_handler)
+    package_logger.setLevel(level.upper() if isinstance(level, str) else level)
+
+
+def disable_logging() -> None:
+    """
+    Turn off package logging, flushing any records still in the queue.
+    """
+    global _queue_handler, _listener, _enabled_from_config
+
+    _enabled_from_config = False
+    if _queue_handler is not None:
+        package_logger.removeHandler(_queue_handler)
+        _queue_handler = None
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
+    package_logger.setLevel(logging.NOTSET)
+
+
+def is_logging_enabled() -> bool:
+    return _queue_handler is not None
+
+
+def _get_level(level: str, source: str) -> int | None:
+    # an invalid level is ignored rather than raised, since this runs while
+    # the package is imported. It is a warning rather than a log record, since
+    # the package logger has no handler until the level is valid
+    level_number = logging.getLevelNamesMapping().get(level.strip().upper())
+    if level_number is None:
+        warnings.warn(
+            f"Ignored invalid log level '{level}' from {source}",
+            RuntimeWarning,
+            stacklevel=3,
+        )
+    return level_number
+
+
+def configure_logging_from_env() -> None:
+    """
+    Turn on package logging if `TRANSLATION_LIBRARY_LOG_LEVEL` is set to a
+    level name, logging to `TRANSLATION_LIBRARY_LOG_FILE` if it is set,
+    otherwise to stderr. An invalid level is warned about and ignored.
+    """
+    if not (level := os.environ.get(LOG_LEVEL_ENV_VAR)):
+        return
+    if (level_number := _get_level(level, LOG_LEVEL_ENV_VAR)) is not None:
+        enable_logging(level_number, os.environ.get(LOG_FILE_ENV_VAR))
+
+
+def configure_logging_from_config(config: dict[str, object]) -> None:
+    """
+    Turn on package logging from the optional `[logging]` table of
+    config.toml, and turn it off again once the table (or its level) is
+    removed. Only a changed table is applied, so reloading the config keeps
+    the current setup. Logging turned on by the environment variables or
+    `enable_logging()` takes precedence over it, and an invalid level is
+    warned about and ignored:
+
+    >>> [logging]
+    >>> level = "DEBUG"
+    >>> file = "logs/translation_library.log"
+
+    Args:
+        config (dict): the parsed contents of config.toml
+    """
+    global _config_logging, _enabled_from_config
+
+    logging_config = config.get("logging")
+    if not isinstance(logging_config, dict):
+        logging_config = None
+    if logging_config == _config_logging:
+        return
+    _config_logging = logging_config
+    if is_logging_enabled() and not _enabled_from_config:
+        return
+
+    if not logging_config or not (level := logging_config.get("level")):
+        if _enabled_from_config:
+            disable_logging()
+        return
+    if (level_number := _get_level(str(level), "config.toml")) is not None:
+        enable_logging(level_number, logging_config.get("file"))  # type: ignore
+        _enabled_from_config = True
+
+
+# make sure queued records are written before the interpreter exits
+atexit.register(disable_logging)
@@ -0,0 +1,355 @@
+import logging
+import re
+import time
+from decimal import Decimal, InvalidOperation
+from typing import Annotated
+
+from translation_library.utils import metrics_utils
+from translation_library.utils.catalog_utils import get_fallback_catalog
+from translation_library.utils.plural_utils import (
+    PLURAL_CATEGORIES,
+    PluralRule,
+    get_plural_rule,
+)
+from translation_library.utils.validation_utils import MinLength, validate_call
+
+logger = logging.getLogger(__name__)
+
+# Tags of the non-literal AST nodes. A message is a tuple of nodes, and each
+# node is either a literal str or a tuple starting with one of these:
+# (_ARG, name), (_POUND,), (_PLURAL, name, offset, exact, forms) and
+# (_SELECT, name, options), where `exact`, `forms` and `options` map each
+# selector to the message of its branch
+_ARG = 0
+_POUND = 1
+_PLURAL = 2
+_SELECT = 3
+
+_LITERAL = re.compile(r"[^'{}#]+")
+_NAME = re.compile(r"\s*([^\s,{}#']+)\s*")
+_SELECTOR = re.compile(r"\s*(=\d+(?:\.\d+)?|[^\s{}]+)\s*")
+_OFFSET = re.compile(r"\s*offset:\s*(\d+)\s*")
+
+
+class _Parser:
+    """
+    A recursive descent parser of the ICU MessageFormat syntax: `{name}`
+    args, `{name, plural, ...}` with an optional `offset:`, `=N` selectors and
+    `#`, `{name, select, ...}`, and apostrophe quoting.
+    """
+
+    def __init__(self, source: str) -> None:
+        self.source = source
+        self.pos = 0
+        self.arguments: set[str] = set()
+
+    def error(self, reason: str) -> ValueError:
+        return ValueError(f"{reason} at {self.pos} in message '{self.source}'")
+
+    def parse_message(self, depth: int, in_plural: bool) -> tuple[object, ...]:
+        source = self.source
+        nodes: list[object] = []
+        literal: list[str] = []
+        while self.pos < len(source):
+            if match := _LITERAL.match(source, self.pos):
+                literal.append(match.group())
+                self.pos = match.end()
+                continue
+            char = source[self.pos]
+            if char == "'":
+                literal.append(self.parse_quoted(in_plural))
+            elif char == "#" and not in_plural:
+                literal.append("#")
+                self.pos += 1
+            elif char == "}":
+                if depth == 0:
+                    raise self.error("unmatched '}'")
+                break
+            else:
+                if literal:
+                    nodes.append("".join(literal))
+                    literal = []
+                self.pos += 1
+                nodes.append(
+                    (_POUND,) if char == "#" else self.parse_argument(depth, in_plural)
+                )
+        if literal:
+            nodes.append("".join(literal))
+        return tuple(nodes)
+
+    def parse_quoted(self, in_plural: bool) -> str:
+        # `''` is an apostrophe, and an apostrophe before a syntax char starts
+        # a quoted literal up to the next lone apostrophe. Any other apostrophe
+        # is kept as is, so that e.g. "don't" needs no escaping
+        source = self.source
+        next_char = source[self.pos + 1 : self.pos + 2]
+        if next_char == "'":
+            self.pos += 2
+            return "'"
+        if next_char not in ("{", "}") and not (in_plural and next_char == "#"):
+            self.pos += 1
+            return "'"
+
+        quoted: list[str] = []
+        self.pos += 1
+        while self.pos < len(source):
+            end = source.find("'", self.pos)
+            if end == -1:
+                break
+            quoted.append(source[self.pos : end])
+            if source[end + 1 : end + 2] == "'":
+                quoted.append("'")
+                self.pos = end + 2
+                continue
+            self.pos = end + 1
+            return "".join(quoted)
+        # an unterminated quote runs to the end of the message
+        quoted.append(source[self.pos :])
+        self.pos = len(source)
+        return "".join(quoted)
+
+    def expect(self, char: str) -> None:
+        if self.source[self.pos : self.pos + 1] != char:
+            raise self.error(f"expected '{char}'")
+        self.pos += 1
+
+    def parse_argument(self, depth: int, in_plural: bool) -> tuple[object, ...]:
+        if not (match := _NAME.match(self.source, self.pos)):
+            raise self.error("expected an argument name")
+        name = match.group(1)
+        self.pos = match.end()
+        self.arguments.add(name)
+        if self.source[self.pos : self.pos + 1] == "}":
+            self.pos += 1
+            return (_ARG, name)
+
+        self.expect(",")
+        if not (match := _NAME.match(self.source, self.pos)):
+            raise self.error("expected an argument type")
+        arg_type = match.group(1)
+        self.pos = match.end()
+        if arg_type not in ("plural", "select"):
+            raise self.error(f"unsupported argument type '{arg_type}'")
+        self.expect(",")
+
+        offset = 0
+        if arg_type == "plural" and (match := _OFFSET.match(self.source, self.pos)):
+            offset = int(match.group(1))
+            self.pos = match.end()
+
+        branches: dict[str, tuple[object, ...]] = {}
+        while True:
+            if self.source[self.pos : self.pos + 1] == "}":
+                self.pos += 1
+                break
+            if not (match := _SELECTOR.match(self.source, self.pos)):
+                raise self.error("expected a selector or '}'")
+            selector = match.group(1)
+            self.pos = match.end()
+            if arg_type == "plural" and not (
+                selector.startswith("=") or selector in PLURAL_CATEGORIES
+            ):
+                raise self.error(f"unknown plural selector '{selector}'")
+            self.expect("{")
+            branches[selector] = self.parse_message(
+                depth + 1, in_plural or arg_type == "plural"
+            )
+            self.expect("}")
+            while self.source[self.pos : self.pos + 1].isspace():
+                self.pos += 1
+
+        if "other" not in branches:
+            raise self.error(f"'{name}' has no 'other' branch")
+        if arg_type == "select":
+            return (_SELECT, name, branches)
+
+        exact: dict[int | float | Decimal, tuple[object, ...]] = {}
+        forms: dict[str, tuple[object, ...]] = {}
+        for selector, branch in branches.items():
+            if selector.startswith("="):
+                exact[_to_number(selector[1:])] = branch
+            else:
+                forms[selector] = branch
+        return (_PLURAL, name, offset, exact, forms)
+
+
+def _to_number(value: object) -> int | float | Decimal:
+    if isinstance(value, (int, float, Decimal)):
+        return value
+    try:
+        number = Decimal(str(value))
+    except InvalidOperation as e:
+        raise TypeError(f"'{value}' is not a number") from e
+    # equal numbers hash equally, so `=1` matches 1, 1.0 and Decimal("1")
+    return int(number) if number == number.to_integral_value() else number
+
+
+def _render(
+    nodes: tuple[object, ...],
+    args: dict[str, object],
+    plural_rule: PluralRule,
+    parts: list[str],
+    pound: object,
+) -> None:
+    for node in nodes:
+        if node.__class__ is str:
+            parts.append(node)  # type: ignore
+            continue
+        tag = node[0]  # type: ignore
+        if tag == _ARG:
+            parts.append(str(args[node[1]]))  # type: ignore
+        elif tag == _POUND:
+            parts.append(str(pound))
+        elif tag == _PLURAL:
+            _, name, offset, exact, forms = node  # type: ignore
+            number = _to_number(args[name])
+            branch = exact.get(number)
+            if branch is None:
+                if offset:
+                    number -= offset
+                # an empty branch is a valid one, so only a missing form falls back
+                branch = forms.get(plural_rule.select(number))
+                if branch is None:
+                    branch = forms["other"]
+            elif offset:
+                number -= offset
+            _render(branch, args, plural_rule, parts, number)
+        else:
+            _, name, options = node  # type: ignore
+            branch = options.get(str(args[name]))
+            if branch is None:
+                branch = options["other"]
+            _render(branch, args, plural_rule, parts, pound)
+
+
+class CompiledMessage:
+    """
+    An ICU MessageFormat-style message parsed once into a compact AST of
+    tuples, so that rendering is a walk over the tree without reparsing:
+
+    >>> "{count, plural, =0 {No files} one {# file} other {# files}}"
+    """
+
+    __slots__ = ("source", "arguments", "_nodes")
+
+    def __init__(self, source: str) -> None:
+        """
+        Args:
+            source (str): the message
+
+        Raises:
+            ValueError: if the message is not valid MessageFormat syntax
+        """
+        parser = _Parser(source)
+        self._nodes = parser.parse_message(depth=0, in_plural=False)
+        self.source = source
+        self.arguments: frozenset[str] = frozenset(parser.arguments)
+
+    def render(self, args: dict[str, object], plural_rule: PluralRule) -> str:
+        """
+        Render the message with the given args.
+
+        Args:
+            args (dict): a mapping of argument names to their values
+            plural_rule (PluralRule): the plural rule of the message's language
+
+        Raises:
+            KeyError: if an argument that the message reaches is not in `args`
+            TypeError: if the value of a plural argument is not a number
+
+        Returns:
+            str: the rendered message
+        """
+        parts: list[str] = []
+        try:
+            _render(self._nodes, args, plural_rule, parts, None)
+        except KeyError as e:
+            logger.error("Missing arg %s for message '%s'", e, self.source)
+            raise KeyError(f"missing arg {e} for message '{self.source}'") from None
+        return "".join(parts)
+
+    def __repr__(self) -> str:
+        return f"CompiledMessage({self.source!r})"
+
+
+# The parsed message of each (language, key path), checked against the
+# current value of the key so that reloaded or edited values are parsed again
+_messages: dict[tuple[str, str], CompiledMessage] = {}
+
+
+def get_message(language: str, key_path: str) -> CompiledMessage:
+    """
+    Get the parsed message of a key, looked up along the language's
+    fallback chain. Messages are parsed on first use and cached per
+    language and key path.
+
+    Args:
+        language (str): the code of the language
+        key_path (str): the path to the key, such as `inbox.count`
+
+    Raises:
+        PathAccessError: if the key path does not exist in the language
+        TypeError: if the value of the key path is not a str
+        ValueError: if the value is not valid MessageFormat syntax
+
+    Returns:
+        CompiledMessage: the parsed message
+    """
+    value = get_fallback_catalog(language).get(key_path)
+    message = _messages.get((language, key_path))
+    if message is not None and (message.source is value or message.source == value):
+        return message
+
+    if not isinstance(value, str):
+        logger.error("'%s' in '%s' is not a str", key_path, language)
+        raise TypeError(f"'{key_path}' in '{language}' is not a str")
+    message = _messages[(language, key_path)] = CompiledMessage(value)
+    return message
+
+
+def clear_message_cache() -> None:
+    """
+    Drop every parsed message.
+    """
+    _messages.clear()
+
+
+@validate_call
+def format_message(
+    language: Annotated[str, MinLength(1)],
+    key_path: Annotated[str, MinLength(1)],
+    /,
+    **args: object,
+) -> str:
+    """
+    Get an ICU MessageFormat-style message from a language and render it,
+    picking plural forms with the language's plural rule from config.toml:
+
+    >>> # files = "{count, plural, =0 {No files} one {# file} other {# files}}"
+    >>> format_message("en", "files", count=3)
+    "3 files"
+
+    Args:
+        language (str): the code of the language
+        key_path (str): the path to the key in the language
+        **args (object): the values of the message's arguments
+
+    Raises:
+        PathAccessError: if the key path does not exist in the language
+        TypeError: if the value is not a str, or a plural arg is not a number
+        ValueError: if the value is not valid MessageFormat syntax
+        KeyError: if an argument the message reaches was not given in `args`
+
+    Returns:
+        str: the rendered message
+    """
+    start = time.perf_counter() if metrics_utils.enabled else None
+    try:
+        return get_message(language, key_path).render(args, get_plural_rule(language))
+    finally:
+        if start is not None:
+            metrics_utils.observe(
+                metrics_utils.FORMAT_MESSAGE_SECONDS,
+                language,
+                time.perf_counter() - start,
+            )
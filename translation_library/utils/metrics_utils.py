@@ -0,0 +1,393 @@
+import atexit
+import json
+import logging
+import os
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Iterator, TypeVar
+
+from translation_library.utils.config_utils import get_language_code_set
+
+if TYPE_CHECKING:
+    import cProfile
+    import pstats
+
+logger = logging.getLogger(__name__)
+
+# Set to "1" to record metrics from the start, e.g.
+# TRANSLATION_LIBRARY_METRICS=1 python -m translation_library serve
+METRICS_ENV_VAR = "TRANSLATION_LIBRARY_METRICS"
+
+# Names of the metrics recorded by the library. Latencies are histograms in
+# seconds, whose counts are the number of calls, and the rest are counters.
+# Every metric is recorded per language code of config.toml, and anything else
+# a caller passed as a language under `UNKNOWN_LANGUAGE`, so that raw user
+# input cannot grow the number of series
+CATALOG_LOAD_SECONDS = "catalog_load_seconds"
+TOML_PARSE_SECONDS = "toml_parse_seconds"
+CACHE_HITS = "cache_hits"
+CACHE_MISSES = "cache_misses"
+LOOKUP_SECONDS = "lookup_seconds"
+FORMAT_SECONDS = "format_seconds"
+FORMAT_MESSAGE_SECONDS = "format_message_seconds"
+UNKNOWN_LANGUAGE = "unknown"
+
+# Upper bounds of the latency buckets: 4 per doubling from 100ns to about 13s,
+# so a percentile is off by at most 19%. Slower calls land in one more bucket
+LATENCY_BUCKETS = tuple(1e-7 * 2 ** (i / 4) for i in range(108))
+
+MetricsExporter = Callable[[dict[str, object]], None]
+
+_T = TypeVar("_T")
+
+
+class LatencyHistogram:
+    """
+    Counts of latencies in exponential buckets, so recording a latency is a
+    binary search and percentiles are read off the bucket counts.
+    """
+
+    __slots__ = ("counts", "count", "total", "min", "max")
+
+    def __init__(self) -> None:
+        self.counts = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.min = 0.0
+        self.max = 0.0
+
+    def observe(self, seconds: float) -> None:
+        self.counts[bisect_left(LATENCY_BUCKETS, seconds)] += 1
+        if not self.count or seconds < self.min:
+            self.min = seconds
+        if seconds > self.max:
+            self.max = seconds
+        self.count += 1
+        self.total += seconds
+
+    def quantile(self, q: float) -> float:
+        """
+        Estimate a quantile of the recorded latencies.
+
+        Args:
+            q (float): the quantile, between 0 and 1
+
+        Returns:
+            float: the upper bound of the bucket holding the quantile, in
+            seconds, or 0 if nothing was recorded
+        """
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for idx, bucket_count in enumerate(self.counts):
+            seen += bucket_count
+            if bucket_count and seen >= rank:
+                if idx == len(LATENCY_BUCKETS):
+                    return self.max
+                return min(max(LATENCY_BUCKETS[idx], self.min), self.max)
+        return self.max
+
+    def to_dict(self) -> dict[str, object]:
+        return {
+            "count": self.count,
+            "sum": self.total,
+            "min": self.min,
+            "max": self.max,
+            "mean": self.total / self.count if self.count else 0.0,
+            "p50": self.quantile(0.5),
+            "p90": self.quantile(0.9),
+            "p99": self.quantile(0.99),
+            # (upper bound, count) of every bucket that recorded a latency
+            "buckets": [
+                [
+                    LATENCY_BUCKETS[idx] if idx < len(LATENCY_BUCKETS) else self.max,
+                    bucket_count,
+                ]
+                for idx, bucket_count in enumerate(self.counts)
+                if bucket_count
+            ],
+        }
+
+
+class _Registry:
+    """
+    The counters and histograms recorded since the registry was created or
+    last reset, keyed by metric name and language code.
+    """
+
+    __slots__ = ("lock", "counters", "histograms")
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.counters: dict[tuple[str, str], int] = {}
+        self.histograms: dict[tuple[str, str], LatencyHistogram] = {}
+
+    def snapshot(self) -> dict[str, object]:
+        counters: dict[str, dict[str, int]] = {}
+        histograms: dict[str, dict[str, dict[str, object]]] = {}
+        with self.lock:
+            for (name, language), value in sorted(self.counters.items()):
+                counters.setdefault(name, {})[language] = value
+            for (name, language), histogram in sorted(self.histograms.items()):
+                histograms.setdefault(name, {})[language] = histogram.to_dict()
+        return {"counters": counters, "histograms": histograms}
+
+
+# Read by the instrumented hot paths before they take any timestamp, so that
+# disabled metrics only cost checking this flag. True while `_registries` is
+# not empty. Use `enable_metrics()` and `profile_lookups()` to change it
+enabled = False
+
+# Every registry that records metrics: the global one while metrics are
+# enabled, and one per active `profile_lookups()` block. Replaced rather than
+# mutated, so recording never needs a lock to iterate it
+_global_registry = _Registry()
+_registries: tuple[_Registry, ...] = ()
+_registries_lock = threading.Lock()
+
+_exporter: MetricsExporter | None = None
+_export_stop: threading.Event | None = None
+
+
+def _set_registries(registries: tuple[_Registry, ...]) -> None:
+    # called with `_registries_lock` held
+    global _registries, enabled
+    _registries = registries
+    enabled = bool(registries)
+
+
+def enable_metrics() -> None:
+    """
+    Start recording metrics into the global registry. While metrics are
+    disabled, the instrumented functions only check a flag.
+    """
+    with _registries_lock:
+        if _global_registry not in _registries:
+            _set_registries(_registries + (_global_registry,))
+
+
+def disable_metrics() -> None:
+    """
+    Stop recording metrics into the global registry. What was recorded so far
+    is kept until `reset_metrics()`.
+    """
+    with _registries_lock:
+        _set_registries(tuple(r for r in _registries if r is not _global_registry))
+
+
+def is_metrics_enabled() -> bool:
+    return _global_registry in _registries
+
+
+def _get_series_key(
+    series: dict[tuple[str, str], _T], name: str, language: str
+) -> tuple[str, str]:
+    # only a new series needs its language checked against config.toml
+    key = (name, language)
+    if key in series:
+        return key
+    try:
+        if language in get_language_code_set():
+            return key
+    except Exception:
+        # e.g. a broken config.toml, which the lookup itself reports
+        pass
+    return (name, UNKNOWN_LANGUAGE)
+
+
+def increment(name: str, language: str, amount: int = 1) -> None:
+    """
+    Add to a counter of every recording registry.
+
+    Args:
+        name (str): the name of the counter, such as `cache_hits`
+        language (str): the language code the count belongs to
+        amount (int, optional): what to add. Defaults to 1.
+    """
+    for registry in _registries:
+        with registry.lock:
+            key = _get_series_key(registry.counters, name, language)
+            registry.counters[key] = registry.counters.get(key, 0) + amount
+
+
+def observe(name: str, language: str, seconds: float) -> None:
+    """
+    Record a latency in a histogram of every recording registry.
+
+    Args:
+        name (str): the name of the histogram, such as `lookup_seconds`
+        language (str): the language code the latency belongs to
+        seconds (float): the latency
+    """
+    for registry in _registries:
+        with registry.lock:
+            key = _get_series_key(registry.histograms, name, language)
+            if (histogram := registry.histograms.get(key)) is None:
+                histogram = registry.histograms[key] = LatencyHistogram()
+            histogram.observe(seconds)
+
+
+def get_metrics_snapshot() -> dict[str, object]:
+    """
+    Get the metrics of the global registry as a JSON-serializable dict of
+    each metric name mapped to its value per language code:
+
+    >>> get_metrics_snapshot()
+    {"counters": {"cache_hits": {"en": 41}}, "histograms": {"lookup_seconds":
+    {"en": {"count": 42, "sum": 1.3e-05, "min": 2.1e-07, "max": 4.1e-06,
+    "mean": 3.1e-07, "p50": 2.4e-07, "p90": 3.4e-07, "p99": 4.1e-06,
+    "buckets": [[2.38e-07, 30], ...]}}}}
+
+    Returns:
+        dict: the `counters` and latency `histograms` recorded so far
+    """
+    return _global_registry.snapshot()
+
+
+def reset_metrics() -> None:
+    """
+    Drop every metric recorded into the global registry.
+    """
+    with _global_registry.lock:
+        _global_registry.counters.clear()
+        _global_registry.histograms.clear()
+
+
+def log_exporter(snapshot: dict[str, object]) -> None:
+    """
+    An exporter that logs each snapshot as a JSON line at the INFO level.
+    """
+    logger.info("Metrics: %s", json.dumps(snapshot))
+
+
+class JsonLinesExporter:
+    """
+    An exporter that appends each snapshot to a file as a JSON line, with the
+    Unix time it was taken at.
+    """
+
+    def __init__(self, file_path: str | Path) -> None:
+        self.file_path = Path(file_path)
+
+    def __call__(self, snapshot: dict[str, object]) -> None:
+        line = json.dumps({"time": time.time(), **snapshot})
+        with open(self.file_path, "a", encoding="utf-8") as file:
+            file.write(line + "\n")
+
+
+def export_metrics() -> None:
+    """
+    Pass a snapshot of the global registry to the exporter set with
+    `set_metrics_exporter()`, if any. Exporter errors are logged, not raised.
+    """
+    if (exporter := _exporter) is None:
+        return
+    try:
+        exporter(get_metrics_snapshot())
+    except Exception:
+        logger.exception("Could not export metrics due to:")
+
+
+def _export_periodically(interval: float, stop: threading.Event) -> None:
+    while not stop.wait(interval):
+        export_metrics()
+
+
+def set_metrics_exporter(
+    exporter: MetricsExporter | None, interval: float | None = None
+) -> None:
+    """
+    Set where `export_metrics()` sends snapshots of the global registry. An
+    exporter is any callable that takes the dict of `get_metrics_snapshot()`,
+    such as `log_exporter` or a `JsonLinesExporter`. A last snapshot is
+    exported when the interpreter exits.
+
+    Args:
+        exporter (MetricsExporter | None): the exporter, or None to remove it
+        interval (float | None, optional): also export every this many seconds
+        from a background thread. Defaults to None.
+    """
+    global _exporter, _export_stop
+
+    if _export_stop is not None:
+        _export_stop.set()
+        _export_stop = None
+    _exporter = exporter
+    if exporter is not None and interval:
+        _export_stop = threading.Event()
+        threading.Thread(
+            target=_export_periodically,
+            args=(interval, _export_stop),
+            name="metrics-exporter",
+            daemon=True,
+        ).start()
+
+
+class LookupProfile:
+    """
+    What `profile_lookups()` recorded during its block. Filled in when the
+    block exits.
+    """
+
+    def __init__(self) -> None:
+        self.seconds = 0.0
+        self.metrics: dict[str, object] = {"counters": {}, "histograms": {}}
+        # the cProfile stats of the block, if it was asked for
+        self.stats: "pstats.Stats | None" = None
+
+
+@contextmanager
+def profile_lookups(cprofile: bool = False) -> Iterator[LookupProfile]:
+    """
+    Record the metrics of the lookups made in a block, whether or not metrics
+    are enabled globally:
+
+    >>> with profile_lookups() as profile:
+    >>>     format_i18n("en", "start.welcome", name="Blake")
+    >>> profile.metrics["histograms"]["format_seconds"]["en"]["p50"]
+
+    Lookups made by other threads during the block are recorded too.
+
+    Args:
+        cprofile (bool, optional): also run the block under `cProfile` and
+        keep its `pstats.Stats`. Defaults to False.
+
+    Yields:
+        LookupProfile: the wall time and metrics of the block, once it exits
+    """
+    profile = LookupProfile()
+    registry = _Registry()
+    profiler: "cProfile.Profile | None" = None
+    if cprofile:
+        import cProfile
+
+        profiler = cProfile.Profile()
+
+    with _registries_lock:
+        _set_registries(_registries + (registry,))
+    start = time.perf_counter()
+    if profiler is not None:
+        profiler.enable()
+    try:
+        yield profile
+    finally:
+        if profiler is not None:
+            profiler.disable()
+        profile.seconds = time.perf_counter() - start
+        with _registries_lock:
+            _set_registries(tuple(r for r in _registries if r is not registry))
+        profile.metrics = registry.snapshot()
+        if profiler is not None:
+            import pstats
+
+            profile.stats = pstats.Stats(profiler)
+
+
+if os.environ.get(METRICS_ENV_VAR, "0") not in ("", "0"):
+    enable_metrics()
+
+atexit.register(export_metrics)
@@ -1,11 +1,15 @@
 import logging
 from os.path import exists
 from pathlib import Path
+from typing import Annotated
 
-from pydantic import Field, validate_call
+from translation_library.utils.validation_utils import MinLength, validate_call
 
 logger = logging.getLogger(__name__)
 
+# Project roots already found by `get_project_root()`, keyed by anchor
+_project_roots: dict[str, Path] = {}
+
 
 def valid_path_validator(v: str | Path) -> Path:
     """
@@ -40,10 +44,11 @@ def valid_path_validator(v: str | Path) -> Path:
 
 @validate_call
 def get_project_root(
-    anchor: str = Field(default=".git", min_length=1),
+    anchor: Annotated[str, MinLength(1)] = ".git",
 ) -> Path:
     """
-    Find and return the path of the root path of the project.
+    Find and return the path of the root path of the project. The parent dirs
+    are only searched the first time for each anchor.
 
     Args:
         anchor (str, optional): a known file/dir that exists in the project root. Defaults to ".git".
@@ -54,11 +59,23 @@ def get_project_root(
     Returns:
         Path: the path of the project root
     """
+    if project_root := _project_roots.get(anchor):
+        return project_root
+
     current_path = Path(__file__).resolve()
     for parent in current_path.parents:
         if (parent / anchor).exists():
+            _project_roots[anchor] = parent
             return parent
     logger.error("'anchor' arg '%s' was not in parents of %s", anchor, current_path)
     raise FileNotFoundError(
         f"Could not find '{anchor}' in the parent dirs of '{current_path}'"
     )
+
+
+def clear_project_root_cache() -> None:
+    """
+    Forget every project root found by `get_project_root()`, so that the next
+    call searches the parent dirs again.
+    """
+    _project_roots.clear()
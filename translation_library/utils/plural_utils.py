@@ -0,0 +1,312 @@
+import logging
+import re
+from decimal import Decimal, InvalidOperation
+from typing import Callable
+
+from translation_library.utils.config_utils import get_config
+
+logger = logging.getLogger(__name__)
+
+# The plural categories of CLDR, in the order their rules are tried
+PLURAL_CATEGORIES = ("zero", "one", "two", "few", "many", "other")
+
+# CLDR cardinal plural rules of common languages, keyed by the base language
+# subtag. Languages that only have `other` map to an empty dict. See
+# https://www.unicode.org/cldr/charts/latest/supplemental/language_plural_rules.html
+_MILLIONS = "e = 0 and i != 0 and i % 1000000 = 0 and v = 0 or e != 0..5"
+BUILTIN_PLURAL_RULES: dict[str, dict[str, str]] = {
+    "ar": {
+        "zero": "n = 0",
+        "one": "n = 1",
+        "two": "n = 2",
+        "few": "n % 100 = 3..10",
+        "many": "n % 100 = 11..99",
+    },
+    "cs": {"one": "i = 1 and v = 0", "few": "i = 2..4 and v = 0", "many": "v != 0"},
+    "da": {"one": "n = 1 or t != 0 and i = 0,1"},
+    "de": {"one": "i = 1 and v = 0"},
+    "en": {"one": "i = 1 and v = 0"},
+    "es": {"one": "n = 1", "many": _MILLIONS},
+    "fi": {"one": "i = 1 and v = 0"},
+    "fr": {"one": "i = 0,1", "many": _MILLIONS},
+    "he": {"one": "i = 1 and v = 0 or i = 0 and v != 0", "two": "i = 2 and v = 0"},
+    "hi": {"one": "i = 0 or n = 1"},
+    "it": {"one": "i = 1 and v = 0", "many": _MILLIONS},
+    "ja": {},
+    "ko": {},
+    "nb": {"one": "n = 1"},
+    "nl": {"one": "i = 1 and v = 0"},
+    "pl": {
+        "one": "i = 1 and v = 0",
+        "few": "v = 0 and i % 10 = 2..4 and i % 100 != 12..14",
+        "many": (
+            "v = 0 and i != 1 and i % 10 = 0..1 or v = 0 and i % 10 = 5..9 "
+            "or v = 0 and i % 100 = 12..14"
+        ),
+    },
+    "pt": {"one": "i = 0..1", "many": _MILLIONS},
+    "ru": {
+        "one": "v = 0 and i % 10 = 1 and i % 100 != 11",
+        "few": "v = 0 and i % 10 = 2..4 and i % 100 != 12..14",
+        "many": (
+            "v = 0 and i % 10 = 0 or v = 0 and i % 10 = 5..9 "
+            "or v = 0 and i % 100 = 11..14"
+        ),
+    },
+    "sk": {"one": "i = 1 and v = 0", "few": "i = 2..4 and v = 0", "many": "v != 0"},
+    "sv": {"one": "i = 1 and v = 0"},
+    "tr": {"one": "n = 1"},
+    "uk": {
+        "one": "v = 0 and i % 10 = 1 and i % 100 != 11",
+        "few": "v = 0 and i % 10 = 2..4 and i % 100 != 12..14",
+        "many": (
+            "v = 0 and i % 10 = 0 or v = 0 and i % 10 = 5..9 "
+            "or v = 0 and i % 100 = 11..14"
+        ),
+    },
+    "zh": {},
+}
+
+# The position of each CLDR operand in the tuple of `get_plural_operands()`.
+# `c` is a deprecated synonym of `e`
+_OPERANDS = {"n": 0, "i": 1, "v": 2, "w": 3, "f": 4, "t": 5, "e": 6, "c": 6}
+_TOKEN = re.compile(r"\s*(\.\.|!=|=|%|,|[a-z]+|\d+)")
+
+Operands = tuple[int | Decimal, int, int, int, int, int, int]
+Condition = Callable[[Operands], bool]
+
+
+def get_plural_operands(number: int | float | Decimal | str) -> Operands:
+    """
+    Get the CLDR plural operands of a number: its absolute value `n`,
+    integer digits `i`, visible fraction digits with (`v`, `f`) and without
+    (`w`, `t`) trailing zeros, and its compact exponent `e`, which is 0.
+
+    Args:
+        number (int | float | Decimal | str): the number, e.g. `1.50`
+
+    Raises:
+        TypeError: if the number is not a number or a numeric str
+
+    Returns:
+        tuple: the `(n, i, v, w, f, t, e)` operands
+    """
+    if isinstance(number, int):
+        number = abs(number)
+        return number, number, 0, 0, 0, 0, 0
+    try:
+        # repr keeps the shortest digits of a float, e.g. 1.5 instead of 1.499...
+        decimal = abs(Decimal(repr(number) if isinstance(number, float) else number))
+        integer_digits, _, fraction_digits = format(decimal, "f").partition(".")
+    except (InvalidOperation, ValueError) as e:
+        raise TypeError(f"'{number}' is not a number") from e
+    significant_digits = fraction_digits.rstrip("0")
+    return (
+        decimal,
+        int(integer_digits),
+        len(fraction_digits),
+        len(significant_digits),
+        int(fraction_digits or 0),
+        int(significant_digits or 0),
+        0,
+    )
+
+
+def _compile_relation(
+    operand_idx: int, modulus: int | None, negate: bool, ranges: list[tuple[int, int]]
+) -> Condition:
+    def relation(operands: Operands) -> bool:
+        value = operands[operand_idx]
+        if modulus is not None:
+            value %= modulus
+        # a range only matches integers, so e.g. 2.5 is not in 2..4
+        matched = value % 1 == 0 and any(low <= value <= high for low, high in ranges)
+        return matched != negate
+
+    return relation
+
+
+def compile_plural_condition(condition: str) -> Condition:
+    """
+    Compile a CLDR plural rule condition, such as
+    `v = 0 and i % 10 = 2..4 and i % 100 != 12..14`, into a function of the
+    operands of a number. Samples after an `@` are ignored.
+
+    Args:
+        condition (str): the CLDR rule condition
+
+    Raises:
+        ValueError: if the condition is not valid CLDR plural rule syntax
+
+    Returns:
+        Callable: a function that checks the condition against the tuple of
+        `get_plural_operands()`
+    """
+    text = condition.partition("@")[0].strip()
+    tokens: list[str] = []
+    pos = 0
+    while pos < len(text):
+        if not (match := _TOKEN.match(text, pos)):
+            raise ValueError(f"invalid plural rule '{condition}' at {pos}")
+        tokens.append(match.group(1))
+        pos = match.end()
+        if not text[pos:].strip():
+            break
+    if not tokens:
+        raise ValueError("empty plural rule")
+
+    idx = 0
+
+    def take(*expected: str) -> str:
+        nonlocal idx
+        if idx >= len(tokens) or (expected and tokens[idx] not in expected):
+            raise ValueError(f"invalid plural rule '{condition}'")
+        idx += 1
+        return tokens[idx - 1]
+
+    def take_int() -> int:
+        token = take()
+        if not token.isdigit():
+            raise ValueError(f"invalid plural rule '{condition}'")
+        return int(token)
+
+    or_conditions: list[list[Condition]] = [[]]
+    while True:
+        operand = take(*_OPERANDS)
+        modulus = None
+        if idx < len(tokens) and tokens[idx] == "%":
+            take("%")
+            modulus = take_int()
+        negate = take("=", "!=") == "!="
+        ranges: list[tuple[int, int]] = []
+        while True:
+            low = take_int()
+            high = low
+            if idx < len(tokens) and tokens[idx] == "..":
+                take("..")
+                high = take_int()
+            ranges.append((low, high))
+            if idx < len(tokens) and tokens[idx] == ",":
+                take(",")
+                continue
+            break
+        or_conditions[-1].append(
+            _compile_relation(_OPERANDS[operand], modulus, negate, ranges)
+        )
+
+        if idx == len(tokens):
+            break
+        if take("and", "or") == "or":
+            or_conditions.append([])
+
+    and_conditions = [tuple(relations) for relations in or_conditions]
+    if len(and_conditions) == 1 and len(and_conditions[0]) == 1:
+        return and_conditions[0][0]
+    return lambda operands: any(
+        all(relation(operands) for relation in relations)
+        for relations in and_conditions
+    )
+
+
+class PluralRule:
+    """
+    The cardinal plural rule of a language, compiled from CLDR rule
+    conditions once so that picking the category of a number only calls the
+    precomputed condition functions.
+    """
+
+    __slots__ = ("categories", "_conditions")
+
+    def __init__(self, rules: dict[str, str]) -> None:
+        """
+        Args:
+            rules (dict[str, str]): each plural category (but `other`) mapped
+            to its CLDR rule condition
+
+        Raises:
+            ValueError: if a category or condition is not valid
+        """
+        if unknown := set(rules).difference(PLURAL_CATEGORIES[:-1]):
+            raise ValueError(f"unknown plural categories {sorted(unknown)}")
+        conditions: list[tuple[str, Condition]] = []
+        for category in PLURAL_CATEGORIES[:-1]:
+            if category in rules:
+                conditions.append((category, compile_plural_condition(rules[category])))
+        self._conditions = tuple(conditions)
+        self.categories = tuple(category for category, _ in conditions) + ("other",)
+
+    def select(self, number: int | float | Decimal | str) -> str:
+        """
+        Get the plural category of a number.
+
+        Args:
+            number (int | float | Decimal | str): the number
+
+        Raises:
+            TypeError: if the number is not a number or a numeric str
+
+        Returns:
+            str: one of `zero`, `one`, `two`, `few`, `many` or `other`
+        """
+        operands = get_plural_operands(number)
+        for category, condition in self._conditions:
+            if condition(operands):
+                return category
+        return "other"
+
+    def __repr__(self) -> str:
+        return f"PluralRule(categories={self.categories})"
+
+
+# The plural rule of each language, with the config it was built from
+_plural_rules: tuple[dict[str, object], dict[str, PluralRule]] | None = None
+
+
+def _build_plural_rule(code: str, config: dict[str, object]) -> PluralRule:
+    languages: dict[str, dict[str, object]] = config["languages"]  # type: ignore
+    rules = languages.get(code, {}).get("plural_rules")
+    if isinstance(rules, dict):
+        return PluralRule(rules)
+
+    # a str names the language whose built-in rules to use
+    base_code = str(rules or code).lower().replace("_", "-").split("-")[0]
+    if base_code not in BUILTIN_PLURAL_RULES:
+        if rules:
+            raise ValueError(f"no built-in plural rules for '{rules}'")
+        logger.warning("No plural rules for '%s', so every number is 'other'", code)
+    return PluralRule(BUILTIN_PLURAL_RULES.get(base_code, {}))
+
+
+def get_plural_rule(code: str) -> PluralRule:
+    """
+    Get the plural rule of a language. It comes from the optional
+    `plural_rules` of the language in config.toml, which either names a
+    language with built-in rules or lists CLDR conditions per category:
+
+    >>> [languages.de-at]
+    >>> plural_rules = "de"
+    >>> [languages.xx]
+    >>> plural_rules = { one = "i = 1 and v = 0", few = "i = 2..4" }
+
+    Languages without `plural_rules` use the built-in rules of their code (or
+    of its base subtag, e.g. `pt` for `pt-br`). Rules are compiled once per
+    version of config.toml.
+
+    Args:
+        code (str): the language code
+
+    Raises:
+        ValueError: if the `plural_rules` of the language are not valid
+
+    Returns:
+        PluralRule: the compiled plural rule of the language
+    """
+    global _plural_rules
+
+    config = get_config()
+    cached = _plural_rules
+    if cached is None or cached[0] is not config:
+        cached = _plural_rules = (config, {})
+    if (rule := cached[1].get(code)) is None:
+        rule = cached[1][code] = _build_plural_rule(code, config)
+    return rule
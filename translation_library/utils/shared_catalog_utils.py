@@ -0,0 +1,262 @@
+import json
+import logging
+import os
+import struct
+import sys
+from multiprocessing import resource_tracker, shared_memory
+
+from translation_library.utils.binary_catalog_utils import (
+    MappedCatalog,
+    build_compiled_catalog,
+)
+from translation_library.utils.catalog_utils import (
+    Catalog,
+    remove_catalog,
+    set_catalog,
+)
+from translation_library.utils.config_utils import (
+    get_all_language_codes,
+    get_language_file_path,
+)
+
+logger = logging.getLogger(__name__)
+
+# Set by `share_catalogs()` so that worker processes started afterwards can
+# call `attach_shared_catalogs()` without being told the segment name
+SHARED_CATALOGS_ENV_VAR = "TRANSLATION_LIBRARY_SHARED_CATALOGS"
+
+# Layout of a segment: magic, the length of a JSON directory of every language
+# (source file, offset and size of its compiled catalog), the directory, and
+# then each compiled catalog, 8-byte aligned
+_MAGIC = b"TLSHARED"
+_HEADER = struct.Struct("<8sI")
+_ALIGNMENT = 8
+
+
+def _align(offset: int) -> int:
+    return -(-offset // _ALIGNMENT) * _ALIGNMENT
+
+
+def _attach_shared_memory(name: str) -> shared_memory.SharedMemory:
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name, track=False)  # type: ignore
+
+    # before 3.13 attaching registers the segment with this process's resource
+    # tracker, and a tracker started only for this process would unlink the
+    # segment when it exits. Processes started by `multiprocessing` share the
+    # tracker of the owner instead, which keeps a set of names rather than a
+    # count, so unregistering there would drop the owner's own registration.
+    # There is no public way to tell the two apart, so the tracker's pipe is
+    # checked: it is only open once the tracker was inherited or started
+    tracker_running = getattr(resource_tracker._resource_tracker, "_fd", None)
+    segment = shared_memory.SharedMemory(name)
+    if tracker_running is None:
+        resource_tracker.unregister(segment._name, "shared_memory")  # type: ignore
+    return segment
+
+
+class SharedCatalogs:
+    """
+    The compiled catalogs of several languages in a single
+    `multiprocessing.shared_memory` segment. A parent process creates the
+    segment once and worker processes attach to it read-only, so every
+    worker looks up strings from the same physical pages instead of parsing
+    and holding its own copy of every language file.
+    """
+
+    def __init__(
+        self,
+        segment: shared_memory.SharedMemory,
+        catalogs: dict[str, MappedCatalog],
+        is_owner: bool,
+    ) -> None:
+        self.segment = segment
+        self.catalogs = catalogs
+        self.is_owner = is_owner
+
+    @property
+    def name(self) -> str:
+        return self.segment.name
+
+    @classmethod
+    def create(
+        cls, codes: list[str] | None = None, name: str | None = None
+    ) -> "SharedCatalogs":
+        """
+        Load languages from their TOML files into a new shared memory segment.
+
+        Args:
+            codes (list[str] | None, optional): the language codes to load.
+            Defaults to every language under `[languages]` in config.toml.
+            name (str | None, optional): the segment name. Defaults to a random one.
+
+        Raises:
+            PathAccessError: if a language is not listed in config.toml
+            FileNotFoundError: if a language file does not exist
+
+        Returns:
+            SharedCatalogs: the catalogs, owned by this process
+        """
+        directory: dict[str, dict[str, object]] = {}
+        compiled_catalogs: list[bytes] = []
+        offset = 0
+        for code in codes or get_all_language_codes():
+            file_path = get_language_file_path(code)
+            compiled_catalog = build_compiled_catalog(
+                Catalog.from_toml_file(code, file_path).entries, file_path
+            )
+            directory[code] = {
+                "file": str(file_path),
+                "offset": offset,
+                "size": len(compiled_catalog),
+            }
+            compiled_catalogs.append(compiled_catalog)
+            offset = _align(offset + len(compiled_catalog))
+
+        raw_directory = json.dumps(directory).encode("utf-8")
+        data_offset = _align(_HEADER.size + len(raw_directory))
+        segment = shared_memory.SharedMemory(
+            name, create=True, size=max(data_offset + offset, 1)
+        )
+        assert segment.buf is not None
+        _HEADER.pack_into(segment.buf, 0, _MAGIC, len(raw_directory))
+        segment.buf[_HEADER.size : _HEADER.size + len(raw_directory)] = raw_directory
+        for entry, compiled_catalog in zip(directory.values(), compiled_catalogs):
+            start = data_offset + int(entry["offset"])  # type: ignore
+            segment.buf[start : start + len(compiled_catalog)] = compiled_catalog
+
+        logger.info(
+            "Shared %d languages (%d bytes) in '%s'",
+            len(directory),
+            segment.size,
+            segment.name,
+        )
+        return cls(segment, _map_catalogs(segment), is_owner=True)
+
+    @classmethod
+    def attach(cls, name: str) -> "SharedCatalogs":
+        """
+        Attach read-only to a segment created by another process.
+
+        Args:
+            name (str): the name of the segment
+
+        Raises:
+            FileNotFoundError: if there is no segment with the name
+            ValueError: if the segment does not hold shared catalogs
+
+        Returns:
+            SharedCatalogs: the catalogs, owned by the creating process
+        """
+        segment = _attach_shared_memory(name)
+        try:
+            catalogs = _map_catalogs(segment)
+        except ValueError:
+            segment.close()
+            raise
+        logger.debug("Attached to %d shared languages in '%s'", len(catalogs), name)
+        return cls(segment, catalogs, is_owner=False)
+
+    def install(self) -> "SharedCatalogs":
+        """
+        Use the shared catalogs for every lookup in this process. A language
+        whose TOML file changes afterwards is loaded from the file again.
+
+        Returns:
+            SharedCatalogs: the catalogs themselves
+        """
+        for catalog in self.catalogs.values():
+            set_catalog(catalog)
+        return self
+
+    def close(self) -> None:
+        """
+        Stop using the shared catalogs in this process and detach from the
+        segment. The owner also removes the segment, and processes that are
+        still attached keep reading it until they close it themselves.
+        """
+        for catalog in self.catalogs.values():
+            remove_catalog(catalog)
+            catalog.close()
+        self.catalogs = {}
+        self.segment.close()
+        if self.is_owner:
+            self.segment.unlink()
+            if os.environ.get(SHARED_CATALOGS_ENV_VAR) == self.name:
+                del os.environ[SHARED_CATALOGS_ENV_VAR]
+
+    def __enter__(self) -> "SharedCatalogs":
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        self.close()
+
+
+def _map_catalogs(segment: shared_memory.SharedMemory) -> dict[str, MappedCatalog]:
+    assert segment.buf is not None
+    buffer = segment.buf.toreadonly()
+    try:
+        magic, directory_size = _HEADER.unpack_from(buffer)
+    except struct.error as e:
+        raise ValueError("truncated shared catalogs header") from e
+    if magic != _MAGIC:
+        raise ValueError(f"'{segment.name}' does not hold shared catalogs")
+
+    raw_directory = bytes(buffer[_HEADER.size : _HEADER.size + directory_size])
+    directory: dict[str, dict[str, object]] = json.loads(raw_directory)
+    data_offset = _align(_HEADER.size + directory_size)
+    catalogs: dict[str, MappedCatalog] = {}
+    for code, entry in directory.items():
+        start = data_offset + int(entry["offset"])  # type: ignore
+        catalogs[code] = MappedCatalog(
+            code,
+            str(entry["file"]),
+            buffer[start : start + int(entry["size"])],  # type: ignore
+        )
+    return catalogs
+
+
+def share_catalogs(
+    codes: list[str] | None = None, name: str | None = None
+) -> SharedCatalogs:
+    """
+    Load languages into a new shared memory segment and use it for lookups in
+    this process. Call it in the parent of a pre-fork server before forking;
+    forked workers inherit the installed catalogs, and other processes can
+    attach to the segment with `attach_shared_catalogs()`.
+
+    Args:
+        codes (list[str] | None, optional): the language codes to load.
+        Defaults to every language under `[languages]` in config.toml.
+        name (str | None, optional): the segment name. Defaults to a random one.
+
+    Returns:
+        SharedCatalogs: the installed catalogs, to be closed on shutdown
+    """
+    shared_catalogs = SharedCatalogs.create(codes, name).install()
+    os.environ[SHARED_CATALOGS_ENV_VAR] = shared_catalogs.name
+    return shared_catalogs
+
+
+def attach_shared_catalogs(name: str | None = None) -> SharedCatalogs:
+    """
+    Attach to the shared catalogs of a parent process and use them for
+    lookups in this process.
+
+    Args:
+        name (str | None, optional): the segment name. Defaults to
+        `TRANSLATION_LIBRARY_SHARED_CATALOGS`.
+
+    Raises:
+        ValueError: if no name is given and the environment variable is unset
+        FileNotFoundError: if there is no segment with the name
+
+    Returns:
+        SharedCatalogs: the installed catalogs
+    """
+    name = name or os.environ.get(SHARED_CATALOGS_ENV_VAR)
+    if not name:
+        raise ValueError(
+            f"no segment name given and {SHARED_CATALOGS_ENV_VAR} is unset"
+        )
+    return SharedCatalogs.attach(name).install()
@@ -0,0 +1,95 @@
+import logging
+from string import Formatter
+
+logger = logging.getLogger(__name__)
+
+_formatter = Formatter()
+
+
+class CompiledTemplate:
+    """
+    A `str.format`-style template that is tokenized once. The placeholder
+    names are extracted up front so that missing args are reported with a set
+    difference, and rendering joins pre-split literal segments instead of
+    re-scanning the template on every call.
+    """
+
+    __slots__ = ("source", "placeholders", "_segments", "_is_simple")
+
+    def __init__(self, source: str) -> None:
+        self.source = source
+        self._is_simple = True
+        placeholders: set[str] = set()
+        segments: list[tuple[str, str | None, str | None, str]] = []
+
+        for literal, field_name, format_spec, conversion in _formatter.parse(source):
+            if field_name is None:
+                segments.append((literal, None, None, ""))
+                continue
+            # attribute/index access, positional fields and nested format specs
+            # are rare enough that they are rendered by `str.format_map` instead
+            root_name = field_name.partition(".")[0].partition("[")[0]
+            if (
+                not field_name.isidentifier()
+                or "{" in (format_spec or "")
+                or not root_name
+            ):
+                self._is_simple = False
+            if root_name and not root_name.isdigit():
+                placeholders.add(root_name)
+            segments.append((literal, field_name, conversion, format_spec or ""))
+
+        self.placeholders: frozenset[str] = frozenset(placeholders)
+        self._segments = tuple(segments)
+
+    def missing_args(self, args: dict[str, object]) -> frozenset[str]:
+        """
+        Return the placeholder names that are not given in `args`.
+
+        Args:
+            args (dict): the placeholder args that would be rendered
+
+        Returns:
+            frozenset[str]: the missing placeholder names, empty if none are
+        """
+        return self.placeholders.difference(args)
+
+    def render(self, args: dict[str, object]) -> str:
+        """
+        Render the template with the given placeholder args.
+
+        Args:
+            args (dict): a mapping of placeholder names to their values
+
+        Raises:
+            KeyError: if any placeholder of the template is not in `args`
+
+        Returns:
+            str: the rendered string
+        """
+        if missing := self.missing_args(args):
+            logger.error("Missing placeholder args %s for '%s'", missing, self.source)
+            raise KeyError(
+                f"missing placeholder args {sorted(missing)} for '{self.source}'"
+            )
+
+        if not self._is_simple:
+            return self.source.format_map(args)
+
+        parts: list[str] = []
+        for literal, field_name, conversion, format_spec in self._segments:
+            parts.append(literal)
+            if field_name is None:
+                continue
+            value = args[field_name]
+            if conversion == "r":
+                value = repr(value)
+            elif conversion == "a":
+                value = ascii(value)
+            elif conversion == "s":
+                value = str(value)
+            parts.append(format(value, format_spec))
+        return "".join(parts)
+
+    def __repr__(self) -> str:
+        return f"CompiledTemplate({self.source!r})"
@@ -1,14 +1,14 @@
 import logging
+import tomllib
 from pathlib import Path
-from typing import Annotated
-
-import tomlkit
-from glom import glom  # type: ignore
-from glom.core import PathAccessError  # type: ignore
-from pydantic import BeforeValidator, Field, validate_call
-from tomlkit.exceptions import EmptyKeyError, EmptyTableNameError
+from typing import Annotated, cast
 
 from translation_library.utils.path_utils import valid_path_validator
+from translation_library.utils.validation_utils import (
+    BeforeValidator,
+    MinLength,
+    validate_call,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -38,16 +38,100 @@ def valid_toml_path_validator(v: str | Path) -> Path:
     return valid_path_validator(v)
 
 
+def path_access_error(key_path: str, part_idx: int) -> Exception:
+    """
+    Build the `glom` error raised when a key path cannot be accessed, so that
+    lookups that do not use `glom` still fail the same way as those that do.
+
+    Args:
+        key_path (str): the dotted key path that was looked up
+        part_idx (int): the index of the first part of the path that is missing
+
+    Returns:
+        PathAccessError: the error to raise
+    """
+    from glom.core import Path as GlomPath  # type: ignore
+    from glom.core import PathAccessError  # type: ignore
+
+    parts = GlomPath.from_text(key_path)
+    return PathAccessError(KeyError(parts.values()[part_idx]), parts, part_idx)
+
+
+def get_value_from_toml_dict(toml_dict: dict[str, object], key_path: str) -> object:
+    """
+    Get the value of a dotted key path from a TOML-like dict. Plain dotted
+    paths are walked directly and only wildcard specs (`languages.*.file`) are
+    handed to `glom`, so `glom` is only imported when it is needed.
+
+    Args:
+        toml_dict (dict): the TOML-like dict to get the value from
+        key_path (str): the path to the key, such as `start.welcome`
+
+    Raises:
+        PathAccessError: if the value could not be retrieved from the given key path
+
+    Returns:
+        object: the value associated with the given key path
+    """
+    if "*" in key_path:
+        from glom import glom  # type: ignore
+
+        return glom(toml_dict, key_path)
+
+    return walk_key_path(toml_dict, key_path)
+
+
+def walk_key_path(value: object, key_path: str, start_idx: int = 0) -> object:
+    """
+    Walk the parts of a dotted key path through nested tables and arrays,
+    where a part that is an int (such as `0` or `-1`) indexes an array.
+
+    Args:
+        value (object): the value that the part at `start_idx` is looked up in
+        key_path (str): the path to the key, such as `items.0.name`
+        start_idx (int, optional): the index of the first part to walk, for a
+        value that was already reached by the parts before it. Defaults to 0.
+
+    Raises:
+        PathAccessError: if the value could not be retrieved from the given key path
+
+    Returns:
+        object: the value associated with the given key path
+    """
+    parts = key_path.split(".")
+    for part_idx in range(start_idx, len(parts)):
+        part = parts[part_idx]
+        if isinstance(value, dict) and part in value:
+            value = value[part]
+        elif (
+            isinstance(value, list)
+            and part.lstrip("-").isdigit()
+            and -len(value) <= int(part) < len(value)
+        ):
+            value = value[int(part)]
+        else:
+            raise path_access_error(key_path, part_idx)
+    return value
+
+
 @validate_call
 def serialize_toml_dict(
     toml_file_path: Annotated[str | Path, BeforeValidator(valid_toml_path_validator)],
+    read_only: bool = False,
 ) -> dict[str, object]:
     """
     Return a TOML file as a dictionary of key-value pairs from a specified
     directory path.
 
+    By default the file is loaded with `tomlkit`, which keeps comments and
+    formatting so the dict can be edited and written back with
+    `deserialize_toml_dict()`. Lookups that never write back should pass
+    `read_only=True`, which parses with the stdlib `tomllib` into a plain dict
+    that is several times faster to build and lighter to keep in memory.
+
     Args:
         toml_file_path (str | Path): the path of the TOML file to be loaded
+        read_only (bool, optional): parse into a plain dict with `tomllib`. Defaults to False.
 
     Raises:
         RuntimeError: if an unknown/unchecked exception occurs when opening file
@@ -57,14 +141,22 @@ def serialize_toml_dict(
     """
     try:
         with open(toml_file_path, "rb") as f:
-            if toml_data := tomlkit.load(f):
-                logger.debug("TOML successfully serialized from '%s'", toml_file_path)
+            if read_only:
+                toml_data: dict[str, object] = tomllib.load(f)
+            else:
+                import tomlkit
+
+                toml_data = tomlkit.load(f)
+            if toml_data:
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("TOML serialized from '%s'", toml_file_path)
                 return toml_data
-            logging.warning("None value serialized from '%s", toml_file_path)
+            logger.warning("None value serialized from '%s", toml_file_path)
             return {}
-    except (EmptyKeyError, EmptyTableNameError) as ee:
+    except ValueError as ve:
+        # both `tomllib.TOMLDecodeError` and tomlkit's `ParseError` are ValueErrors
         logger.exception("TOML file '%s' has invalid syntax", toml_file_path)
-        raise ee
+        raise ve
     except Exception as e:
         logger.exception("Could not serialize '%s' due to: ", toml_file_path)
         raise e
@@ -72,7 +164,7 @@ def serialize_toml_dict(
 
 @validate_call
 def deserialize_toml_dict(
-    toml_data: Annotated[dict[str, object], Field(..., min_length=1)],
+    toml_data: Annotated[dict[str, object], MinLength(1)],
     toml_file_path: Annotated[str | Path, BeforeValidator(valid_toml_path_validator)],
 ) -> None:
     """
@@ -85,13 +177,15 @@ def deserialize_toml_dict(
     Raises:
         RuntimeError: if an unknown/unchecked exception occurs when writing to file
     """
+    import tomlkit
+
     try:
         with open(toml_file_path, "w") as f:
             tomlkit.dump(toml_data, f)
             logger.debug("Successfully deserialized TOML data to '%s'", toml_file_path)
-    except (EmptyKeyError, EmptyTableNameError) as ee:
+    except ValueError as ve:
         logger.exception("TOML file '%s' has invalid syntax", toml_file_path)
-        raise ee
+        raise ve
     except Exception as e:
         logger.exception("Could not deserialize to '%s' due to: ", toml_file_path)
         raise e
@@ -100,7 +194,7 @@ def deserialize_toml_dict(
 @validate_call
 def get_value_from_key(
     toml_file_path: Annotated[str | Path, BeforeValidator(valid_toml_path_validator)],
-    key_path: str = Field(..., min_length=1),
+    key_path: Annotated[str, MinLength(1)],
 ) -> str | list[str] | list[dict[str, object]]:
     """
     Get the value of a specific key from a given TOML file path.
@@ -118,22 +212,36 @@ def get_value_from_key(
         object: the value associated with the given key path
     """
     try:
-        language_toml_dict: dict[str, object] = serialize_toml_dict(toml_file_path)
-        if value := glom(language_toml_dict, key_path):
-            logger.debug(
-                "Successfully retrieved '%s' with key '%s' from '%s",
-                value,
-                key_path,
-                toml_file_path,
-            )
-            return value
-        logging.warning(
+        language_toml_dict: dict[str, object] = serialize_toml_dict.raw_function(
+            toml_file_path, read_only=True
+        )
+        if value := get_value_from_toml_dict(language_toml_dict, key_path):
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Successfully retrieved '%s' with key '%s' from '%s",
+                    value,
+                    key_path,
+                    toml_file_path,
+                )
+            return cast(str | list[str] | list[dict[str, object]], value)
+        logger.warning(
             "None retrieved with key '%s' from '%s", key_path, toml_file_path
         )
         return [] if "*" in key_path else ""
-    except PathAccessError as pae:
+    except KeyError as ke:
+        # only a missing key path raises `PathAccessError`, and glom is already
+        # imported by then
+        from glom.core import PathAccessError  # type: ignore
+
+        if not isinstance(ke, PathAccessError):
+            logger.exception(
+                "Could not get value with key '%s' from '%s' due to:",
+                key_path,
+                toml_file_path,
+            )
+            raise ke
         logger.exception("Key '%s' does not exist in %s", key_path, toml_file_path)
-        raise pae
+        raise ke
     except Exception as e:
         logger.exception(
             "Could not get value with key '%s' from '%s' due to:",
@@ -1,14 +1,17 @@
 import logging
+import time
+from typing import Annotated
 
-from pydantic import Field, validate_call
-
+from translation_library.utils import metrics_utils
+from translation_library.utils.catalog_utils import get_fallback_catalog
 from translation_library.utils.config_utils import (
     get_all_english_names,
-    get_all_language_codes,
     get_all_native_names,
-    get_language_file_path,
+    get_language_code_set,
+    get_language_index,
+    normalize_language_name,
 )
-from translation_library.utils.toml_utils import get_value_from_key
+from translation_library.utils.validation_utils import MinLength, validate_call
 
 logger = logging.getLogger(__name__)
 
@@ -52,9 +55,26 @@ def get_languages_as_english_names(casefold: bool = False) -> list[str]:
     return get_all_english_names()
 
 
+def resolve_language(text: str) -> str | None:
+    """
+    Resolve a language code, English name, native name or alias from
+    config.toml to its language code, ignoring case and Unicode width:
+
+    >>> resolve_language("Deutsch"), resolve_language("german"), resolve_language("DE")
+    ("de", "de", "de")
+
+    Args:
+        text (str): the code, name or alias to resolve
+
+    Returns:
+        str | None: the language code, or None if nothing matches
+    """
+    return get_language_index().get(normalize_language_name(text))
+
+
 # TODO: make `language` into `language_code`
 @validate_call
-def is_supported(language: str = Field(..., min_length=1)) -> bool:
+def is_supported(language: Annotated[str, MinLength(1)]) -> bool:
     """
     Checks to see if a given language is supported.
 
@@ -64,36 +84,172 @@ def is_supported(language: str = Field(..., min_length=1)) -> bool:
     Returns:
         bool: `True` if the language is supported, `False` otherwise
     """
-    supported: bool = language in get_all_language_codes()
-    logger.debug("'%s' is supported? '%s'", language, str(supported))
+    supported: bool = language in get_language_code_set()
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("'%s' is supported? '%s'", language, supported)
     return supported
 
 
 # TODO: make `language` into `language_code`
 @validate_call
 def get_i18n_obj(
-    language: str = Field(..., min_length=1), key_path: str = Field(..., min_length=1)
+    language: Annotated[str, MinLength(1)], key_path: Annotated[str, MinLength(1)]
 ) -> object:
     """
-    Get the value of a specific key from a given language TOML file.
+    Get the value of a specific key from a given language TOML file. The file
+    is loaded into an in-memory catalog once, so lookups are dict accesses.
+    Keys missing from the language are looked up along its fallback chain
+    from the `[fallbacks]` table of config.toml.
 
     Args:
         language (str): the name of the language TOML dict to get value from
         key_path (str): the path to the key in the specified language TOML dict
 
+    Raises:
+        PathAccessError: if the key path does not exist in the language file
+
     Returns:
         object: the value of a given key
     """
-    logger.debug("Getting '%s' from the '%s' TOML file" % (key_path, language))
-    if value := get_value_from_key(get_language_file_path(language), key_path):
-        logger.info(
-            "Successfully retrieved '%s' with key '%s' from '%s.toml'",
-            value,
-            key_path,
-            language,
-        )
+    start = time.perf_counter() if metrics_utils.enabled else None
+    try:
+        value = get_fallback_catalog(language).get(key_path)
+    finally:
+        if start is not None:
+            metrics_utils.observe(
+                metrics_utils.LOOKUP_SECONDS, language, time.perf_counter() - start
+            )
+    if value:
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Successfully retrieved '%s' with key '%s' from '%s.toml'",
+                value,
+                key_path,
+                language,
+            )
         return value
     logger.warning(
         "None value retrieved with key '%s' from '%s.toml'", key_path, language
     )
     return None
+
+
+def has_key(language: str, key_path: str) -> bool:
+    """
+    Checks whether a key exists in a language (or along its fallback chain)
+    without raising, so it is cheap enough for hot paths. Unlike
+    `get_i18n_obj()`, an unsupported language, a missing language file or a
+    missing key all just return `False`, and nothing is logged for them. A
+    config.toml or language file that fails to load is still logged, like
+    any other attempt to load it.
+
+    Args:
+        language (str): the code of the language to check
+        key_path (str): the path to the key, such as `start.welcome`
+
+    Returns:
+        bool: `True` if the key exists, `False` otherwise
+    """
+    try:
+        if language not in get_language_code_set():
+            return False
+        return key_path in get_fallback_catalog(language)
+    except (OSError, ValueError, KeyError):
+        # the config or a language file is missing or invalid
+        return False
+
+
+def _get_i18n_many(language: str, keys: list[str]) -> dict[str, object]:
+    catalog = get_fallback_catalog(language)
+    return {key_path: catalog.get(key_path) or None for key_path in keys}
+
+
+@validate_call
+def get_i18n_many(
+    language: Annotated[str, MinLength(1)],
+    keys: Annotated[list[Annotated[str, MinLength(1)]], MinLength(1)],
+) -> dict[str, object]:
+    """
+    Get the values of many keys from a given language TOML file at once. The
+    args are validated a single time for the whole batch and every key is
+    resolved against the same loaded catalog:
+
+    >>> get_i18n_many("en", ["hello", "start.welcome"])
+    {"hello": "Hello {name}", "start.welcome": "Welcome {name}!"}
+
+    Args:
+        language (str): the name of the language TOML dict to get values from
+        keys (list[str]): the paths to the keys in the language TOML dict
+
+    Raises:
+        PathAccessError: if any key path does not exist in the language file
+
+    Returns:
+        dict: each key path mapped to its value, or `None` if it was empty
+    """
+    logger.debug("Getting %d keys from the '%s' TOML file", len(keys), language)
+    return _get_i18n_many(language, keys)
+
+
+@validate_call
+def get_i18n_matrix(
+    languages: Annotated[list[Annotated[str, MinLength(1)]], MinLength(1)],
+    keys: Annotated[list[Annotated[str, MinLength(1)]], MinLength(1)],
+) -> dict[str, dict[str, object]]:
+    """
+    Get the values of many keys from many language TOML files at once. The
+    args are validated a single time for the whole batch:
+
+    >>> get_i18n_matrix(["en", "de"], ["hello"])
+    {"en": {"hello": "Hello {name}"}, "de": {"hello": "Hallo {name}"}}
+
+    Args:
+        languages (list[str]): the names of the language TOML dicts to get values from
+        keys (list[str]): the paths to the keys in each language TOML dict
+
+    Raises:
+        PathAccessError: if any key path does not exist in any language file
+
+    Returns:
+        dict: each language mapped to a dict of each key path and its value
+    """
+    logger.debug("Getting %d keys from %d TOML files", len(keys), len(languages))
+    return {language: _get_i18n_many(language, keys) for language in languages}
+
+
+@validate_call
+def format_i18n(
+    language: Annotated[str, MinLength(1)],
+    key_path: Annotated[str, MinLength(1)],
+    /,
+    **args: object,
+) -> str:
+    """
+    Get a str from a given language TOML file and fill in its placeholders.
+    The template is compiled once per language and key, so repeated renders
+    do not re-tokenize the str:
+
+    >>> format_i18n("en", "start.welcome", name="Blake")
+    "Welcome Blake!"
+
+    Args:
+        language (str): the name of the language TOML dict to get value from
+        key_path (str): the path to the key in the specified language TOML dict
+        **args (object): the values of the placeholders in the str
+
+    Raises:
+        PathAccessError: if the key path does not exist in the language file
+        TypeError: if the value of the key path is not a str
+        KeyError: if a placeholder in the str was not given in `args`
+
+    Returns:
+        str: the str with its placeholders filled in
+    """
+    start = time.perf_counter() if metrics_utils.enabled else None
+    try:
+        return get_fallback_catalog(language).get_template(key_path).render(args)
+    finally:
+        if start is not None:
+            metrics_utils.observe(
+                metrics_utils.FORMAT_SECONDS, language, time.perf_counter() - start
+            )
@@ -0,0 +1,142 @@
+import functools
+import inspect
+import os
+from typing import Annotated, Any, Callable, Generic, ParamSpec, Protocol, TypeVar
+
+P = ParamSpec("P")
+R = TypeVar("R")
+R_co = TypeVar("R_co", covariant=True)
+
+# Set to "0" to skip argument validation of every public function, e.g. in
+# production where the callers are trusted and the overhead is not wanted
+VALIDATION_ENV_VAR = "TRANSLATION_LIBRARY_VALIDATE"
+
+_validation_enabled = os.environ.get(VALIDATION_ENV_VAR, "1") != "0"
+
+
+def set_validation_enabled(enabled: bool) -> None:
+    """
+    Turn argument validation of every `validate_call` function on or off.
+    While it is off, calls go straight to the unvalidated function and
+    pydantic is never imported.
+
+    Args:
+        enabled (bool): whether arguments should be validated
+    """
+    global _validation_enabled
+    _validation_enabled = enabled
+
+
+def is_validation_enabled() -> bool:
+    return _validation_enabled
+
+
+class _LazyMetadata:
+    """
+    `Annotated` metadata that stands in for a pydantic constraint/validator.
+    pydantic is only imported when the schema of the annotated argument is
+    built, which `validate_call` below defers until the first call.
+    """
+
+    __slots__ = ("_args", "_kwargs")
+
+    factory_name = ""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        self._args = args
+        self._kwargs = kwargs
+
+    def __get_pydantic_core_schema__(self, source_type: Any, handler: Any) -> Any:
+        import pydantic
+
+        metadata = getattr(pydantic, self.factory_name)(*self._args, **self._kwargs)
+        return handler(Annotated[source_type, metadata])
+
+    def __repr__(self) -> str:
+        args = [repr(arg) for arg in self._args]
+        args += [f"{key}={value!r}" for key, value in self._kwargs.items()]
+        return f"{type(self).__name__}({', '.join(args)})"
+
+
+class MinLength(_LazyMetadata):
+    """
+    The lazy equivalent of `pydantic.Field(min_length=...)`:
+
+    >>> language: Annotated[str, MinLength(1)]
+    """
+
+    __slots__ = ()
+
+    factory_name = "Field"
+
+    def __init__(self, min_length: int) -> None:
+        super().__init__(min_length=min_length)
+
+
+class BeforeValidator(_LazyMetadata):
+    """
+    The lazy equivalent of `pydantic.BeforeValidator(func)`:
+
+    >>> path: Annotated[str | Path, BeforeValidator(valid_path_validator)]
+    """
+
+    __slots__ = ()
+
+    factory_name = "BeforeValidator"
+
+    def __init__(self, func: Callable[[Any], Any]) -> None:
+        super().__init__(func)
+
+
+class ValidatedFunction(Protocol, Generic[P, R_co]):
+    """
+    A function wrapped by `validate_call`, with the same signature, that
+    keeps the unvalidated function as `raw_function`.
+    """
+
+    @property
+    def raw_function(self) -> Callable[P, R_co]: ...
+
+    def __call__(self, *args: P.args, **kwargs: P.kwargs) -> R_co: ...
+
+
+def validate_call(func: Callable[P, R]) -> ValidatedFunction[P, R]:
+    """
+    The lazy equivalent of `pydantic.validate_call`. pydantic is imported and
+    the validating wrapper is built on the first call of `func` rather than at
+    import time, so importing the utils does not pay for pydantic.
+
+    Like pydantic's wrapper, the unvalidated function is kept as `raw_function`.
+    Internal calls whose arguments were already checked at the public boundary
+    should go through it instead of validating again.
+
+    Args:
+        func (Callable): the function whose args should be validated
+
+    Returns:
+        ValidatedFunction: the function wrapped with argument validation
+    """
+    validated_func: Callable[..., Any] | None = None
+
+    @functools.wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        nonlocal validated_func
+        if not _validation_enabled:
+            return func(*args, **kwargs)
+        if validated_func is None:
+            from pydantic import validate_call as pydantic_validate_call
+
+            validated_func = pydantic_validate_call(func)
+        return validated_func(*args, **kwargs)
+
+    if inspect.iscoroutinefunction(func):
+        # an `async def` wrapper, so that it is still seen as a coroutine
+        # function (`inspect.markcoroutinefunction()` needs Python 3.12)
+        @functools.wraps(func)
+        async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+            return await wrapper(*args, **kwargs)
+
+        async_wrapper.raw_function = func  # type: ignore
+        return async_wrapper  # type: ignore
+    wrapper.raw_function = func  # type: ignore
+    return wrapper  # type: ignore
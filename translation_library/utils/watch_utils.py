@@ -0,0 +1,224 @@
+import ctypes
+import ctypes.util
+import logging
+import os
+import select
+import struct
+import sys
+import threading
+from pathlib import Path
+
+from translation_library.utils.catalog_utils import (
+    get_loaded_catalog,
+    get_loaded_languages,
+    reload_catalog,
+    set_staleness_checks,
+)
+from translation_library.utils.config_utils import (
+    get_i18n_dir_path,
+    get_language_code_set,
+    get_language_file_path,
+)
+
+logger = logging.getLogger(__name__)
+
+# inotify(7) event masks: a file finished being written or was moved/created
+# in the dir, which covers both in-place saves and atomic-rename saves
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_INOTIFY_MASK = _IN_CLOSE_WRITE | _IN_MOVED_TO | _IN_CREATE
+_INOTIFY_EVENT = struct.Struct("iIII")
+
+
+def _init_inotify(dir_path: Path) -> int | None:
+    """
+    Start watching a dir with inotify through libc.
+
+    Args:
+        dir_path (Path): the dir to watch
+
+    Returns:
+        int | None: the inotify file descriptor, or None if inotify is unavailable
+    """
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        fd = libc.inotify_init1(os.O_CLOEXEC)
+        if fd < 0:
+            return None
+        if libc.inotify_add_watch(fd, str(dir_path).encode(), _INOTIFY_MASK) < 0:
+            os.close(fd)
+            return None
+        return fd
+    except (AttributeError, OSError):
+        logger.exception("Could not set up inotify for '%s' due to:", dir_path)
+        return None
+
+
+def _get_dir_signatures(dir_path: Path) -> dict[str, tuple[int, int, int]]:
+    signatures: dict[str, tuple[int, int, int]] = {}
+    with os.scandir(dir_path) as entries:
+        for entry in entries:
+            if entry.name.endswith(".toml") and entry.is_file():
+                stat_result = entry.stat()
+                signatures[entry.name] = (
+                    stat_result.st_ino,
+                    stat_result.st_mtime_ns,
+                    stat_result.st_size,
+                )
+    return signatures
+
+
+class CatalogWatcher:
+    """
+    Watches the i18n dir from config.toml in a background thread and reloads
+    the catalog of a language whenever its file changes. inotify is used
+    where available, otherwise the dir is polled for mtime changes.
+
+    While the watcher runs, lookups no longer stat the language file on every
+    call; new catalogs are built off the lookup path and swapped in whole.
+    """
+
+    def __init__(
+        self,
+        i18n_dir: str | Path | None = None,
+        poll_interval: float = 1.0,
+        use_inotify: bool = True,
+    ) -> None:
+        """
+        Args:
+            i18n_dir (str | Path | None, optional): the dir to watch. Defaults
+            to `paths.i18n_dir` from config.toml.
+            poll_interval (float, optional): seconds between checks. Defaults to 1.0.
+            use_inotify (bool, optional): use inotify when available. Defaults to True.
+        """
+        self.i18n_dir = Path(i18n_dir) if i18n_dir else get_i18n_dir_path()
+        self.poll_interval = poll_interval
+        self.use_inotify = use_inotify
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._signatures: dict[str, tuple[int, int, int]] = {}
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> "CatalogWatcher":
+        """
+        Start watching in a daemon thread.
+
+        Returns:
+            CatalogWatcher: the watcher itself
+        """
+        if self.is_running:
+            return self
+
+        self._stop_event.clear()
+        inotify_fd = _init_inotify(self.i18n_dir) if self.use_inotify else None
+        # snapshot before returning so that changes right after `start()` count
+        self._signatures = _get_dir_signatures(self.i18n_dir)
+        self._thread = threading.Thread(
+            target=self._run,
+            args=(inotify_fd,),
+            name="translation-library-catalog-watcher",
+            daemon=True,
+        )
+        self._thread.start()
+        logger.info(
+            "Watching '%s' with %s",
+            self.i18n_dir,
+            "inotify" if inotify_fd is not None else "mtime polling",
+        )
+        return self
+
+    def stop(self) -> None:
+        """
+        Stop watching and go back to checking for changes on every lookup.
+        """
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def reload_file(self, file_name: str) -> list[str]:
+        """
+        Reload the catalog of every loaded language that uses a given file.
+        A file that fails to load (e.g. one that is still being written) keeps
+        its previous catalog.
+
+        Args:
+            file_name (str): the name of the changed file in the i18n dir
+
+        Returns:
+            list[str]: the codes of the languages that were reloaded
+        """
+        changed_path = (self.i18n_dir / file_name).resolve()
+        configured_codes = get_language_code_set()
+        reloaded: list[str] = []
+        for code in get_loaded_languages():
+            if code not in configured_codes:
+                continue
+            if get_language_file_path(code).resolve() != changed_path:
+                continue
+            catalog = get_loaded_catalog(code)
+            if catalog is not None and not catalog.is_stale():
+                # already up to date, e.g. written by `write_utils`
+                continue
+            try:
+                reload_catalog(code)
+                reloaded.append(code)
+            except Exception:
+                logger.exception("Kept the old catalog of '%s' due to:", code)
+        return reloaded
+
+    def _run(self, inotify_fd: int | None) -> None:
+        # lookups only skip the staleness check while this thread is alive,
+        # so it is turned back on however the thread ends
+        set_staleness_checks(False)
+        try:
+            if inotify_fd is not None:
+                self._watch_inotify(inotify_fd)
+            else:
+                self._watch_polling()
+        except Exception:
+            logger.exception("Stopped watching '%s' due to:", self.i18n_dir)
+        finally:
+            set_staleness_checks(True)
+
+    def _watch_inotify(self, inotify_fd: int) -> None:
+        try:
+            while not self._stop_event.is_set():
+                readable, _, _ = select.select([inotify_fd], [], [], self.poll_interval)
+                if not readable:
+                    continue
+                # a burst of events for the same file only triggers one reload
+                changed_files: set[str] = set()
+                buffer = os.read(inotify_fd, 64 * 1024)
+                offset = 0
+                while offset < len(buffer):
+                    _, _, _, name_len = _INOTIFY_EVENT.unpack_from(buffer, offset)
+                    offset += _INOTIFY_EVENT.size
+                    name = buffer[offset : offset + name_len].rstrip(b"\0").decode()
+                    offset += name_len
+                    if name.endswith(".toml"):
+                        changed_files.add(name)
+                for file_name in changed_files:
+                    self.reload_file(file_name)
+        finally:
+            os.close(inotify_fd)
+
+    def _watch_polling(self) -> None:
+        while not self._stop_event.wait(self.poll_interval):
+            new_signatures = _get_dir_signatures(self.i18n_dir)
+            for file_name, signature in new_signatures.items():
+                if self._signatures.get(file_name) != signature:
+                    self.reload_file(file_name)
+            self._signatures = new_signatures
+
+    def __enter__(self) -> "CatalogWatcher":
+        return self.start()
+
+    def __exit__(self, *_: object) -> None:
+        self.stop()
@@ -0,0 +1,378 @@
+import atexit
+import logging
+import os
+import stat
+import tempfile
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import TYPE_CHECKING, Annotated
+
+from translation_library.utils.catalog_utils import (
+    Catalog,
+    get_loaded_catalog,
+    replace_catalog,
+    set_catalog,
+)
+from translation_library.utils.config_utils import get_language_file_path
+from translation_library.utils.validation_utils import MinLength, validate_call
+
+if TYPE_CHECKING:
+    from tomlkit import TOMLDocument
+
+logger = logging.getLogger(__name__)
+
+# Edits to a language made within this many seconds of each other are written
+# to its file together. 0 writes every edit right away
+DEFAULT_WRITE_DELAY = 0.1
+# How many documents of languages without pending edits are kept in memory for
+# the next edit. A `tomlkit` document takes several times the memory of its
+# catalog, so only the most recently edited ones are kept
+DEFAULT_MAX_DOCUMENTS = 4
+
+_write_delay = DEFAULT_WRITE_DELAY
+_max_documents = DEFAULT_MAX_DOCUMENTS
+
+
+class _EditedFile:
+    """
+    The `tomlkit` document of a language file that is being edited, kept in
+    memory between edits so that each edit does not parse the file again.
+    """
+
+    __slots__ = ("file_path", "signature", "document", "catalog", "dirty", "timer")
+
+    def __init__(
+        self, file_path: Path, signature: tuple[int, int], document: "TOMLDocument"
+    ) -> None:
+        self.file_path = file_path
+        self.signature = signature
+        self.document = document
+        # the read catalog that holds the edits, once one was swapped in
+        self.catalog: Catalog | None = None
+        self.dirty = False
+        self.timer: threading.Timer | None = None
+
+
+# The edited file of each language code, least recently edited first. Guarded
+# by `_edits_lock`, which is reentrant so that flushes can run while an edit
+# holds it
+_edits_lock = threading.RLock()
+_edited_files: "OrderedDict[str, _EditedFile]" = OrderedDict()
+
+
+def _get_file_signature(file_path: Path) -> tuple[int, int]:
+    stat_result = os.stat(file_path)
+    return stat_result.st_ino, stat_result.st_mtime_ns
+
+
+def configure_write_back(
+    delay: float = DEFAULT_WRITE_DELAY, max_documents: int = DEFAULT_MAX_DOCUMENTS
+) -> None:
+    """
+    Set how long edits wait for more edits before they are written, and how
+    many parsed language files are kept in memory for later edits.
+
+    Args:
+        delay (float, optional): seconds to wait, or 0 to write every edit
+        right away. Defaults to 0.1.
+        max_documents (int, optional): the most documents without pending
+        edits to keep. Documents with pending edits are always kept. Defaults
+        to 4.
+    """
+    global _write_delay, _max_documents
+    _write_delay = delay
+    with _edits_lock:
+        _max_documents = max_documents
+        _evict_edited_files()
+
+
+def _evict_edited_files(keep: str | None = None) -> None:
+    # called with `_edits_lock` held. Drops the least recently edited
+    # documents without pending edits, other than the one about to be edited
+    excess = len(_edited_files) - _max_documents
+    for code in list(_edited_files):
+        if excess <= 0:
+            break
+        if code != keep and not _edited_files[code].dirty:
+            del _edited_files[code]
+            excess -= 1
+
+
+def _get_edited_file(language: str) -> _EditedFile:
+    # called with `_edits_lock` held
+    file_path = get_language_file_path(language)
+    edited_file = _edited_files.get(language)
+    if edited_file is not None and edited_file.file_path == file_path:
+        if edited_file.dirty:
+            _edited_files.move_to_end(language)
+            return edited_file
+        try:
+            if _get_file_signature(file_path) == edited_file.signature:
+                _edited_files.move_to_end(language)
+                return edited_file
+        except FileNotFoundError:
+            pass
+
+    import tomlkit
+
+    # stat before reading so that a change made while reading is not missed
+    signature = _get_file_signature(file_path)
+    with open(file_path, "rb") as file:
+        edited_file = _EditedFile(file_path, signature, tomlkit.load(file))
+    _edited_files[language] = edited_file
+    _evict_edited_files(keep=language)
+    logger.debug("Loaded '%s' for editing", file_path)
+    return edited_file
+
+
+def _get_parent_table(
+    document: "TOMLDocument", key_path: str, create: bool
+) -> dict[str, object] | None:
+    import tomlkit
+
+    table: dict[str, object] = document
+    for part in key_path.split(".")[:-1]:
+        child = table.get(part)
+        if child is None:
+            if not create:
+                return None
+            child = table[part] = tomlkit.table()
+        elif not isinstance(child, dict):
+            raise TypeError(f"'{key_path}' goes through a value that is not a table")
+        table = child  # type: ignore
+    return table
+
+
+def _check_key_paths(
+    document: "TOMLDocument", values: dict[str, object], replace_tables: bool
+) -> None:
+    for key_path, value in values.items():
+        if "*" in key_path or "" in key_path.split("."):
+            raise ValueError(f"'{key_path}' is not a valid key path to set")
+        table = _get_parent_table(document, key_path, create=False)
+        if table is None or replace_tables or isinstance(value, dict):
+            continue
+        if isinstance(table.get(key_path.rsplit(".", 1)[-1]), dict):
+            raise TypeError(
+                f"'{key_path}' is a table, pass `replace_tables=True` to replace it"
+            )
+
+
+def _sync_catalog(
+    language: str, edited_file: _EditedFile, values: dict[str, object]
+) -> None:
+    # called with `_edits_lock` held. Lookups see the edits right away, even
+    # before they are written. The loaded catalog is never changed in place;
+    # a new one is built and swapped in
+    catalog = get_loaded_catalog(language)
+    if (
+        isinstance(catalog, Catalog)
+        and catalog.file_path == edited_file.file_path
+        and catalog.signature == edited_file.signature
+    ):
+        catalog = catalog.with_values(values)
+    else:
+        # a compiled or outdated catalog (or none at all) is loaded, so build
+        # one from the document instead, which still skips parsing the file
+        catalog = Catalog(
+            language,
+            edited_file.file_path,
+            edited_file.document.unwrap(),
+            edited_file.signature,
+        )
+    edited_file.catalog = catalog
+    set_catalog(catalog)
+
+
+def _write_file(edited_file: _EditedFile) -> Path:
+    # called with `_edits_lock` held
+    import tomlkit
+
+    file_path = edited_file.file_path
+    file_descriptor, tmp_path = tempfile.mkstemp(
+        prefix=f".{file_path.name}.", dir=file_path.parent
+    )
+    try:
+        with os.fdopen(file_descriptor, "w", encoding="utf-8", newline="") as file:
+            file.write(tomlkit.dumps(edited_file.document))
+        os.chmod(tmp_path, stat.S_IMODE(os.stat(file_path).st_mode))
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+    old_signature = edited_file.signature
+    edited_file.signature = _get_file_signature(file_path)
+    edited_file.dirty = False
+    # the read catalog already holds what was written, so it is swapped for one
+    # with the new signature instead of the file being parsed again
+    catalog = edited_file.catalog
+    if catalog is not None and catalog.signature == old_signature:
+        edited_file.catalog = catalog.with_signature(edited_file.signature)
+        replace_catalog(catalog, edited_file.catalog)
+    logger.debug("Wrote the edits of '%s'", file_path)
+    return file_path
+
+
+def _flush_language(language: str) -> Path | None:
+    with _edits_lock:
+        edited_file = _edited_files.get(language)
+        if edited_file is None or not edited_file.dirty:
+            return None
+        if edited_file.timer is not None:
+            edited_file.timer.cancel()
+            edited_file.timer = None
+        try:
+            file_path = _write_file(edited_file)
+        except Exception:
+            logger.exception("Could not write the edits of '%s' due to:", language)
+            raise
+        _evict_edited_files()
+        return file_path
+
+
+def _flush_in_background(language: str) -> None:
+    try:
+        _flush_language(language)
+    except Exception:
+        # logged by `_flush_language()`, and the edits stay pending
+        pass
+
+
+def flush_writes(language: str | None = None) -> list[Path]:
+    """
+    Write pending edits to their language files right away.
+
+    Args:
+        language (str | None, optional): the language code to write. Defaults
+        to every language with pending edits.
+
+    Raises:
+        OSError: if a language file could not be written
+
+    Returns:
+        list[Path]: the paths of the files that were written
+    """
+    with _edits_lock:
+        languages = [language] if language is not None else list(_edited_files)
+        written_paths: list[Path] = []
+        for code in languages:
+            if (file_path := _flush_language(code)) is not None:
+                written_paths.append(file_path)
+        return written_paths
+
+
+def get_pending_writes() -> list[str]:
+    """
+    Returns:
+        list[str]: the codes of the languages with edits not yet written
+    """
+    with _edits_lock:
+        return [code for code, edited in _edited_files.items() if edited.dirty]
+
+
+def get_edited_languages() -> list[str]:
+    """
+    Returns:
+        list[str]: the codes of the languages whose documents are kept in
+        memory for editing, least recently edited first
+    """
+    with _edits_lock:
+        return list(_edited_files)
+
+
+def clear_edited_files() -> None:
+    """
+    Write pending edits and drop every document kept in memory for editing.
+    """
+    with _edits_lock:
+        flush_writes()
+        _edited_files.clear()
+
+
+@validate_call
+def update_many(
+    language: Annotated[str, MinLength(1)],
+    values: Annotated[dict[str, object], MinLength(1)],
+    replace_tables: bool = False,
+) -> None:
+    """
+    Set the values of several keys of a language file in one edit. The file
+    is parsed once and kept in memory as a `tomlkit` document, so comments
+    and formatting survive, and edits made within the write delay of each
+    other are written together. Each write goes to a temp file that is then
+    renamed over the language file, so readers never see a partial file.
+    Lookups see the new values right away, without the file being parsed
+    again. Missing tables are created. The edit is all or nothing: if any
+    key path or value is invalid, nothing is set.
+
+    Args:
+        language (str): the code of the language to edit
+        values (dict): dotted key paths and their new values
+        replace_tables (bool, optional): allow replacing a whole table with a
+        value that is not a table. Defaults to False.
+
+    Raises:
+        PathAccessError: if the language is not listed in config.toml
+        FileNotFoundError: if the language file does not exist
+        ValueError: if a key path is empty or has a wildcard
+        TypeError: if a key path goes through a value that is not a table, if
+        it is a table and `replace_tables` is False, or if a value cannot be
+        written as TOML
+    """
+    import tomlkit
+
+    with _edits_lock:
+        edited_file = _get_edited_file(language)
+        # check every key path and convert every value first, so that a bad
+        # one leaves the document untouched
+        _check_key_paths(edited_file.document, values, replace_tables)
+        items = {key_path: tomlkit.item(value) for key_path, value in values.items()}
+        for key_path, item in items.items():
+            table = _get_parent_table(edited_file.document, key_path, create=True)
+            table[key_path.rsplit(".", 1)[-1]] = item  # type: ignore
+        edited_file.dirty = True
+        _sync_catalog(language, edited_file, values)
+
+        if _write_delay <= 0:
+            _flush_language(language)
+        elif edited_file.timer is None:
+            edited_file.timer = threading.Timer(
+                _write_delay, _flush_in_background, args=(language,)
+            )
+            edited_file.timer.daemon = True
+            edited_file.timer.start()
+    logger.info("Set %d keys of '%s'", len(values), language)
+
+
+@validate_call
+def set_i18n_value(
+    language: Annotated[str, MinLength(1)],
+    key_path: Annotated[str, MinLength(1)],
+    value: object,
+    replace_tables: bool = False,
+) -> None:
+    """
+    Set the value of a single key of a language file. See `update_many()`.
+
+    Args:
+        language (str): the code of the language to edit
+        key_path (str): the path to the key, such as `start.welcome`
+        value (object): the new value of the key
+        replace_tables (bool, optional): allow replacing a whole table with a
+        value that is not a table. Defaults to False.
+
+    Raises:
+        PathAccessError: if the language is not listed in config.toml
+        FileNotFoundError: if the language file does not exist
+        ValueError: if the key path has a wildcard
+        TypeError: if the key path goes through a value that is not a table,
+        if it is a table and `replace_tables` is False, or if the value cannot
+        be written as TOML
+    """
+    update_many.raw_function(language, {key_path: value}, replace_tables)
+
+
+# edits still waiting for their delay are written when the interpreter exits
+atexit.register(flush_writes)